@@ -0,0 +1,166 @@
+"""
+Startup and rerun benchmarks for Green Leap.
+
+Every scenario opens one sidebar section headlessly with Streamlit's
+``AppTest``, applies its widget state once, and then times full script
+reruns against a seeded synthetic catalog of the requested size. Results
+are printed (or written) as JSON so runs can be diffed for regressions.
+
+    python benchmarks/bench_sections.py --sizes 150,10000 --repeat 5
+    python benchmarks/bench_sections.py --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "green_leap_app.py")
+DEFAULT_SIZES = [150, 1_000, 10_000, 100_000, 1_000_000]
+
+
+# -----------------------------
+# 场景：每个场景 = 一个 section + 一次性的组件设置
+# -----------------------------
+def _find_jobs_city(at):
+    at.selectbox[0].set_value("Tokyo")
+
+
+def _find_jobs_fuzzy(at):
+    at.text_input[0].set_value("energy")
+
+
+def _smart_summary_skill(at):
+    at.selectbox[1].set_value("Python")
+
+
+def _match_skills(at):
+    at.multiselect[0].set_value(["Data Analysis", "Project Management", "Leadership"])
+
+
+SCENARIOS = [
+    {"name": "card_render", "section": "Find Green Jobs", "setup": None},
+    {"name": "city_filter", "section": "Find Green Jobs", "setup": _find_jobs_city},
+    {"name": "fuzzy_search", "section": "Find Green Jobs", "setup": _find_jobs_fuzzy},
+    {"name": "smart_summary", "section": "Smart Summary", "setup": None},
+    {"name": "smart_summary_skill", "section": "Smart Summary", "setup": _smart_summary_skill},
+    {"name": "skill_match", "section": "Match My Skills", "setup": _match_skills},
+]
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3)
+
+
+def time_catalog_build(size, seed):
+    start = time.perf_counter()
+    catalog.build_jobs_df(size, seed)
+    return _ms(time.perf_counter() - start)
+
+
+def run_scenario(scenario, repeat, timeout):
+    """Open the section, apply its setup, then time ``repeat`` reruns."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.session_state["page"] = "main"
+
+    start = time.perf_counter()
+    at.run()
+    at.sidebar.radio[0].set_value(scenario["section"]).run()
+    if scenario["setup"]:
+        scenario["setup"](at)
+        at.run()
+    first = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        runs.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    return {
+        "first_ms": _ms(first),
+        "runs_ms": [_ms(r) for r in runs],
+        "min_ms": _ms(min(runs)),
+        "median_ms": _ms(statistics.median(runs)),
+    }
+
+
+def run_benchmarks(sizes, repeat=3, seed=42, timeout=600, scenarios=None):
+    wanted = set(scenarios) if scenarios else None
+    results = []
+    for size in sizes:
+        os.environ[catalog.ROWS_ENV] = str(size)
+        os.environ[catalog.SEED_ENV] = str(seed)
+        results.append({
+            "size": size,
+            "scenario": "catalog_build",
+            "section": None,
+            "median_ms": time_catalog_build(size, seed),
+        })
+        for scenario in SCENARIOS:
+            if wanted and scenario["name"] not in wanted:
+                continue
+            entry = {"size": size, "scenario": scenario["name"], "section": scenario["section"]}
+            try:
+                entry.update(run_scenario(scenario, repeat, timeout))
+            except Exception as e:
+                entry["error"] = f"{type(e).__name__}: {e}"
+            results.append(entry)
+            print(f"{size:>9} {scenario['name']:<22} {entry.get('median_ms', entry.get('error'))}", file=sys.stderr)
+    return results
+
+
+def environment_info():
+    import pandas as pd
+    import streamlit as st
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "streamlit": st.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="comma-separated catalog sizes (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed reruns per scenario")
+    parser.add_argument("--seed", type=int, default=42, help="catalog generator seed")
+    parser.add_argument("--timeout", type=float, default=600, help="AppTest timeout per run, in seconds")
+    parser.add_argument("--scenario", action="append", help="only run the named scenario (repeatable)")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s.replace("_", "")) for s in args.sizes.split(",") if s.strip()]
+    report = {
+        "meta": dict(environment_info(), seed=args.seed, repeat=args.repeat),
+        "results": run_benchmarks(sizes, args.repeat, args.seed, args.timeout, args.scenario),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
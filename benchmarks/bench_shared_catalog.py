@@ -0,0 +1,78 @@
+"""
+Per-worker memory with private vs shared (memory-mapped) catalogs.
+
+Starts N worker processes that each load the catalog and run a few queries,
+then reports every worker's RSS and PSS (proportional set size, which splits
+shared pages between the processes mapping them) while all of them are alive.
+
+    python benchmarks/bench_shared_catalog.py --rows 200000 --workers 1,2,4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER = """
+import json, sys
+sys.path.insert(0, {root!r})
+from query_engine import get_engine
+engine = get_engine()
+for spec in ({{"city": "Tokyo"}}, {{"keyword": "energy"}}, {{"skill": "Python", "aggregate": True}}):
+    engine.run(spec)
+engine.summary()
+mem = {{}}
+with open("/proc/self/smaps_rollup") as f:
+    for line in f:
+        key, _, value = line.partition(":")
+        if key in ("Rss", "Pss"):
+            mem[key.lower() + "_mb"] = round(int(value.split()[0]) / 1024, 1)
+print(json.dumps(mem), flush=True)
+sys.stdin.read()  # 等所有 worker 都测完再退出，共享页才算得准
+"""
+
+
+def run_workers(count, env):
+    procs = [
+        subprocess.Popen([sys.executable, "-c", WORKER.format(root=ROOT)], env=env, text=True,
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        for _ in range(count)
+    ]
+    results = [json.loads(p.stdout.readline()) for p in procs]
+    for p in procs:
+        p.stdin.close()
+        p.wait()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", default="1,2,4")
+    args = parser.parse_args()
+
+    base_env = dict(os.environ, GREEN_LEAP_CATALOG_ROWS=str(args.rows), GREEN_LEAP_CATALOG_SEED=str(args.seed))
+    base_env.pop("GREEN_LEAP_SHARED_CATALOG", None)
+    report = {"rows": args.rows, "runs": []}
+    with tempfile.TemporaryDirectory() as shared:
+        subprocess.run([sys.executable, os.path.join(ROOT, "shared_catalog.py"), shared],
+                       env=base_env, check=True, stdout=subprocess.DEVNULL)
+        for mode, env in (("private", base_env), ("shared", dict(base_env, GREEN_LEAP_SHARED_CATALOG=shared))):
+            for count in (int(n) for n in args.workers.split(",")):
+                workers = run_workers(count, env)
+                report["runs"].append({
+                    "mode": mode,
+                    "workers": count,
+                    "pss_mb_per_worker": round(sum(w["pss_mb"] for w in workers) / count, 1),
+                    "pss_mb_total": round(sum(w["pss_mb"] for w in workers), 1),
+                    "rss_mb_per_worker": round(sum(w["rss_mb"] for w in workers) / count, 1),
+                })
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Process-wide caches shared by every session on a worker.
+
+Each named cache is an LRU with a byte budget and an optional TTL. Values are
+sized once on insert (DataFrames via ``memory_usage(deep=True)``, arrays via
+``nbytes``); when a cache goes over budget the least recently used entries
+are evicted, and a single value larger than the whole budget is simply not
+stored. Hit/miss/eviction counters are exported through ``instrumentation``.
+
+Cached values are shared across sessions: callers must treat them as
+read-only and copy before mutating.
+
+Budgets can be overridden per cache with ``GREEN_LEAP_CACHE_<NAME>_MB``.
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import instrumentation
+
+MB = 1024 * 1024
+
+# 名称 → (默认预算 MB, TTL 秒)
+DEFAULT_BUDGETS = {
+    "search": (32, 600),
+    "aggregates": (32, 600),
+    "cards": (16, 3600),
+    "scores": (64, 1800),
+}
+
+_MISSING = object()
+
+
+def estimate_size(value):
+    """Rough deep size in bytes, good enough for budgeting."""
+    if hasattr(value, "memory_usage"):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class BudgetedCache:
+    """Thread-safe LRU bounded by total estimated bytes, with optional TTL."""
+
+    def __init__(self, name, max_bytes, ttl=None):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (value, size, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = self.rejected = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=None):
+        """Like ``get`` without counting a hit or miss (for speculative lookups)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[2] is not None and entry[2] <= time.monotonic()):
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                self.rejected += 1
+                return value
+            expires_at = time.monotonic() + self.ttl if self.ttl else None
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute, size=None):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.put(key, compute(), size)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejected": self.rejected,
+            }
+
+
+_caches = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(name):
+    """Return the shared cache called ``name``, creating it on first use."""
+    with _registry_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            budget_mb, ttl = DEFAULT_BUDGETS.get(name, (16, 600))
+            budget_mb = float(os.environ.get(f"GREEN_LEAP_CACHE_{name.upper()}_MB", budget_mb))
+            cache = _caches[name] = BudgetedCache(name, int(budget_mb * MB), ttl)
+        return cache
+
+
+def stats():
+    with _registry_lock:
+        caches = list(_caches.values())
+    return {cache.name: cache.stats() for cache in caches}
+
+
+def clear_all():
+    with _registry_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.clear()
+
+
+instrumentation.register_stats_source("cache", stats)
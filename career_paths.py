@@ -0,0 +1,115 @@
+"""
+Role progression graph parsed from the CareerPath column.
+
+A CareerPath value is a chain of roles (``"Apprentice → Sustainability
+Analyst → ESG Manager → Sustainability Director"``). Every distinct role
+becomes an integer node and every consecutive pair a directed edge, weighted
+by how many live postings carry a path with that step.
+
+The graph is small (one node per distinct role name), so all progression
+queries are answered from two precomputed ``n × n`` tables built with one
+breadth-first search per node:
+
+* ``distance[a, b]``: fewest steps from role ``a`` to role ``b`` (-1 if
+  ``b`` cannot be reached), and
+* ``next_step[a, b]``: the role after ``a`` on such a shortest route.
+
+"Where can this role lead" is a row of ``distance``, "how do I get here" a
+column, and a route is a walk along ``next_step``. Among equally short
+routes the more common steps win.
+"""
+import re
+
+import numpy as np
+
+_ARROW = re.compile(r"\s*(?:→|->|=>|>)\s*")
+
+
+def parse_path(value):
+    """Role names of one CareerPath value, in order."""
+    return [" ".join(step.split()) for step in _ARROW.split(str(value)) if step.strip()]
+
+
+class CareerGraph:
+    """Directed role graph with precomputed distances and next steps."""
+
+    def __init__(self, paths):
+        """``paths`` is an iterable of ``(CareerPath value, postings)``; paths without postings are left out."""
+        self.names, self.position = [], {}
+        weights = {}
+        for value, postings in paths:
+            if postings <= 0:
+                continue
+            steps = [self._node(name) for name in parse_path(value)]
+            for a, b in zip(steps, steps[1:]):
+                if a != b:
+                    weights[a, b] = weights.get((a, b), 0) + int(postings)
+        n = len(self.names)
+        # 邻接表按边权从大到小排，BFS 先走常见的一步
+        self.successors = [[] for _ in range(n)]
+        for (a, b), weight in sorted(weights.items(), key=lambda item: (-item[1], item[0])):
+            self.successors[a].append(b)
+        self.weights = weights
+        self.distance = np.full((n, n), -1, dtype=np.int16)
+        self.next_step = np.full((n, n), -1, dtype=np.int32)
+        for source in range(n):
+            self._search(source)
+
+    def _node(self, name):
+        key = name.casefold()
+        node = self.position.get(key)
+        if node is None:
+            node = self.position[key] = len(self.names)
+            self.names.append(name)
+        return node
+
+    def _search(self, source):
+        """Fill row ``source`` of both tables with one breadth-first search."""
+        distance, next_step = self.distance[source], self.next_step[source]
+        distance[source] = 0
+        frontier = [(b, b) for b in self.successors[source]]
+        steps = 1
+        while frontier:
+            following = []
+            for node, first in frontier:
+                if distance[node] >= 0:
+                    continue
+                distance[node], next_step[node] = steps, first
+                following += [(b, first) for b in self.successors[node] if distance[b] < 0]
+            frontier, steps = following, steps + 1
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def nbytes(self):
+        return self.distance.nbytes + self.next_step.nbytes
+
+    def lookup(self, role):
+        """Node id of ``role`` (case-insensitive), ``None`` if no path mentions it."""
+        return self.position.get(" ".join(str(role).split()).casefold())
+
+    def _listing(self, steps):
+        found = np.flatnonzero(steps > 0)
+        order = np.lexsort(([self.names[i] for i in found], steps[found]))
+        return [{"role": self.names[found[i]], "steps": int(steps[found[i]])} for i in order]
+
+    def leads_to(self, role):
+        """Roles reachable from ``role``, nearest first: ``[{"role", "steps"}]``."""
+        node = self.lookup(role)
+        return [] if node is None else self._listing(self.distance[node])
+
+    def leads_from(self, role):
+        """Roles from which ``role`` can be reached, nearest first: ``[{"role", "steps"}]``."""
+        node = self.lookup(role)
+        return [] if node is None else self._listing(self.distance[:, node])
+
+    def route(self, start, target):
+        """Shortest list of roles from ``start`` to ``target`` (both included), ``None`` if unreachable."""
+        a, b = self.lookup(start), self.lookup(target)
+        if a is None or b is None or self.distance[a, b] < 0:
+            return None
+        route = [a]
+        while route[-1] != b:
+            route.append(int(self.next_step[route[-1], b]))
+        return [self.names[i] for i in route]
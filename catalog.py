@@ -0,0 +1,124 @@
+"""
+Green Leap job catalog: seed vocabularies and the mock posting generator.
+
+Only the sections that actually show postings import this module, so pandas
+is not loaded for the welcome page or the static sections.
+"""
+import os
+import random
+
+import pandas as pd
+
+
+# -----------------------------
+# 🌿 模拟假数据（升级版，带完整岗位详情）
+# -----------------------------
+roles = [
+    "Sustainability Analyst", "Green Data Engineer", "ESG Specialist", "Urban Planner",
+    "Carbon Accountant", "Renewable Energy Technician", "Climate Policy Intern",
+    "Environmental Scientist", "Circular Economy Researcher", "Sustainable Finance Officer"
+]
+
+companies = [
+    "EcoFuture Labs", "Blue Earth Partners", "ReLeaf Consulting", "GreenMind Analytics",
+    "SolarEdge Asia", "NatureWorks", "Future Planet", "CleanCity Labs", "ZeroWaste Hub", "GreenLeap Youth Network"
+]
+
+categories = [
+    "Renewable Energy", "Urban Planning", "Climate Strategy", "Circular Economy",
+    "Green Finance", "Biodiversity", "Sustainable Agriculture", "Smart Mobility"
+]
+
+skills = [
+    "Python", "Data Analysis", "Carbon Accounting", "Sustainability Reporting", 
+    "Machine Learning", "Stakeholder Engagement", "ESG Metrics", "Life Cycle Assessment",
+    "GIS Mapping", "Project Management"
+]
+
+cities = ["Singapore", "Jakarta", "Manila", "Kuala Lumpur", "Bangkok", "Hanoi", "Tokyo", "Seoul"]
+
+apprenticeship_programs = [
+    "Youth Climate Fellowship", "Green Apprenticeship Pathway", "Circular Economy Starter",
+    "Sustainability Data Bootcamp", "Renewable Energy Trainee Program"
+]
+
+career_paths = [
+    "Apprentice → Sustainability Analyst → ESG Manager → Sustainability Director",
+    "Intern → Research Assistant → Project Coordinator → Climate Policy Lead",
+    "Data Assistant → Analyst → Sustainability Strategist → Regional Director"
+]
+
+training_links = [
+    "https://www.coursera.org/learn/sustainability-reporting",
+    "https://www.edx.org/course/sustainable-finance",
+    "https://www.futurelearn.com/courses/climate-change-leadership"
+]
+
+support_programs = [
+    "Youth Green Mentorship", "UN SDG Internship", "Community Climate Lab", 
+    "ASEAN Green Skills Accelerator", "EcoCampus Partnership"
+]
+
+descriptions = [
+    "Assist companies in implementing carbon accounting systems and climate disclosure frameworks.",
+    "Support renewable energy data modeling and energy efficiency tracking projects.",
+    "Collaborate with government and NGOs on urban sustainability planning and green infrastructure.",
+    "Work with teams to design strategies for circular economy transitions and waste reduction.",
+    "Conduct ESG data analytics and support sustainability reporting to international standards."
+]
+
+
+SALARY_RANGES = ["USD 700–1000/month", "USD 1000–1500/month", "USD 1500–2000/month"]
+
+
+# 目录规模 / 随机种子可用环境变量覆盖（基准测试、压测时使用）
+ROWS_ENV = "GREEN_LEAP_CATALOG_ROWS"
+SEED_ENV = "GREEN_LEAP_CATALOG_SEED"
+DEFAULT_ROWS = 150
+
+
+def generate_jobs(n=DEFAULT_ROWS, seed=None):
+    """Generate ``n`` mock postings as a list of dicts.
+
+    The same ``seed`` always yields the same catalog; ``None`` keeps the
+    original behaviour of a fresh random catalog.
+    """
+    rng = random.Random(seed)
+    data = []
+    for _ in range(n):
+        data.append({
+            "Role": rng.choice(roles),
+            "Company": rng.choice(companies),
+            "Category": rng.choice(categories),
+            "City": rng.choice(cities),
+            "KeySkills": ", ".join(rng.sample(skills, 3)),
+            "MatchScore": rng.randint(60, 100),
+            "SalaryRange": rng.choice(SALARY_RANGES),
+            "CareerPath": rng.choice(career_paths),
+            "SupportPrograms": rng.choice(support_programs),
+            "Apprenticeship": rng.choice(apprenticeship_programs),
+            "TrainingLink": rng.choice(training_links),
+            "JobDescription": rng.choice(descriptions)
+        })
+    return data
+
+
+def catalog_settings():
+    """Return ``(rows, seed)`` from the environment, read on every call."""
+    rows = int(os.environ.get(ROWS_ENV, DEFAULT_ROWS))
+    seed = os.environ.get(SEED_ENV)
+    return rows, int(seed) if seed not in (None, "") else None
+
+
+def catalog_key():
+    """Identity of the current catalog; part of every derived cache key."""
+    return catalog_settings()
+
+
+def build_jobs_df(n=DEFAULT_ROWS, seed=None):
+    """Build a fresh jobs DataFrame (uncached).
+
+    ``query_engine.get_store`` encodes it into a ``CatalogIndex`` and drops
+    it, so the raw object columns are not kept next to the encoded ones.
+    """
+    return pd.DataFrame(generate_jobs(n, seed))
@@ -0,0 +1,65 @@
+"""
+Typeahead completions for the keyword box.
+
+Every Role, Company and Category value and every skill is a term, weighted by
+how many live postings carry it. The index is one sorted array of lower-case
+keys (the term itself and each later word start, so ``"ene"`` finds
+``"Renewable Energy Engineer"``) plus the term each key belongs to. A prefix
+selects the key range ``[prefix, prefix + "\\uffff")`` with two binary
+searches and the heaviest distinct terms in that range are the completions.
+
+``QueryEngine.completions`` builds one index per catalog version; answers
+are memoized per prefix, so a repeated keystroke is a dictionary hit.
+"""
+import numpy as np
+
+MAX_MEMO = 4096   # 每个目录版本最多记住这么多个前缀的结果
+
+
+def normalize_prefix(text):
+    return " ".join(str(text).split()).lower()
+
+
+class CompletionIndex:
+    """Sorted-array prefix index over weighted terms."""
+
+    def __init__(self, terms):
+        """``terms`` is an iterable of ``(text, kind, weight)``; terms without weight are left out."""
+        terms = sorted((str(text), kind, int(weight)) for text, kind, weight in terms if weight > 0)
+        self.texts = [text for text, _, _ in terms]
+        self.kinds = [kind for _, kind, _ in terms]
+        self.weights = np.array([weight for _, _, weight in terms], dtype=np.int64)
+        keys, owners = [], []
+        for i, text in enumerate(self.texts):
+            words = normalize_prefix(text).split(" ")
+            for start in range(len(words)):
+                keys.append(" ".join(words[start:]))
+                owners.append(i)
+        order = np.argsort(np.array(keys, dtype=str), kind="stable")
+        self.keys = np.array(keys, dtype=str)[order]
+        self.owners = np.array(owners, dtype=np.int32)[order]
+        self._memo = {}
+
+    def __len__(self):
+        return len(self.texts)
+
+    @property
+    def nbytes(self):
+        return self.keys.nbytes + self.owners.nbytes + self.weights.nbytes
+
+    def complete(self, prefix, k=5):
+        """Top ``k`` terms with a word starting with ``prefix``, most postings first."""
+        prefix = normalize_prefix(prefix)
+        if not prefix or k <= 0:
+            return []
+        found = self._memo.get((prefix, k))
+        if found is None:
+            lo = np.searchsorted(self.keys, prefix, side="left")
+            hi = np.searchsorted(self.keys, prefix + "\uffff", side="left")
+            ids = np.unique(self.owners[lo:hi])
+            top = ids[np.argsort(-self.weights[ids], kind="stable")[:k]]
+            found = [{"text": self.texts[i], "kind": self.kinds[i], "postings": int(self.weights[i])} for i in top]
+            if len(self._memo) >= MAX_MEMO:
+                self._memo.clear()
+            self._memo[(prefix, k)] = found
+        return found
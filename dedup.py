@@ -0,0 +1,307 @@
+"""
+Near-duplicate postings: MinHash signatures with LSH banding.
+
+Feeds (and the generator) repeat the same posting — same role at the same
+company in the same city asking for the same skills — with only salary,
+description or programme fields changed. Such postings are collapsed into
+clusters; each cluster's first row (the oldest posting) represents it.
+
+A posting's identity is the set of words of its Role, Company and City
+(canonical location name) plus its skills. The work is linear in the
+catalog size and mostly done on vocabularies instead of rows:
+
+* ``row_keys`` hashes each row's (Role, Company, City codes, skill set)
+  into one 64-bit key; rows with the same key are exact duplicates and
+  form one group. ``CatalogIndex`` keeps the keys and only rehashes the
+  rows a feed batch touches.
+* MinHash of a union is the element-wise minimum of the parts' MinHashes,
+  so every distinct Role / Company / City value and every skill gets its
+  own ``NUM_PERM`` signature and a group's signature is the minimum over
+  its parts.
+* LSH splits signatures into ``BANDS`` bands; groups sharing a band fall
+  into the same hash bucket and every bucket member is compared with the
+  bucket's first group; groups unlike their leader are compared with the
+  first of the remaining ones, for up to ``LEADER_ROUNDS`` rounds. A group
+  joins the earliest leader whose exact Jaccard similarity (counted from
+  the vocabulary token sets and the skill matrix) is at least
+  ``THRESHOLD``. Clusters are stars around their first group and every
+  member is checked against that centre, so a chain of pairwise similar
+  postings does not snowball into one cluster.
+
+``CatalogStore`` clusters the catalog when it is built and before publishing
+each feed batch. A batch only MinHashes the groups with new keys and matches
+them against the existing centres through per-band sorted arrays; existing
+groups keep their clusters. Compaction rebuilds from scratch. The shared
+catalog snapshots store the published per-row clusters, so mapped workers
+never cluster.
+"""
+import copy
+import re
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from locations import canonical
+
+NUM_PERM = 32
+BANDS = 8          # 8 段 × 4 行：相似度 0.8 的组约 98% 会成为候选
+THRESHOLD = 0.8    # 候选对的精确 Jaccard 相似度至少这么多才算近似重复
+LEADER_ROUNDS = 3  # 每段里和桶首不像的组，最多再换几次桶首比较
+CENTERS_PER_BAND = 4   # 增量时每段最多和几个同桶的已有中心比较
+_WORD = re.compile(r"[0-9a-z]+")
+_EMPTY = np.iinfo(np.uint32).max
+# 身份字段：(列, 词的命名空间, 取词前的清洗)
+FIELDS = (("Role", "role", str), ("Company", "company", str), ("City", "city", canonical))
+
+_rng = np.random.default_rng(20240611)   # 固定种子：签名在进程之间一致
+_HASH_A = _rng.integers(1, 2 ** 63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_HASH_B = _rng.integers(0, 2 ** 63, size=NUM_PERM, dtype=np.uint64)
+_KEY_MIX = _rng.integers(1, 2 ** 63, size=4, dtype=np.uint64) | np.uint64(1)
+_BAND_MIX = _rng.integers(1, 2 ** 63, size=NUM_PERM // BANDS, dtype=np.uint64) | np.uint64(1)
+
+
+def _mix(values, multiplier):
+    """64-bit multiplicative hash of an integer array."""
+    values = values.astype(np.uint64) * multiplier
+    return values ^ (values >> np.uint64(29))
+
+
+def _skill_weights(count):
+    return _mix(np.arange(1, count + 1, dtype=np.uint64), _KEY_MIX[3])
+
+
+def row_keys(index, rows):
+    """Exact-duplicate key (uint64) of ``rows``: Role, Company, City and the skill set."""
+    rows = np.asarray(rows, dtype=np.int64)
+    keys = (_mix(index.codes["Role"][rows], _KEY_MIX[0]) ^ _mix(index.codes["Company"][rows], _KEY_MIX[1])
+            ^ _mix(index.codes["City"][rows], _KEY_MIX[2]))
+    # 技能集合的哈希：所含技能权重之和（uint64 自然溢出），一次处理一个技能列
+    matrix = index.skill_matrix[rows]
+    for s, weight in enumerate(_skill_weights(len(index.skill_vocab))):
+        keys += matrix[:, s] * weight
+    return keys
+
+
+def signatures(token_sets):
+    """MinHash signature (``NUM_PERM`` uint32) of each set of string tokens."""
+    found = np.full((len(token_sets), NUM_PERM), _EMPTY, dtype=np.uint32)
+    for i, tokens in enumerate(token_sets):
+        if tokens:
+            ids = np.fromiter((zlib.crc32(t.encode()) for t in tokens), dtype=np.uint64, count=len(tokens))
+            hashed = (ids[:, None] * _HASH_A + _HASH_B) >> np.uint64(32)
+            found[i] = hashed.min(axis=0)
+    return found
+
+
+def _words(field, value):
+    return {f"{field}:{word}" for word in _WORD.findall(str(value).lower())}
+
+
+def _first_rows(codes):
+    """Positions where each code of a first-appearance-ordered ``pd.factorize`` result first occurs."""
+    first = np.ones(len(codes), dtype=bool)
+    first[1:] = codes[1:] > np.maximum.accumulate(codes)[:-1]
+    return np.flatnonzero(first)
+
+
+class Duplicates:
+    """Near-duplicate clusters of one catalog version.
+
+    Built once with ``build``; ``updated`` derives the next version's
+    clusters from this one (copy-on-write, like ``CatalogIndex.updated``).
+    """
+
+    @classmethod
+    def build(cls, index, keys):
+        """Clusters of every row of ``index`` from its ``row_keys``."""
+        dup = cls.__new__(cls)
+        dup.tokens, dup.value_sigs, dup.skill_sigs = {}, {}, np.zeros((0, NUM_PERM), dtype=np.uint32)
+        dup._extend_vocabularies(index)
+        row_group, group_keys = pd.factorize(keys)
+        dup.row_group = row_group.astype(np.int32)
+        dup.keys = np.asarray(group_keys, dtype=np.uint64)
+        dup.codes = {column: np.zeros(0, dtype=np.int32) for column, _, _ in FIELDS}
+        dup.skills = np.zeros((0, len(index.skill_vocab)), dtype=bool)
+        dup.lengths, dup.bands = np.zeros(0, dtype=np.int64), np.zeros((0, BANDS), dtype=np.uint64)
+        dup.labels = np.zeros(0, dtype=np.int64)
+        dup._add_groups(index, _first_rows(row_group))
+        dup._cluster(np.arange(len(dup.keys)))
+        centers = np.flatnonzero(dup.labels == np.arange(len(dup.labels)))
+        dup.center_bands = [(np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64))] * BANDS
+        dup._insert_centers(centers)
+        dup._publish(index)
+        return dup
+
+    @classmethod
+    def from_arrays(cls, cluster, representatives, sizes, live_groups):
+        """Read-only clusters from saved arrays (see ``shared_catalog``); they cannot be ``updated``."""
+        dup = cls.__new__(cls)
+        dup.cluster, dup.representatives, dup.sizes, dup.live_groups = cluster, representatives, sizes, int(live_groups)
+        # 聚类过程的中间状态不进快照
+        dup.row_group, dup.skills, dup.bands, dup.labels = (np.zeros(0, dtype=np.int32), np.zeros((0, 0), dtype=bool),
+                                                            np.zeros((0, BANDS), dtype=np.uint64), np.zeros(0, dtype=np.int64))
+        dup.center_bands = []
+        return dup
+
+    def updated(self, index, rows):
+        """Clusters of the successor ``index`` whose ``rows`` were rewritten or appended.
+
+        Rows with a known key join its group. Groups with new keys are
+        matched against the existing cluster centres sharing an LSH band;
+        the rest are clustered among themselves and become new centres.
+        Existing groups never move.
+        """
+        new = copy.copy(self)
+        new._extend_vocabularies(index)
+        new.row_group = np.concatenate([self.row_group, np.full(index.size - len(self.row_group), -1, dtype=np.int32)])
+        rows = np.asarray(rows, dtype=np.int64)
+        keys = index.dedup_keys()[rows]
+        found = pd.Index(self.keys).get_indexer(keys)
+        new.row_group[rows[found >= 0]] = found[found >= 0]
+        fresh = found < 0
+        if fresh.any():
+            codes, fresh_keys = pd.factorize(keys[fresh])
+            new.row_group[rows[fresh]] = len(self.keys) + codes
+            new.keys = np.concatenate([self.keys, np.asarray(fresh_keys, dtype=np.uint64)])
+            groups = np.arange(len(self.keys), len(new.keys))
+            new._add_groups(index, rows[fresh][_first_rows(codes)])
+            new._cluster(new._match_centers(groups))
+            new._insert_centers(groups[new.labels[groups] == groups])
+        new._publish(index)
+        return new
+
+    # -----------------------------
+    # 组（键相同的行）及其 MinHash
+    # -----------------------------
+    def _extend_vocabularies(self, index):
+        """Token sets and signatures for vocabulary values added since the last version."""
+        self.tokens, self.value_sigs = dict(self.tokens), dict(self.value_sigs)
+        for column, name, clean in FIELDS:
+            known = self.tokens.get(column, [])
+            added = [_words(name, clean(v)) for v in index.vocab[column][len(known):]]
+            self.tokens[column] = known + added
+            self.value_sigs[column] = np.concatenate([self.value_sigs.get(column, np.zeros((0, NUM_PERM), dtype=np.uint32)),
+                                                      signatures(added)])
+        added = [{"skill:" + s.lower()} for s in index.skill_vocab[len(self.skill_sigs):]]
+        self.skill_sigs = np.concatenate([self.skill_sigs, signatures(added)])
+
+    def _add_groups(self, index, firsts):
+        """Append the groups whose first rows are ``firsts``: identity, LSH bands, own label."""
+        codes = {column: index.codes[column][firsts] for column, _, _ in FIELDS}
+        skills = index.skill_matrix[firsts]
+        lengths = np.count_nonzero(skills, axis=1).astype(np.int64)
+        sig = np.minimum.reduce([self.value_sigs[column][codes[column]] for column, _, _ in FIELDS])
+        for s, skill_sig in enumerate(self.skill_sigs):
+            np.minimum(sig, skill_sig, out=sig, where=skills[:, s:s + 1])
+        for column, _, _ in FIELDS:
+            lengths += np.array([len(t) for t in self.tokens[column]], dtype=np.int64)[codes[column]]
+            self.codes = {**self.codes, column: np.concatenate([self.codes[column], codes[column]])}
+        known = np.zeros((len(self.skills), skills.shape[1]), dtype=bool)   # 技能词表可能变长
+        known[:, :self.skills.shape[1]] = self.skills
+        self.skills = np.concatenate([known, skills])
+        self.lengths = np.concatenate([self.lengths, lengths])
+        bands = np.bitwise_xor.reduce(sig.reshape(len(sig), BANDS, -1).astype(np.uint64) * _BAND_MIX, axis=2)
+        self.bands = np.concatenate([self.bands, bands])
+        self.labels = np.concatenate([self.labels, np.arange(len(self.labels), len(self.labels) + len(firsts))])
+
+    def _similar(self, groups, others):
+        """Whether the exact Jaccard similarity of ``groups[i]`` and ``others[i]`` reaches ``THRESHOLD``."""
+        shared = np.count_nonzero(self.skills[groups] & self.skills[others], axis=1)
+        for column, _, _ in FIELDS:
+            sets, a, b = self.tokens[column], self.codes[column][groups], self.codes[column][others]
+            # 每个不同的 (a, b) 值对只算一次交集
+            pairs, uniques = pd.factorize(a.astype(np.int64) * len(sets) + b)
+            overlap = np.array([len(sets[p // len(sets)] & sets[p % len(sets)]) for p in uniques.tolist()], dtype=np.int64)
+            shared = shared + overlap[pairs]
+        return shared >= THRESHOLD * (self.lengths[groups] + self.lengths[others] - shared)
+
+    # -----------------------------
+    # 聚类
+    # -----------------------------
+    def _cluster(self, groups):
+        """Star-cluster ``groups`` (ascending ids, each still its own label) among themselves."""
+        labels = self.labels
+        # 每个组指向最早的、确实相似的桶首
+        for band in range(BANDS):
+            active = groups
+            for _ in range(LEADER_ROUNDS):
+                if not len(active):
+                    break
+                bucket, _ = pd.factorize(self.bands[active, band])
+                leader = active[_first_rows(bucket)[bucket]]   # 桶里（还没配上的）第一个组
+                candidate, leader = active[leader != active], leader[leader != active]
+                close = self._similar(candidate, leader)
+                labels[candidate[close]] = np.minimum(labels[candidate[close]], leader[close])
+                active = candidate[~close]   # 和桶首不像的，下一轮在剩下的组里再找桶首
+        # 簇是围绕中心的星形：指向的组自己还指向别人时，改指那个中心（确实相似才行），否则自成一簇
+        while True:
+            parent = labels[labels[groups]]
+            pending = groups[parent != labels[groups]]
+            if not len(pending):
+                break
+            parent = labels[labels[pending]]
+            labels[pending] = np.where(self._similar(pending, parent), parent, pending)
+
+    def _match_centers(self, groups):
+        """Point each of ``groups`` at the earliest similar existing centre sharing a band; return the rest."""
+        found, candidates = [], []
+        for band, (values, centers) in enumerate(self.center_bands):
+            wanted = self.bands[groups, band]
+            lo = np.searchsorted(values, wanted, side="left")
+            count = np.minimum(np.searchsorted(values, wanted, side="right") - lo, CENTERS_PER_BAND)
+            owner = np.repeat(np.arange(len(groups)), count)
+            offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+            found.append(owner)
+            candidates.append(centers[lo[owner] + offset])
+        owner, candidates = np.concatenate(found), np.concatenate(candidates)
+        close = self._similar(groups[owner], candidates)
+        best = np.full(len(groups), len(self.labels), dtype=np.int64)
+        np.minimum.at(best, owner[close], candidates[close])
+        matched = best < len(self.labels)
+        self.labels[groups[matched]] = best[matched]
+        return groups[~matched]
+
+    def _insert_centers(self, centers):
+        """Add ``centers`` to the per-band sorted ``(band value, centre)`` arrays."""
+        updated = []
+        for band, (values, ids) in enumerate(self.center_bands):
+            wanted = self.bands[centers, band]
+            order = np.lexsort((centers, wanted))
+            position = np.searchsorted(values, wanted[order], side="right")   # 同值的中心按编号排
+            updated.append((np.insert(values, position, wanted[order]), np.insert(ids, position, centers[order])))
+        self.center_bands = updated
+
+    def _publish(self, index):
+        """Per-row cluster ids, cluster sizes and representatives (first live row) for ``index``."""
+        group_cluster, roots = pd.factorize(self.labels)
+        live = np.flatnonzero(index.alive)
+        self.cluster = np.full(index.size, -1, dtype=np.int32)
+        self.cluster[live] = group_cluster[self.row_group[live]]
+        self.sizes = np.bincount(self.cluster[live], minlength=len(roots))
+        first = np.full(len(roots), index.size, dtype=np.int64)
+        np.minimum.at(first, self.cluster[live], live)
+        self.representatives = np.where(first < index.size, first, -1)   # 没有在架岗位的簇为 -1
+        self.live_groups = int(np.count_nonzero(np.bincount(self.row_group[live], minlength=len(self.keys))))
+
+    def __len__(self):
+        """Number of clusters with live postings."""
+        return int(np.count_nonzero(self.sizes))
+
+    @property
+    def nbytes(self):
+        return (self.cluster.nbytes + self.row_group.nbytes + self.representatives.nbytes + self.sizes.nbytes
+                + self.skills.nbytes + self.bands.nbytes + self.labels.nbytes
+                + sum(values.nbytes + ids.nbytes for values, ids in self.center_bands))
+
+    def collapse(self, rows):
+        """``rows`` with only the first row of each cluster, order kept."""
+        clusters = self.cluster[rows]
+        first = np.full(len(self.sizes), len(rows), dtype=np.int64)
+        np.minimum.at(first, clusters, np.arange(len(rows)))
+        return rows[first[clusters] == np.arange(len(rows))]
+
+    def stats(self):
+        live = int(self.sizes.sum())
+        return {"clusters": len(self), "exact_groups": self.live_groups, "duplicates": live - len(self),
+                "largest_cluster": int(self.sizes.max()) if len(self) else 0}
@@ -0,0 +1,246 @@
+"""
+Streaming file exports (CSV, Excel, PDF) for download buttons and the query API.
+
+Every writer is a generator that yields encoded chunks, so a large export is
+produced a slice of rows at a time instead of as one DataFrame / string copy.
+``query_server.py`` sends the chunks with chunked transfer encoding, so API
+exports are streamed. ``download_data`` turns a chunk generator into the
+deferred ``data`` callable of ``st.download_button``: nothing is generated
+until the user clicks, but Streamlit keeps the whole file in memory to serve
+it, so the UI path is not streamed and the chunks are simply joined.
+
+Excel and PDF are written with the standard library only (a zip of
+SpreadsheetML parts, and a single-font text PDF).
+"""
+import csv
+import html
+import io
+import re
+import textwrap
+import zipfile
+from xml.sax.saxutils import escape
+
+CHUNK_ROWS = 2000
+
+CSV_MIME = "text/csv"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+PDF_MIME = "application/pdf"
+
+
+def download_data(make_chunks):
+    """Deferred ``st.download_button`` data: the bytes of ``make_chunks()``, generated on click."""
+    def generate():
+        return b"".join(make_chunks())   # Streamlit 反正会把整个文件读进内存，直接给 bytes
+    return generate
+
+
+def catalog_chunks(index, rows, fields, chunk_rows=CHUNK_ROWS):
+    """Row lists ``[id, *fields]`` for catalog ``rows``, ``chunk_rows`` at a time."""
+    for start in range(0, len(rows), chunk_rows):
+        part = rows[start:start + chunk_rows]
+        records = index.records(part, fields)
+        yield [[pid, *(r[f] for f in fields)] for pid, r in zip(index.posting_ids(part), records)]
+
+
+def summary_sheets(summary):
+    """Smart Summary aggregates as ``(name, header, row_chunks)`` tables."""
+    overview = [["Total Opportunities", summary["total_jobs"]], ["Average Match Score", summary["avg_score"]],
+                ["Active Cities", summary["active_cities"]]]
+    tables = [("Overview", ["Metric", "Value"], overview)]
+    for name, key, label, value in (("Top Cities", "city_counts", "City", "Jobs"),
+                                    ("Top Categories", "cat_counts", "Category", "Jobs"),
+                                    ("Top Skills", "skill_counts", "Skill", "Jobs"),
+                                    ("Salary Bands", "salary_counts", "Salary Range", "Jobs"),
+                                    ("Avg Match by Category", "avg_scores", "Category", "Average Match Score")):
+        series = summary[key]
+        tables.append((name, [label, value], [[k, round(float(v), 2)] for k, v in series.items()]))
+    return [(name, header, [rows]) for name, header, rows in tables]
+
+
+def summary_csv(summary):
+    """All summary tables in one long-format CSV (table, label, value)."""
+    return iter_csv(["Table", "Label", "Value"],
+                    ([[name, *row] for rows in chunks for row in rows] for name, _, chunks in summary_sheets(summary)))
+
+
+# -----------------------------
+# CSV
+# -----------------------------
+def iter_csv(header, row_chunks):
+    """UTF-8 CSV (with BOM so Excel opens it correctly), one chunk per row chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")  # BOM
+    writer.writerow(header)
+    for rows in row_chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+# -----------------------------
+# Excel (.xlsx)
+# -----------------------------
+class _Sink:
+    """Write-only, unseekable file that hands back whatever was written."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data, self.parts = b"".join(self.parts), []
+        return data
+
+
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _cell(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        text = escape(_XML_ILLEGAL.sub("", str(value)))
+        return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+    return f"<c><v>{value}</v></c>"
+
+
+def _xlsx_rows(rows):
+    return "".join("<row>" + "".join(_cell(v) for v in row) + "</row>" for row in rows).encode("utf-8")
+
+
+def _sheet_name(name, used):
+    name = re.sub(r"[\[\]:*?/\\]", " ", name).strip()[:31] or "Sheet"
+    base, n = name, 2
+    while name in used:
+        suffix = f" ({n})"
+        name, n = base[:31 - len(suffix)] + suffix, n + 1
+    used.add(name)
+    return name
+
+
+def iter_xlsx(sheets):
+    """Workbook bytes for ``sheets`` = [(name, header, row_chunks), ...], streamed per row chunk."""
+    sink = _Sink()
+    names, used = [], set()
+    ns = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    rel_ns = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i, (name, header, row_chunks) in enumerate(sheets, 1):
+            names.append(_sheet_name(name, used))
+            with zf.open(f"xl/worksheets/sheet{i}.xml", "w") as f:
+                f.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><worksheet {ns}><sheetData>'.encode())
+                f.write(_xlsx_rows([header]))
+                for rows in row_chunks:
+                    f.write(_xlsx_rows(rows))
+                    yield sink.drain()
+                f.write(b"</sheetData></worksheet>")
+            yield sink.drain()
+
+        sheet_entries = "".join(
+            f'<sheet name="{escape(n, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>' for i, n in enumerate(names, 1)
+        )
+        zf.writestr("xl/workbook.xml", f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    f'<workbook {ns} {rel_ns}><sheets>{sheet_entries}</sheets></workbook>')
+        zf.writestr("xl/_rels/workbook.xml.rels", '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    + "".join(f'<Relationship Id="rId{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+                              f'relationships/worksheet" Target="worksheets/sheet{i}.xml"/>' for i in range(1, len(names) + 1))
+                    + "</Relationships>")
+        zf.writestr("_rels/.rels", '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+                    'officeDocument" Target="xl/workbook.xml"/></Relationships>')
+        zf.writestr("[Content_Types].xml", '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                    '<Default Extension="xml" ContentType="application/xml"/>'
+                    '<Override PartName="/xl/workbook.xml" '
+                    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                    + "".join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="application/'
+                              f'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                              for i in range(1, len(names) + 1))
+                    + "</Types>")
+    yield sink.drain()
+
+
+# -----------------------------
+# PDF（纯文本，标准 Helvetica 字体）
+# -----------------------------
+PAGE_WIDTH, PAGE_HEIGHT, MARGIN = 595, 842, 50
+PDF_STYLES = {"h1": ("F2", 16), "h2": ("F2", 12), "p": ("F1", 10)}
+
+
+def html_to_text(markup):
+    """Plain text from the app's inline HTML snippets (``<br>`` becomes a newline)."""
+    text = re.sub(r"<br\s*/?>", "\n", markup)
+    text = html.unescape(re.sub(r"<[^>]+>", "", text))
+    return "\n".join(" ".join(line.split()) for line in text.splitlines()).strip()
+
+
+def _pdf_text(text):
+    # 标准字体只支持 WinAnsi，emoji 等字符直接丢掉
+    data = text.encode("cp1252", errors="ignore")
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _pdf_pages(blocks):
+    """Lay ``(style, text)`` blocks out into pages of ``(font, size, y, text)`` lines."""
+    pages, lines, y = [], [], PAGE_HEIGHT - MARGIN
+    for style, text in blocks:
+        font, size = PDF_STYLES[style]
+        width = int((PAGE_WIDTH - 2 * MARGIN) / (size * 0.5))
+        wrapped = [w for paragraph in text.split("\n") for w in (textwrap.wrap(paragraph, width) or [""])]
+        y -= size * 0.6
+        for line in wrapped:
+            if y - size < MARGIN:
+                pages.append(lines)
+                lines, y = [], PAGE_HEIGHT - MARGIN
+            y -= size * 1.4
+            lines.append((font, size, y, line))
+    pages.append(lines)
+    return pages
+
+
+def iter_pdf(title, blocks):
+    """A text-only PDF of ``blocks`` = [(style, text), ...], style one of h1 / h2 / p."""
+    offsets, position = {}, 0
+
+    def obj(number, body):
+        nonlocal position
+        data = f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+        offsets[number] = position
+        position += len(data)
+        return data
+
+    header = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    position = len(header)
+    yield header
+    yield obj(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+    yield obj(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    yield obj(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>")
+    yield obj(5, b"<< /Title (" + _pdf_text(title) + b") /Producer (Green Leap) >>")
+
+    kids, number = [], 6
+    for lines in _pdf_pages(blocks):
+        stream = b"".join(
+            b"BT /%s %d Tf 1 0 0 1 %d %.1f Tm (%s) Tj ET\n" % (font.encode(), size, MARGIN, y, _pdf_text(text))
+            for font, size, y, text in lines
+        )
+        yield obj(number, b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        yield obj(number + 1, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+                              b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>" % (PAGE_WIDTH, PAGE_HEIGHT, number))
+        kids.append(number + 1)
+        number += 2
+    yield obj(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids)))
+
+    xref = [b"xref\n0 %d\n" % number, b"0000000000 65535 f \n"]
+    xref += [b"%010d 00000 n \n" % offsets[n] for n in range(1, number)]
+    yield b"".join(xref) + b"trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (number, position)
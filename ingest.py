@@ -0,0 +1,156 @@
+"""
+Async job-feed ingestion into the live catalog.
+
+Postings arrive as one JSON event per line::
+
+    {"op": "upsert", "id": "acme-123", "Role": "Carbon Accountant", "City": "Tokyo", ...}
+    {"op": "upsert", "id": "gen-42", "MatchScore": 91}
+    {"op": "expire", "id": "acme-123"}
+
+An upsert of an unknown id must carry every catalog column; an upsert of a
+known id may carry only the fields that changed. Generated postings have ids
+``gen-<row>``.
+
+The feed stand-in is a directory: producers drop ``*.jsonl`` files into it
+(write under another name, then rename) and ``DirectoryFeed`` picks them up
+in name order. Events are batched by size or ``flush_interval`` and applied
+by ``CatalogStore.apply`` on a worker thread, one catalog version per batch.
+The catalog itself is in memory, so after a restart the whole directory is
+replayed on top of the generated catalog.
+
+Set ``GREEN_LEAP_FEED_DIR`` to ingest in the background of the app (or pass
+``--feed-dir`` to ``query_server.py``). ``python ingest.py <dir> --once``
+replays a directory and prints the store stats.
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+import traceback
+
+FEED_DIR_ENV = "GREEN_LEAP_FEED_DIR"
+BATCH_SIZE = 1000
+FLUSH_INTERVAL = 1.0
+POLL_INTERVAL = 5.0
+END = None  # 放进队列表示数据源结束
+_FLUSH = object()
+
+
+class DirectoryFeed:
+    """Local stand-in for the partner feed: ``*.jsonl`` files in a directory."""
+
+    def __init__(self, path, poll_interval=POLL_INTERVAL):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.seen = set()
+        self.malformed = 0
+
+    def new_files(self):
+        names = sorted(n for n in os.listdir(self.path) if n.endswith(".jsonl") and n not in self.seen)
+        self.seen.update(names)
+        return [os.path.join(self.path, n) for n in names]
+
+    def read_events(self, path):
+        events = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self.malformed += 1
+        return events
+
+    async def produce(self, queue, once=False):
+        """Put every event on ``queue``; with ``once`` stop after one scan and put ``END``."""
+        while True:
+            for path in self.new_files():
+                for event in await asyncio.to_thread(self.read_events, path):
+                    await queue.put(event)
+            if once:
+                await queue.put(END)
+                return
+            await asyncio.sleep(self.poll_interval)
+
+
+async def consume(queue, store, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+    """Apply events from ``queue`` to ``store`` in batches until ``END``.
+
+    A batch is flushed when it reaches ``batch_size`` events or when
+    ``flush_interval`` seconds have passed since its first event.
+    """
+    loop = asyncio.get_running_loop()
+    batch, deadline, done = [], None, False
+    while not done:
+        timeout = None if deadline is None else max(0.0, deadline - loop.time())
+        try:
+            event = await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            event = _FLUSH
+        if event is END:
+            done = True
+        elif event is not _FLUSH:
+            batch.append(event)
+            if deadline is None:
+                deadline = loop.time() + flush_interval
+        if batch and (done or event is _FLUSH or len(batch) >= batch_size):
+            try:
+                await asyncio.to_thread(store.apply, batch)
+            except Exception:
+                # 坏批次不影响当前版本，也不能让导入线程退出
+                traceback.print_exc()
+            batch, deadline = [], None
+
+
+async def ingest_directory(path, store, once=False, poll_interval=POLL_INTERVAL,
+                           batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+    queue = asyncio.Queue(maxsize=batch_size * 4)  # 背压：导入跟不上时暂停读文件
+    feed = DirectoryFeed(path, poll_interval)
+    await asyncio.gather(feed.produce(queue, once), consume(queue, store, batch_size, flush_interval))
+    return feed
+
+
+_started = set()
+_started_lock = threading.Lock()
+
+
+def start_background(path):
+    """Ingest ``path`` into the current catalog on a daemon thread (once per process).
+
+    Does nothing in shared-catalog mode, where the builder process ingests.
+    """
+    if os.environ.get("GREEN_LEAP_SHARED_CATALOG"):
+        return False
+    with _started_lock:
+        if path in _started:
+            return False
+        _started.add(path)
+
+    def run():
+        from query_engine import get_store
+        asyncio.run(ingest_directory(path, get_store()))
+
+    threading.Thread(target=run, name="green-leap-ingest", daemon=True).start()
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a Green Leap job-feed directory")
+    parser.add_argument("feed_dir")
+    parser.add_argument("--once", action="store_true", help="replay once and exit instead of polling")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    from query_engine import get_store
+    store = get_store()
+    start = time.perf_counter()
+    feed = asyncio.run(ingest_directory(args.feed_dir, store, once=args.once, batch_size=args.batch_size))
+    stats = dict(store.stats(), malformed=feed.malformed, seconds=round(time.perf_counter() - start, 3))
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Smart Summary insight engine.
+
+Turns the aggregate counts of a view (``CatalogIndex._contributions``) and the
+catalog-wide totals into structured insights for the Smart Summary section:
+
+* ``trend``      – what the view over-weights compared with the whole
+  market, and what changed since the last catalog refresh (feed ingestion);
+* ``salary``     – the salary-band distribution, ordered by pay;
+* ``skill_pair`` – the positively associated skill pair with the highest lift;
+* ``hotspot``    – the city / category cell with the highest lift.
+
+Every number comes from the count tables (bincounts, the city × category
+crosstab and the skill co-occurrence matrix) with a handful of array
+operations, so nothing scans postings. ``QueryEngine.summary`` caches the
+result together with the rest of the summary.
+"""
+import numpy as np
+
+from salary import parse_salary
+
+MIN_SUPPORT = 3          # 格子 / 技能对至少出现这么多次才报 lift
+MIN_SUPPORT_SHARE = 0.02
+
+
+def _share(counts, total):
+    return counts / total if total else np.zeros(len(counts))
+
+
+def _insight(kind, title, text, **data):
+    return {"kind": kind, "title": title, "text": text, "data": data}
+
+
+def trend(view, market, previous, vocab, skill_vocab):
+    """View vs market share deltas, plus catalog changes since the previous version."""
+    found = []
+    n, n_market = view["count"], market["count"]
+    if n < n_market:
+        cat_delta = (_share(view["Category"], n) - _share(market["Category"], n_market)) * 100
+        skill_delta = (_share(view["skills"], n) - _share(market["skills"], n_market)) * 100
+        cat, skill = int(np.argmax(cat_delta)), int(np.argmax(skill_delta)) if len(skill_delta) else None
+        if cat_delta[cat] > 0:
+            parts = [f"{vocab['Category'][cat]} makes up {view['Category'][cat] / n:.0%} of this view "
+                     f"vs {market['Category'][cat] / n_market:.0%} market-wide ({cat_delta[cat]:+.0f} pts)"]
+            if skill is not None and skill_delta[skill] > 0:
+                parts.append(f"{skill_vocab[skill]} is asked for {skill_delta[skill]:+.0f} pts more often than average")
+            found.append(_insight("trend", "📈 Versus the whole market", "; ".join(parts) + ".",
+                                  category=vocab["Category"][cat], category_delta=round(float(cat_delta[cat]), 1),
+                                  skill=skill_vocab[skill] if skill is not None else None,
+                                  skill_delta=round(float(skill_delta[skill]), 1) if skill is not None else None))
+
+    if previous is not None:
+        change = int(market["count"] - previous["count"])
+        cat_change = market["Category"] - previous["Category"]
+        grew = int(np.argmax(cat_change))
+        text = f"The catalog has {change:+d} live postings since the last refresh"
+        if cat_change[grew] > 0:
+            text += f"; {vocab['Category'][grew]} grew the most ({int(cat_change[grew]):+d})"
+        found.append(_insight("trend", "🔄 Since the last refresh", text + ".", postings=change,
+                              category=vocab["Category"][grew], category_change=int(cat_change[grew])))
+    return found
+
+
+def salary(view, vocab):
+    """Share of postings per salary band, lowest band first."""
+    counts = view["SalaryRange"]
+    present = np.flatnonzero(counts)
+    if not len(present):
+        return []
+    labels = vocab["SalaryRange"]
+    present = present[np.argsort([parse_salary(labels[i])[0] for i in present], kind="stable")]
+    shares = counts[present] / counts[present].sum()
+    median = present[int(np.searchsorted(np.cumsum(shares), 0.5))]
+    top = present[int(np.argmax(shares))]
+    text = (f"{shares.max():.0%} of postings pay {labels[top]}; the median posting sits in {labels[median]}"
+            f" across {len(present)} band{'s' if len(present) > 1 else ''}.")
+    return [_insight("salary", "💰 Salary bands", text, median=labels[median], top=labels[top],
+                     bands={labels[i]: round(float(s), 3) for i, s in zip(present, shares)})]
+
+
+def skill_pair(view, skill_vocab):
+    """The skill pair with the highest lift (observed / expected under independence), if above 1."""
+    pairs, n = view["SkillPairs"], view["count"]
+    if pairs.shape[0] < 2:
+        return []
+    single = np.diag(pairs).astype(np.float64)
+    upper = np.triu(pairs, k=1).astype(np.float64)
+    expected = np.outer(single, single) / max(n, 1)
+    support = upper >= max(MIN_SUPPORT, MIN_SUPPORT_SHARE * n)
+    lift = np.where(support & (expected > 0), upper / np.where(expected > 0, expected, 1), 0)
+    if not lift.any() or lift.max() <= 1:   # 没有正相关的技能对就不出这张卡
+        return []
+    a, b = (int(i) for i in np.unravel_index(int(np.argmax(lift)), lift.shape))
+    together = int(upper[a, b])
+    partner_share = together / single[a]
+    text = (f"{skill_vocab[a]} and {skill_vocab[b]} appear together in {together / n:.0%} of postings "
+            f"({lift[a, b]:.1f}× what chance predicts); {partner_share:.0%} of {skill_vocab[a]} roles also want {skill_vocab[b]}.")
+    return [_insight("skill_pair", "🧩 Skills that travel together", text, skills=[skill_vocab[a], skill_vocab[b]],
+                     together=together, lift=round(float(lift[a, b]), 2), partner_share=round(float(partner_share), 3))]
+
+
+def hotspot(view, vocab):
+    """City / category cell most over-represented relative to its row and column totals."""
+    cells, n = view["CityCategory"].astype(np.float64), view["count"]
+    expected = np.outer(cells.sum(axis=1), cells.sum(axis=0)) / n
+    support = cells >= max(MIN_SUPPORT, MIN_SUPPORT_SHARE * n)
+    lift = np.where(support & (expected > 0), cells / np.where(expected > 0, expected, 1), 0)
+    if not lift.any() or lift.max() <= 1:
+        return []
+    city, cat = (int(i) for i in np.unravel_index(int(np.argmax(lift)), lift.shape))
+    text = (f"{vocab['Category'][cat]} roles are {lift[city, cat]:.1f}× over-represented in {vocab['City'][city]} "
+            f"({int(cells[city, cat])} postings).")
+    return [_insight("hotspot", "📍 City / category hotspot", text, city=vocab["City"][city],
+                     category=vocab["Category"][cat], postings=int(cells[city, cat]), lift=round(float(lift[city, cat]), 2))]
+
+
+def build(view, market, previous, vocab, skill_vocab):
+    """Structured insights and action suggestions for one view (``None`` when empty).
+
+    ``view``, ``market`` and ``previous`` (the totals of the previous catalog
+    version, or ``None``) are count tables of the same shape.
+    """
+    if not view["count"]:
+        return None
+    top = {
+        "city": vocab["City"][int(np.argmax(view["City"]))],
+        "category": vocab["Category"][int(np.argmax(view["Category"]))],
+        "skill": skill_vocab[int(np.argmax(view["skills"]))] if view["skills"].any() else None,
+    }
+    found = (trend(view, market, previous, vocab, skill_vocab) + salary(view, vocab)
+             + skill_pair(view, skill_vocab) + hotspot(view, vocab))
+    return {"top": top, "insights": found, "actions": actions(top, found)}
+
+
+def actions(top, found):
+    """Learning / networking / career suggestions grounded in the insights."""
+    by_kind = {}
+    for item in found:
+        by_kind.setdefault(item["kind"], item)
+    skill, city, category = top["skill"], top["city"], top["category"]
+
+    pair = by_kind.get("skill_pair")
+    if pair and skill in pair["data"]["skills"]:
+        partner = next(s for s in pair["data"]["skills"] if s != skill)
+        learning = (f"Deepen {skill}, the most requested skill here, and pair it with {partner}: "
+                    f"they appear together {pair['data']['lift']:.1f}× more often than chance.")
+    elif skill:
+        learning = f"Deepen {skill}, the most requested skill in this view, and apply it in {category} projects."
+    else:
+        learning = f"Build the core skills behind {category} roles through short certifications."
+
+    spot = by_kind.get("hotspot")
+    if spot:
+        networking = (f"Connect with {spot['data']['category']} teams in {spot['data']['city']}, where the category is "
+                      f"{spot['data']['lift']:.1f}× over-represented ({spot['data']['postings']} postings).")
+    else:
+        networking = f"Join sustainability networks in {city}, the city with the most openings in this view."
+
+    pay = by_kind.get("salary")
+    career = f"Target {category} roles, the largest category in this view"
+    if pay:
+        career += f"; the median posting pays {pay['data']['median']}"
+    career += "."
+    return {"learning": learning, "networking": networking, "career": career}
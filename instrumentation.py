@@ -0,0 +1,227 @@
+"""
+Opt-in hot-path instrumentation for Green Leap reruns.
+
+The app wraps each rerun in ``rerun(section)``; code inside the rerun marks
+hot spots with ``timer("find_jobs.filter")`` or the ``timed`` decorator.
+When instrumentation is off, no record is active on the script thread and
+every timer is a no-op, so production reruns pay only an attribute lookup.
+
+Finished runs (from every session on this worker) are kept in a bounded
+history and can be exported as Prometheus text or JSONL. Peak memory comes
+from ``tracemalloc``, which only traces while an instrumented run is active;
+it is process-wide, so concurrent instrumented sessions share one peak.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+ENV_FLAG = "GREEN_LEAP_INSTRUMENT"
+METRICS_DIR_ENV = "GREEN_LEAP_METRICS_DIR"
+DEFAULT_METRICS_DIR = "metrics"
+HISTORY_SIZE = 500
+
+_local = threading.local()
+_lock = threading.Lock()
+_history = deque(maxlen=HISTORY_SIZE)
+_span_totals = {}      # span name -> [count, total seconds]
+_active_runs = 0
+_runs_finished = 0     # 完成的运行数，也是每条记录的序号
+_exported = {}         # JSONL 路径 -> 已写入的最后一个运行序号
+_stats_sources = {}    # source name -> fn() returning {label: {metric: value}}
+
+
+# -----------------------------
+# 开关
+# -----------------------------
+def debug_enabled():
+    """True when the env flag is set or the page was opened with ``?debug=1``."""
+    if os.environ.get(ENV_FLAG, "") not in ("", "0"):
+        return True
+    import streamlit as st
+    return st.query_params.get("debug") == "1"
+
+
+def current_record():
+    return getattr(_local, "record", None)
+
+
+# -----------------------------
+# 计时
+# -----------------------------
+@contextmanager
+def rerun(section, enabled=True):
+    """Collect spans and peak memory for one script run of ``section``."""
+    global _active_runs, _runs_finished
+    if not enabled:
+        yield None
+        return
+
+    with _lock:
+        _active_runs += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+    record = {"ts": time.time(), "section": section, "spans": []}
+    _local.record = record
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["total_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        _local.record = None
+        with _lock:
+            record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            _active_runs -= 1
+            if _active_runs == 0:
+                tracemalloc.stop()
+            _runs_finished += 1
+            record["run"] = _runs_finished
+            _history.append(record)
+            for name, ms in record["spans"]:
+                totals = _span_totals.setdefault(name, [0, 0.0])
+                totals[0] += 1
+                totals[1] += ms / 1000
+
+
+@contextmanager
+def timer(name):
+    """Time a block into the active rerun record, if any."""
+    record = current_record()
+    if record is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["spans"].append((name, round((time.perf_counter() - start) * 1000, 3)))
+
+
+def timed(name):
+    """Decorator form of ``timer``."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def register_stats_source(name, fn):
+    """Expose counters from another module (e.g. caches) in exports and the panel.
+
+    ``fn()`` returns ``{label: {metric: number}}``; each metric is exported as
+    ``green_leap_<name>_<metric>{<name>="<label>"}``.
+    """
+    _stats_sources[name] = fn
+
+
+def source_stats():
+    return {name: fn() for name, fn in _stats_sources.items()}
+
+
+# -----------------------------
+# 导出
+# -----------------------------
+def history():
+    with _lock:
+        return list(_history)
+
+
+def to_prometheus():
+    """Render span totals and the latest per-section peaks as Prometheus text."""
+    with _lock:
+        totals = dict(_span_totals)
+        runs = list(_history)
+
+    lines = [
+        "# HELP green_leap_span_seconds Time spent in instrumented spans.",
+        "# TYPE green_leap_span_seconds summary",
+    ]
+    for name, (count, seconds) in sorted(totals.items()):
+        lines.append(f'green_leap_span_seconds_count{{span="{name}"}} {count}')
+        lines.append(f'green_leap_span_seconds_sum{{span="{name}"}} {seconds:.6f}')
+
+    peaks, durations = {}, {}
+    for run in runs:
+        peaks[run["section"]] = run["peak_bytes"]
+        durations[run["section"]] = run["total_ms"] / 1000
+    lines += [
+        "# HELP green_leap_rerun_seconds Duration of the latest instrumented rerun per section.",
+        "# TYPE green_leap_rerun_seconds gauge",
+    ]
+    lines += [f'green_leap_rerun_seconds{{section="{s}"}} {v:.6f}' for s, v in sorted(durations.items())]
+    lines += [
+        "# HELP green_leap_rerun_peak_bytes Peak traced memory of the latest instrumented rerun per section.",
+        "# TYPE green_leap_rerun_peak_bytes gauge",
+    ]
+    lines += [f'green_leap_rerun_peak_bytes{{section="{s}"}} {v}' for s, v in sorted(peaks.items())]
+
+    for source, labels in sorted(source_stats().items()):
+        metrics = sorted({m for values in labels.values() for m in values})
+        for metric in metrics:
+            lines.append(f"# TYPE green_leap_{source}_{metric} gauge")
+            for label, values in sorted(labels.items()):
+                if metric in values:
+                    lines.append(f'green_leap_{source}_{metric}{{{source}="{label}"}} {values[metric]}')
+    return "\n".join(lines) + "\n"
+
+
+def metrics_dir():
+    path = os.environ.get(METRICS_DIR_ENV, DEFAULT_METRICS_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def export_prometheus(path=None):
+    path = path or os.path.join(metrics_dir(), "green_leap.prom")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(to_prometheus())
+    return path
+
+
+def export_jsonl(path=None):
+    """Append the runs finished since the last export to ``path`` and return the path."""
+    path = path or os.path.join(metrics_dir(), "green_leap_runs.jsonl")
+    with _lock:
+        runs = [run for run in _history if run["run"] > _exported.get(path, 0)]
+        if runs:
+            _exported[path] = runs[-1]["run"]
+    with open(path, "a", encoding="utf-8") as f:
+        for run in runs:
+            f.write(json.dumps(run) + "\n")
+    return path
+
+
+# -----------------------------
+# 隐藏调试面板（侧边栏）
+# -----------------------------
+def render_debug_panel():
+    """Show this session's last instrumented rerun in the sidebar."""
+    import streamlit as st
+
+    last = st.session_state.get("_last_rerun_record")
+    with st.sidebar.expander("🛠️ Debug: rerun timings"):
+        if not last:
+            st.caption("No instrumented rerun yet.")
+        else:
+            st.caption(f"Last rerun: **{last['section']}**")
+            col1, col2 = st.columns(2)
+            col1.metric("Total", f"{last['total_ms']:.1f} ms")
+            col2.metric("Peak mem", f"{last['peak_bytes'] / 1024:.0f} KB")
+            st.table([{"span": name, "ms": ms} for name, ms in last["spans"]])
+        for source, labels in source_stats().items():
+            if labels:
+                st.caption(f"**{source}**")
+                st.table([dict(name=label, **values) for label, values in labels.items()])
+        if st.button("Export Prometheus", key="_debug_export_prom"):
+            st.caption(f"Wrote {export_prometheus()}")
+        if st.button("Export JSONL", key="_debug_export_jsonl"):
+            st.caption(f"Wrote {export_jsonl()}")
@@ -0,0 +1,148 @@
+"""
+Normalized location table and spatial lookups for the City column.
+
+Raw City values (``"Kuala Lumpur"``, ``"kuala lumpur, Malaysia"``, ``"KL"``)
+are normalized to one location each, with country, region and coordinates
+from ``LOCATIONS``. Unknown cities from the feed become locations of their
+own without coordinates.
+
+City is dictionary-encoded, so ``LocationIndex`` works on the vocabulary:
+``of_code[city_code]`` is the integer location id, and a location filter
+turns into the set of City codes of the wanted locations followed by one
+lookup per row. "Within N km" queries use the locations sorted by latitude:
+a binary search keeps the latitude band that can be within reach and only
+those candidates get an exact haversine distance.
+"""
+import re
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.2
+UNKNOWN_REGION = "Other"
+
+# city -> (country, region, latitude, longitude)
+LOCATIONS = {
+    "Singapore": ("Singapore", "Southeast Asia", 1.3521, 103.8198),
+    "Jakarta": ("Indonesia", "Southeast Asia", -6.2088, 106.8456),
+    "Manila": ("Philippines", "Southeast Asia", 14.5995, 120.9842),
+    "Kuala Lumpur": ("Malaysia", "Southeast Asia", 3.1390, 101.6869),
+    "Bangkok": ("Thailand", "Southeast Asia", 13.7563, 100.5018),
+    "Hanoi": ("Vietnam", "Southeast Asia", 21.0278, 105.8342),
+    "Ho Chi Minh City": ("Vietnam", "Southeast Asia", 10.8231, 106.6297),
+    "Phnom Penh": ("Cambodia", "Southeast Asia", 11.5564, 104.9282),
+    "Yangon": ("Myanmar", "Southeast Asia", 16.8409, 96.1735),
+    "Tokyo": ("Japan", "East Asia", 35.6762, 139.6503),
+    "Osaka": ("Japan", "East Asia", 34.6937, 135.5023),
+    "Seoul": ("South Korea", "East Asia", 37.5665, 126.9780),
+    "Busan": ("South Korea", "East Asia", 35.1796, 129.0756),
+    "Taipei": ("Taiwan", "East Asia", 25.0330, 121.5654),
+    "Hong Kong": ("Hong Kong", "East Asia", 22.3193, 114.1694),
+    "Shanghai": ("China", "East Asia", 31.2304, 121.4737),
+    "Beijing": ("China", "East Asia", 39.9042, 116.4074),
+    "Shenzhen": ("China", "East Asia", 22.5431, 114.0579),
+    "Mumbai": ("India", "South Asia", 19.0760, 72.8777),
+    "Delhi": ("India", "South Asia", 28.7041, 77.1025),
+    "Bengaluru": ("India", "South Asia", 12.9716, 77.5946),
+    "Dhaka": ("Bangladesh", "South Asia", 23.8103, 90.4125),
+    "Sydney": ("Australia", "Oceania", -33.8688, 151.2093),
+    "Melbourne": ("Australia", "Oceania", -37.8136, 144.9631),
+    "Auckland": ("New Zealand", "Oceania", -36.8485, 174.7633),
+}
+
+ALIASES = {
+    "kl": "Kuala Lumpur",
+    "hcmc": "Ho Chi Minh City",
+    "saigon": "Ho Chi Minh City",
+    "ha noi": "Hanoi",
+    "bangalore": "Bengaluru",
+    "new delhi": "Delhi",
+    "bombay": "Mumbai",
+    "hongkong": "Hong Kong",
+}
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(name):
+    """Lookup key for a raw city value: the part before the first comma, case- and space-folded."""
+    return _SPACES.sub(" ", str(name).split(",")[0]).strip().casefold()
+
+
+_CANONICAL = {normalize(city): city for city in LOCATIONS}
+_CANONICAL.update({alias: city for alias, city in ALIASES.items()})
+
+
+def canonical(name):
+    """Canonical city name for a raw value (the cleaned value itself if unknown)."""
+    key = normalize(name)
+    return _CANONICAL.get(key) or _SPACES.sub(" ", str(name).split(",")[0]).strip()
+
+
+def haversine_km(lat, lon, lats, lons):
+    lat, lon, lats, lons = (np.radians(v) for v in (lat, lon, lats, lons))
+    a = np.sin((lats - lat) / 2) ** 2 + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class LocationIndex:
+    """Locations of one City vocabulary with integer ids and a latitude-sorted index."""
+
+    def __init__(self, city_vocab):
+        self.names, ids, of_code = [], {}, []
+        for value in city_vocab:
+            name = canonical(value)
+            if name not in ids:
+                ids[name] = len(self.names)
+                self.names.append(name)
+            of_code.append(ids[name])
+        self.of_code = np.asarray(of_code, dtype=np.int32)
+        self.by_key = {normalize(name): i for i, name in enumerate(self.names)}
+        known = [LOCATIONS.get(name) for name in self.names]
+        self.country = [k[0] if k else "" for k in known]
+        self.region = [k[1] if k else UNKNOWN_REGION for k in known]
+        self.lat = np.array([k[2] if k else np.nan for k in known])
+        self.lon = np.array([k[3] if k else np.nan for k in known])
+        self._lat_order = np.argsort(self.lat, kind="stable")   # 无坐标的排在最后
+        self._lat_sorted = self.lat[self._lat_order]
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def nbytes(self):
+        return self.of_code.nbytes + self.lat.nbytes + self.lon.nbytes + self._lat_order.nbytes + self._lat_sorted.nbytes
+
+    def lookup(self, name):
+        """Location id of a city name or alias, ``None`` if the catalog has no such location."""
+        return self.by_key.get(normalize(canonical(name)))
+
+    def city_codes(self, location_ids):
+        """City vocabulary codes belonging to ``location_ids``."""
+        wanted = np.zeros(len(self.names), dtype=bool)
+        wanted[np.asarray(list(location_ids), dtype=np.int64)] = True
+        return np.flatnonzero(wanted[self.of_code])
+
+    def counts(self, city_counts):
+        """Per-location totals from per-City-code ``city_counts``."""
+        return np.bincount(self.of_code, weights=city_counts, minlength=len(self.names)).astype(np.int64)
+
+    def within(self, location_id, km):
+        """Ids of the located places within ``km`` of ``location_id`` (itself included)."""
+        lat, lon = self.lat[location_id], self.lon[location_id]
+        if np.isnan(lat):
+            return [location_id]
+        band = km / KM_PER_DEGREE
+        lo = np.searchsorted(self._lat_sorted, lat - band, side="left")
+        hi = np.searchsorted(self._lat_sorted, lat + band, side="right")
+        candidates = self._lat_order[lo:hi]
+        close = haversine_km(lat, lon, self.lat[candidates], self.lon[candidates]) <= km
+        return sorted(set(candidates[close].tolist()) | {location_id})
+
+    def in_region(self, region):
+        region = region.casefold()
+        return [i for i, r in enumerate(self.region) if r.casefold() == region]
+
+    def in_country(self, country):
+        country = country.casefold()
+        return [i for i, c in enumerate(self.country) if c.casefold() == country]
@@ -0,0 +1,71 @@
+"""
+Personalized MatchScore.
+
+The catalog's MatchScore column is a fixed number per posting. A profile
+(the skills and proficiency levels picked in Match My Skills) gives every
+posting a personal score instead: the proficiency-weighted share of the
+posting's KeySkills the user covers, 0–100.
+
+Scoring is one pass over the job × skill incidence matrix, restricted to the
+columns the profile touches, so it costs a few milliseconds per 100k
+postings. ``QueryEngine.personal_scores`` caches the result per (profile,
+catalog version); the profile key is its content, so an edited profile is a
+new version and old scores simply age out of the cache.
+"""
+import numpy as np
+
+LEVEL_WEIGHTS = {"Beginner": 0.4, "Intermediate": 0.6, "Advanced": 0.8, "Expert": 1.0}
+RELATED_WEIGHT = 0.5   # 相关技能按一半计分
+
+# Match My Skills 的技能名 -> 目录 KeySkills 里相近的技能
+RELATED_SKILLS = {
+    "ESG Reporting": ["ESG Metrics", "Sustainability Reporting"],
+    "AI & Technology": ["Machine Learning", "Python"],
+    "Sustainable Finance": ["ESG Metrics", "Carbon Accounting"],
+    "Circular Economy": ["Life Cycle Assessment"],
+    "Environmental Awareness": ["Life Cycle Assessment"],
+    "Climate Literacy": ["Carbon Accounting", "Sustainability Reporting"],
+    "Research": ["Data Analysis", "Life Cycle Assessment"],
+    "Communication": ["Stakeholder Engagement"],
+    "Community Engagement": ["Stakeholder Engagement"],
+    "Public Speaking": ["Stakeholder Engagement"],
+    "Leadership": ["Project Management", "Stakeholder Engagement"],
+    "Engineering": ["GIS Mapping", "Python"],
+    "Renewable Energy": ["Life Cycle Assessment", "Carbon Accounting"],
+}
+
+
+def profile_key(profile):
+    """Hashable version of a ``{skill: level}`` profile (``None`` for an empty profile)."""
+    if not profile:
+        return None
+    return tuple(sorted((str(skill), str(level)) for skill, level in profile.items()))
+
+
+def skill_weights(skill_vocab, profile):
+    """Weight per catalog skill: the proficiency weight of the skill or, at half weight, a related one."""
+    position = {s.lower(): i for i, s in enumerate(skill_vocab)}
+    weights = np.zeros(len(skill_vocab), dtype=np.float32)
+    for skill, level in profile.items():
+        if level not in LEVEL_WEIGHTS:
+            raise ValueError(f"unknown proficiency {level!r}; choose one of {', '.join(LEVEL_WEIGHTS)}")
+        weight = LEVEL_WEIGHTS[level]
+        direct = position.get(str(skill).lower())
+        if direct is not None:
+            weights[direct] = max(weights[direct], weight)
+        for related in RELATED_SKILLS.get(skill, ()):
+            i = position.get(related.lower())
+            if i is not None:
+                weights[i] = max(weights[i], weight * RELATED_WEIGHT)
+    return weights
+
+
+def score(index, profile):
+    """Personal score (int16, 0–100) of every row of ``index`` for ``profile``."""
+    weights = skill_weights(index.skill_vocab, profile)
+    used = np.flatnonzero(weights)
+    if not len(used):
+        return np.zeros(index.size, dtype=np.int16)
+    covered = index.skill_matrix[:, used].astype(np.float32) @ weights[used]
+    required = np.maximum(index.skills_per_row(), 1)
+    return np.rint(100 * np.minimum(covered / required, 1)).astype(np.int16)
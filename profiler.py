@@ -0,0 +1,173 @@
+"""
+Admin-only sampling profiler for a single section run.
+
+A background thread samples the script thread's Python stack every few
+milliseconds while the selected section renders. Samples are written both as
+collapsed stacks (``flamegraph.pl`` / ``inferno``) and as a speedscope JSON
+file, named after the section and the live catalog size so runs on a live
+replica can be compared without redeploying. A section that has not built
+the catalog is labelled ``nocatalog`` rather than built just for the label.
+
+The toggle only appears when ``GREEN_LEAP_ADMIN_TOKEN`` is set on the server
+and the page is opened with a matching ``?admin=<token>``.
+"""
+import hmac
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+ADMIN_TOKEN_ENV = "GREEN_LEAP_ADMIN_TOKEN"
+PROFILE_DIR_ENV = "GREEN_LEAP_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = "profiles"
+SAMPLE_INTERVAL = 0.002
+
+
+def admin_enabled():
+    token = os.environ.get(ADMIN_TOKEN_ENV, "")
+    if not token:
+        return False
+    import streamlit as st
+    return hmac.compare_digest(st.query_params.get("admin", ""), token)
+
+
+class StackSampler:
+    """Sample one thread's stack from a daemon thread until ``stop()``."""
+
+    def __init__(self, thread_id, stop_frame=None, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.stop_frame = stop_frame
+        self.interval = interval
+        self.samples = Counter()
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="green-leap-sampler", daemon=True)
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame is not self.stop_frame:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    # -----------------------------
+    # 输出格式
+    # -----------------------------
+    def collapsed(self):
+        """Return ``root;...;leaf count`` lines."""
+        lines = []
+        for stack, count in self.samples.most_common():
+            names = [f"{name} ({os.path.basename(path)}:{line})" for name, path, line in stack]
+            lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name):
+        """Return a speedscope ``sampled`` profile document."""
+        frames, index = [], {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            ids = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                ids.append(index[frame])
+            samples.append(ids)
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": name,
+            "exporter": "green-leap-profiler",
+        }
+
+
+def profile_dir():
+    path = os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def write_profile(sampler, section, rows):
+    """Write collapsed + speedscope files and return their paths; ``rows`` is ``None`` without a catalog."""
+    slug = re.sub(r"[^a-z0-9]+", "_", section.lower()).strip("_")
+    size = "nocatalog" if rows is None else f"{rows}rows"
+    stem = os.path.join(profile_dir(), f"{slug}_{size}_{time.strftime('%Y%m%d-%H%M%S')}")
+    with open(stem + ".collapsed", "w", encoding="utf-8") as f:
+        f.write(sampler.collapsed())
+    with open(stem + ".speedscope.json", "w", encoding="utf-8") as f:
+        label = section if rows is None else f"{section} ({rows} rows)"
+        json.dump(sampler.speedscope(label), f)
+    return [stem + ".collapsed", stem + ".speedscope.json"]
+
+
+def _live_rows():
+    """Live rows of the catalog if a section already built it, else ``None``.
+
+    Static sections never import ``query_engine``; profiling them must not
+    build the catalog just to label the file.
+    """
+    query_engine = sys.modules.get("query_engine")
+    store = query_engine.peek_store() if query_engine else None
+    return None if store is None else int(store.engine.index.alive.sum())
+
+
+@contextmanager
+def profile(section, enabled=True, on_done=None):
+    """Sample the enclosed block and write one profile tagged by section and live catalog size.
+
+    ``on_done`` receives the written paths, even if the block raised.
+    """
+    if not enabled:
+        yield None
+        return
+
+    # 只保留 with 语句以下的栈帧（去掉 Streamlit 运行时本身）
+    caller = sys._getframe(2)
+    sampler = StackSampler(threading.get_ident(), stop_frame=caller).start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        paths = write_profile(sampler, section, _live_rows())
+        if on_done:
+            on_done(paths)
+
+
+def render_profiler_toggle():
+    """Sidebar button for admins; returns True when this run should be profiled."""
+    import streamlit as st
+
+    with st.sidebar.expander("🔬 Admin: profile section"):
+        clicked = st.button("Profile this run", key="_admin_profile_run")
+        last = st.session_state.get("_last_profile_paths")
+        if last:
+            st.caption("Last profile:\n\n" + "\n\n".join(f"`{p}`" for p in last))
+    return clicked
@@ -0,0 +1,1294 @@
+"""
+Catalog query engine: filter, search, sort, paginate and aggregate postings.
+
+The Find Green Jobs and Smart Summary sections and the headless HTTP API in
+``query_server.py`` all go through this module; nothing here imports
+Streamlit. An engine is built once per catalog version and shared by every
+session through ``get_store()``:
+
+* Every text column is dictionary-encoded (``pd.Categorical``), so a text
+  filter is resolved once against the small vocabulary and then applied to
+  the whole catalog as an ``np.isin`` over codes, and result records are
+  assembled from codes without going through DataFrame row indexing.
+* KeySkills becomes a job × skill boolean incidence matrix.
+* City values map to normalized locations (``locations.py``); location
+  filters (city, country, region, within N km) resolve to a set of City
+  codes and are applied as one table lookup per row.
+* SalaryRange labels are parsed once per distinct value into monthly
+  min / max / currency (``salary.py``); salary range filters are binary
+  searches on a sorted per-row index built on first use.
+* Fuzzy keyword search scores each *distinct* value once with difflib and
+  weights it by how often it occurs, which gives the same matches as running
+  ``difflib.get_close_matches`` over the full column.
+* Search-as-you-type reuses work between keystrokes: the rows passing the
+  filters and their per-value counts are cached per normalized filter set,
+  and a keyword extending a cached prefix narrows from the prefix's result
+  when it matches a subset of the prefix's values.
+* Sorting uses one presorted row permutation per sort field, built once per
+  catalog version: a sorted result is the permutation filtered by
+  membership (or, for a small result, its rows ordered by their position in
+  the permutation) instead of a value sort on every rerun.
+* Near-duplicate postings are clustered with MinHash / LSH (``dedup.py``)
+  when the catalog is built and incrementally for every feed batch;
+  ``collapse_duplicates`` keeps one posting per cluster.
+
+Query results and aggregates are cached in the ``search`` / ``aggregates``
+caches keyed by catalog version and query, so repeated queries are dictionary
+hits. ``ingest.py`` feeds new, changed and expired postings into the store,
+which updates the index and catalog totals incrementally and publishes each
+batch as a new version.
+"""
+import copy
+import difflib
+import math
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import insights
+import personalization
+import recommender
+import shared_catalog
+from caching import get_cache
+from career_paths import CareerGraph
+from catalog import build_jobs_df, catalog_key
+from completions import CompletionIndex, normalize_prefix
+from dedup import Duplicates, row_keys
+from instrumentation import register_stats_source, timed, timer
+from locations import LocationIndex, canonical, normalize
+from salary import DEFAULT_CURRENCY, parse_salary
+from skill_associations import SkillAssociations
+
+CODED_COLUMNS = ("Role", "Company", "Category", "City")
+KEYWORD_COLUMNS = ("Role", "Category", "Company")
+FILTER_FIELDS = {"category": "Category", "company": "Company", "role": "Role"}
+SORTABLE_FIELDS = ("MatchScore", "Salary", "Newest", "Role", "Company", "Category", "City")
+SORT_SCAN_RATIO = 16   # 结果行数 × 这个数 ≥ 目录行数时，直接沿排列扫一遍
+DEFAULT_PER_PAGE = 10
+MAX_PER_PAGE = 500
+FUZZY_N = 10
+QUERY_KEYS = {"city", "country", "region", "within_km", "keyword", "skill", "category", "company", "role",
+              "min_salary", "max_salary", "sort", "descending", "page", "per_page", "fields", "aggregate", "profile",
+              "dedupe"}
+FUZZY_CUTOFF = 0.3
+PAIR_CHUNK_ROWS = 65536
+RECOVERY_KM = 1500
+SPELLING_CUTOFF = 0.75
+POPULAR_ROWS = 10
+TRUE_STRINGS = ("1", "true", "yes")
+FALSE_STRINGS = ("0", "false", "no")
+
+
+def split_skills(value):
+    return [s.strip() for s in value.split(",") if s.strip()]
+
+
+def is_all(value):
+    return value is None or value == "" or value == "All"
+
+
+def parse_flag(name, value, default=False):
+    """Boolean query value: a bool, one of ``TRUE_STRINGS`` / ``FALSE_STRINGS``, or ``None`` for ``default``."""
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in TRUE_STRINGS + FALSE_STRINGS:
+        return value.strip().lower() in TRUE_STRINGS
+    raise ValueError(f"{name} must be true or false, got {value!r}")
+
+
+def normalize_query(value):
+    """Cache-key form of a text query: whitespace-collapsed and case-folded, ``None`` for no filter."""
+    if is_all(value):
+        return None
+    return " ".join(str(value).split()).casefold() or None
+
+
+@timed("find_jobs.fuzzy_match")
+def close_matches(query, values, counts, n=FUZZY_N, cutoff=FUZZY_CUTOFF):
+    """``difflib.get_close_matches`` over a multiset of distinct ``values``.
+
+    ``counts[i]`` is how many times ``values[i]`` occurs. Returns the set of
+    values that ``get_close_matches(query, expanded_list, n, cutoff)`` would
+    have returned, scoring each distinct value only once.
+    """
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(query)
+    scored = []
+    for value, count in zip(values, counts):
+        if not count:
+            continue
+        matcher.set_seq1(value)
+        if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+            score = matcher.ratio()
+            if score >= cutoff:
+                scored.append((score, value, count))
+    # get_close_matches keeps the n largest (score, value) pairs of the expanded list
+    scored.sort(reverse=True)
+    matched, taken = set(), 0
+    for _, value, count in scored:
+        if taken >= n:
+            break
+        matched.add(value)
+        taken += count
+    return matched
+
+
+class CatalogIndex:
+    """Columnar, integer-coded view of one catalog version.
+
+    An index is never mutated once published; ``updated`` and ``compacted``
+    return a successor built from copies.
+    """
+
+    def __init__(self, df, key):
+        self._df = None   # 原始 DataFrame 不留：需要时由 df 从编码列重建
+        self.key = key
+        self.size = len(df)
+        self.columns = list(df.columns)
+        self.ids = None  # None: generated catalog, posting ids are "gen-<row>"
+        self.alive = np.ones(self.size, dtype=bool)
+        self.codes, self.vocab, self.vocab_array, self.numeric = {}, {}, {}, {}
+        for column in self.columns:
+            if pd.api.types.is_numeric_dtype(df[column]):
+                self.numeric[column] = df[column].to_numpy()
+                continue
+            cat = pd.Categorical(df[column].fillna(""))
+            self.codes[column] = cat.codes.astype(np.int32)
+            self.vocab[column] = list(cat.categories)
+            self.vocab_array[column] = np.asarray(cat.categories, dtype=object)
+        self.lower_vocab = {column: [v.lower() for v in self.vocab[column]] for column in CODED_COLUMNS}
+        self.match_score = df["MatchScore"].to_numpy(dtype=np.float64)
+
+        skill_lists = [split_skills(s) for s in df["KeySkills"].fillna("")]
+        self.skill_vocab = sorted({s for skills in skill_lists for s in skills})
+        self.skill_matrix = np.zeros((self.size, len(self.skill_vocab)), dtype=bool)
+        self._set_skills(np.arange(self.size), skill_lists)
+        self._ranks, self._derived, self._salary_vocab = {}, {}, None  # 按需算出、随版本丢弃
+        self.embeddings = None  # 相似岗位向量（见 recommender）：建库时算好、随版本增量更新，或从共享快照映射
+        self._dedup_keys = row_keys(self, np.arange(self.size))  # 近似重复检测的逐行键（见 dedup）
+        self._duplicates = None
+        self.totals = self._contributions(np.arange(self.size))
+        self.previous_totals = None  # 上一版本的总计，用来算“自上次刷新以来”的变化
+
+    @classmethod
+    def from_parts(cls, key, columns, codes, vocab, numeric, match_score, skill_vocab, skill_matrix, alive, ids, totals,
+                   previous_totals=None, duplicates=None):
+        """Rebuild an index from saved arrays (see ``shared_catalog``); arrays are used as given."""
+        index = cls.__new__(cls)
+        index._df, index.key, index.columns = None, key, list(columns)
+        index.size = len(alive)
+        index.codes, index.numeric, index.vocab = codes, numeric, vocab
+        index.vocab_array = {column: np.asarray(values, dtype=object) for column, values in vocab.items()}
+        index.lower_vocab = {column: [v.lower() for v in vocab[column]] for column in CODED_COLUMNS}
+        index.match_score = match_score
+        index.skill_vocab, index.skill_matrix = list(skill_vocab), skill_matrix
+        index.alive, index.ids, index.totals, index.previous_totals = alive, ids, totals, previous_totals
+        index._ranks, index._derived, index._salary_vocab, index.embeddings = {}, {}, None, None
+        index._dedup_keys, index._duplicates = None, duplicates   # 快照里存的是聚好的簇，只读的 worker 不需要键
+        return index
+
+    @property
+    def nbytes(self):
+        return (sum(c.nbytes for c in self.codes.values()) + sum(a.nbytes for a in self.numeric.values())
+                + self.match_score.nbytes + self.skill_matrix.nbytes + self.alive.nbytes
+                + (self._dedup_keys.nbytes if self._dedup_keys is not None else 0)
+                + (self.embeddings.nbytes if self.embeddings is not None else 0))
+
+    @property
+    def df(self):
+        """Row-aligned DataFrame, rebuilt lazily from the codes (the source frame is not kept)."""
+        if self._df is None:
+            data = {}
+            for column in self.columns:
+                if column in self.codes:
+                    data[column] = pd.Categorical.from_codes(self.codes[column], categories=self.vocab_array[column])
+                else:
+                    data[column] = self.numeric[column]
+            self._df = pd.DataFrame(data, copy=False)
+        return self._df
+
+    def posting_ids(self, rows):
+        if self.ids is None:
+            return [f"gen-{r}" for r in np.asarray(rows).tolist()]
+        return self.ids[rows].tolist()
+
+    def values(self, rows, field):
+        """Decoded values of ``field`` for ``rows`` as a list."""
+        if field in self.codes:
+            return self.vocab_array[field][self.codes[field][rows]].tolist()
+        return self.numeric[field][rows].tolist()
+
+    def records(self, rows, fields):
+        """Rows as dicts of ``fields``, decoded straight from the column codes."""
+        values = [self.values(rows, field) for field in fields]
+        return [dict(zip(fields, row)) for row in zip(*values)]
+
+    def frame(self, rows, columns=None):
+        """DataFrame of just ``rows`` (and ``columns``), indexed by row position (for rendering a page)."""
+        return pd.DataFrame({column: self.values(rows, column) for column in columns or self.columns},
+                            index=pd.Index(np.asarray(rows, dtype=np.int64)))
+
+    def rank(self, column):
+        """Alphabetical rank of every vocabulary id (vocabularies grow unsorted)."""
+        rank = self._ranks.get(column)
+        if rank is None:
+            rank = np.empty(len(self.vocab[column]), dtype=np.int32)
+            rank[np.argsort(self.vocab_array[column], kind="stable")] = np.arange(len(rank), dtype=np.int32)
+            self._ranks[column] = rank
+        return rank
+
+    # -----------------------------
+    # 预排序（每个排序方式一份行排列）
+    # -----------------------------
+    def sort_key(self, field):
+        """Per-row values that ``field`` sorts on (``nan`` sorts last)."""
+        if field == "MatchScore":
+            return self.match_score
+        if field == "Salary":
+            return self.salary(slice(None), "min")
+        if field == "Newest":
+            return np.arange(self.size, dtype=np.int64)   # 新岗位追加在末尾：行号越大越新
+        return self.rank(field)[self.codes[field]]
+
+    def sort_order(self, field, descending=False):
+        """Every row ordered by ``field`` (ties by row), built once per version.
+
+        Returns ``(order, position)``: the row permutation and each row's
+        place in it, so sorting a subset of rows needs no value comparisons.
+        """
+        name = ("order", field, bool(descending))
+        found = self._derived.get(name)
+        if found is None:
+            values = self.sort_key(field)
+            order = np.argsort(-values if descending else values, kind="stable").astype(np.int32)
+            position = np.empty(self.size, dtype=np.int32)
+            position[order] = np.arange(self.size, dtype=np.int32)
+            found = self._derived[name] = (order, position)
+        return found
+
+    # -----------------------------
+    # 薪资（SalaryRange 解析成数值，排序索引做区间过滤）
+    # -----------------------------
+    def salary_vocab(self):
+        """Monthly ``(min, max, currency)`` arrays with one entry per SalaryRange value."""
+        if self._salary_vocab is None:
+            parsed = [parse_salary(label) for label in self.vocab["SalaryRange"]]
+            self._salary_vocab = (np.array([p[0] for p in parsed], dtype=np.float64),
+                                  np.array([p[1] for p in parsed], dtype=np.float64),
+                                  np.array([p[2] for p in parsed], dtype=object))
+        return self._salary_vocab
+
+    def salary(self, rows, bound="min"):
+        """Monthly salary ``bound`` (``"min"`` / ``"max"``) of ``rows``; ``nan`` if unparsed."""
+        low, high, _ = self.salary_vocab()
+        return (low if bound == "min" else high)[self.codes["SalaryRange"][rows]]
+
+    def salary_sorted(self, bound):
+        """``(values, rows)``: every row's salary ``bound`` ascending, unparsed rows last."""
+        found = self._derived.get("salary_" + bound)
+        if found is None:
+            values = self.salary(slice(None), bound).astype(np.float32)
+            order = np.argsort(values, kind="stable").astype(np.int32)
+            found = self._derived["salary_" + bound] = (values[order], order)
+        return found
+
+    def salary_mask(self, min_salary=None, max_salary=None, currency=DEFAULT_CURRENCY):
+        """Rows whose monthly range lies within ``[min_salary, max_salary]`` in ``currency``.
+
+        Each bound is one binary search on the sorted index plus a scatter of
+        the matching rows.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        if min_salary is not None:
+            values, order = self.salary_sorted("min")
+            start = np.searchsorted(values, np.float32(min_salary), side="left")
+            end = np.searchsorted(values, np.inf, side="right")
+            hit = np.zeros(self.size, dtype=bool)
+            hit[order[start:end]] = True
+            mask &= hit
+        if max_salary is not None:
+            values, order = self.salary_sorted("max")
+            hit = np.zeros(self.size, dtype=bool)
+            hit[order[:np.searchsorted(values, np.float32(max_salary), side="right")]] = True
+            mask &= hit
+        other = np.flatnonzero(self.salary_vocab()[2] != currency)
+        if len(other):
+            mask &= ~np.isin(self.codes["SalaryRange"], other)
+        return mask
+
+    def contains_ids(self, column, text):
+        """Vocabulary ids whose value contains ``text`` (case-insensitive)."""
+        text = text.lower()
+        return np.array([i for i, v in enumerate(self.lower_vocab[column]) if text in v], dtype=np.int32)
+
+    def contains_mask(self, column, text):
+        return np.isin(self.codes[column], self.contains_ids(column, text))
+
+    def skill_ids(self, text):
+        text = text.lower()
+        return [i for i, s in enumerate(self.skill_vocab) if text in s.lower()]
+
+    def skills_per_row(self):
+        """Number of KeySkills of every row."""
+        found = self._derived.get("skills_per_row")
+        if found is None:
+            found = self._derived["skills_per_row"] = self.skill_matrix.sum(axis=1, dtype=np.int32)
+        return found
+
+    def skill_mask(self, skill_ids, rows=None):
+        matrix = self.skill_matrix if rows is None else self.skill_matrix[rows]
+        if not len(skill_ids):
+            return np.zeros(len(matrix), dtype=bool)
+        return matrix[:, skill_ids].any(axis=1)
+
+    # -----------------------------
+    # 近似重复（MinHash + LSH，见 dedup）
+    # -----------------------------
+    def dedup_keys(self):
+        """Exact-duplicate key of every row (kept incrementally by ``updated``)."""
+        if self._dedup_keys is None:
+            self._dedup_keys = row_keys(self, np.arange(self.size))
+        return self._dedup_keys
+
+    def duplicates(self):
+        """Near-duplicate clusters of the live rows (derived from the predecessor's by ``updated``)."""
+        if self._duplicates is None:
+            self._duplicates = Duplicates.build(self, self.dedup_keys())
+        return self._duplicates
+
+    # -----------------------------
+    # 增量更新（写时复制）
+    # -----------------------------
+    def _contributions(self, rows):
+        """Counts that ``rows`` add to the catalog-wide Smart Summary totals.
+
+        Besides the per-value counts this keeps the city × category crosstab
+        and the skill co-occurrence matrix (its diagonal is the skill counts)
+        that ``insights`` reads.
+        """
+        city_codes, cat_codes = self.codes["City"][rows], self.codes["Category"][rows]
+        n_city, n_cat = len(self.vocab["City"]), len(self.vocab["Category"])
+        return {
+            "count": len(rows),
+            "score_sum": float(self.match_score[rows].sum()),
+            "City": np.bincount(city_codes, minlength=n_city),
+            "Category": np.bincount(cat_codes, minlength=n_cat),
+            "CategoryScore": np.bincount(cat_codes, weights=self.match_score[rows], minlength=n_cat),
+            "SalaryRange": np.bincount(self.codes["SalaryRange"][rows], minlength=len(self.vocab["SalaryRange"])),
+            "CityCategory": np.bincount(city_codes.astype(np.int64) * n_cat + cat_codes,
+                                        minlength=n_city * n_cat).reshape(n_city, n_cat),
+            "skills": self.skill_matrix[rows].sum(axis=0),
+            "SkillPairs": self._skill_pairs(rows),
+        }
+
+    def _skill_pairs(self, rows):
+        """Skill co-occurrence counts over ``rows`` (``S.T @ S``), a slice of rows at a time."""
+        pairs = np.zeros((len(self.skill_vocab),) * 2, dtype=np.int64)
+        for start in range(0, len(rows), PAIR_CHUNK_ROWS):
+            part = self.skill_matrix[rows[start:start + PAIR_CHUNK_ROWS]].astype(np.float32)
+            pairs += np.rint(part.T @ part).astype(np.int64)
+        return pairs
+
+    def _set_skills(self, rows, skill_lists):
+        position = {s: i for i, s in enumerate(self.skill_vocab)}
+        self.skill_matrix[rows] = False
+        hit_rows = np.repeat(rows, [len(skills) for skills in skill_lists])
+        cols = np.fromiter((position[s] for skills in skill_lists for s in skills), dtype=np.int64, count=len(hit_rows))
+        self.skill_matrix[hit_rows, cols] = True
+
+    def _encode(self, column, values):
+        """Codes for ``values``, growing this (already copied) vocabulary as needed."""
+        lookup = {v: i for i, v in enumerate(self.vocab[column])}
+        added = []
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(lookup)
+                added.append(value)
+            codes[i] = code
+        if added:
+            self.vocab[column] = self.vocab[column] + added
+            self.vocab_array[column] = np.asarray(self.vocab[column], dtype=object)
+            if column in self.lower_vocab:
+                self.lower_vocab[column] = self.lower_vocab[column] + [v.lower() for v in added]
+        return codes
+
+    def updated(self, key, changed, added, added_ids, expired):
+        """Successor index with ``changed`` rows rewritten, ``added`` appended and ``expired`` hidden.
+
+        ``changed`` maps row -> full posting dict, ``added`` is a list of full
+        posting dicts with ids ``added_ids`` and ``expired`` a list of rows.
+        Catalog totals are adjusted by the touched rows only.
+        """
+        new = copy.copy(self)
+        new.key = key
+        new._df = None
+        new._ranks, new._derived, new._salary_vocab = {}, {}, None
+        new.previous_totals = self.totals
+        new.size = self.size + len(added)
+        new.codes, new.vocab, new.numeric = dict(self.codes), dict(self.vocab), dict(self.numeric)
+        new.vocab_array, new.lower_vocab = dict(self.vocab_array), dict(self.lower_vocab)
+
+        changed_rows = np.fromiter(changed, dtype=np.int64, count=len(changed))
+        added_rows = np.arange(self.size, new.size)
+        postings = list(changed.values()) + list(added)
+        touched = np.concatenate([changed_rows, np.asarray(expired, dtype=np.int64)])
+        removed = self._contributions(touched[self.alive[touched]])
+
+        for column in self.columns:
+            values = [p[column] for p in postings]
+            if column in self.numeric:
+                old = self.numeric[column]
+                column_values = np.asarray(values, dtype=old.dtype)
+            else:
+                old = self.codes[column]
+                column_values = new._encode(column, [str(v) for v in values])
+            merged = np.concatenate([old, column_values[len(changed):]])
+            merged[changed_rows] = column_values[:len(changed)]
+            (new.numeric if column in self.numeric else new.codes)[column] = merged
+        new.match_score = new.numeric["MatchScore"].astype(np.float64)
+
+        skill_lists = [split_skills(str(p["KeySkills"])) for p in postings]
+        known = set(self.skill_vocab)
+        fresh = sorted({s for skills in skill_lists for s in skills} - known)
+        new.skill_vocab = self.skill_vocab + fresh
+        new.skill_matrix = np.zeros((new.size, len(new.skill_vocab)), dtype=bool)
+        new.skill_matrix[:self.size, :len(self.skill_vocab)] = self.skill_matrix
+        new._set_skills(np.concatenate([changed_rows, added_rows]), skill_lists)
+
+        base_ids = self.ids if self.ids is not None else np.array([f"gen-{r}" for r in range(self.size)], dtype=object)
+        new.ids = np.concatenate([base_ids, np.array(added_ids, dtype=object)])
+        new.alive = np.concatenate([self.alive, np.ones(len(added), dtype=bool)])
+        new.alive[np.asarray(expired, dtype=np.int64)] = False
+        new.alive[changed_rows] = True
+
+        rewritten = np.concatenate([changed_rows, added_rows])
+        new._dedup_keys = np.concatenate([self.dedup_keys(), np.zeros(len(added), dtype=np.uint64)])
+        new._dedup_keys[rewritten] = row_keys(new, rewritten)
+        if self._duplicates is not None:
+            new._duplicates = self._duplicates.updated(new, rewritten)
+        if self.embeddings is not None:
+            new.embeddings = self.embeddings.updated(new, rewritten)
+
+        gained = new._contributions(rewritten)
+        new.totals = {}
+        for name, value in self.totals.items():
+            if isinstance(value, np.ndarray):
+                shape = gained[name].shape
+                value = _pad(value, shape) - _pad(removed[name], shape)
+            else:
+                value = value - removed[name]
+            new.totals[name] = value + gained[name]
+        return new
+
+    def compacted(self, key):
+        """Successor without expired rows (row positions change)."""
+        keep = np.flatnonzero(self.alive)
+        new = copy.copy(self)
+        new.key = key
+        new._df = None
+        new._ranks, new._derived, new._salary_vocab, new.embeddings = {}, {}, None, None   # 向量重建，顺便刷新 IDF
+        new.size = len(keep)
+        new.codes = {column: codes[keep] for column, codes in self.codes.items()}
+        new.numeric = {column: values[keep] for column, values in self.numeric.items()}
+        new.match_score = self.match_score[keep]
+        new.skill_matrix = self.skill_matrix[keep]
+        new.ids = np.asarray(self.posting_ids(keep), dtype=object)
+        new.alive = np.ones(new.size, dtype=bool)
+        new._dedup_keys, new._duplicates = self.dedup_keys()[keep], None   # 行号变了，聚类重建
+        return new
+
+
+def _present(labels, counts):
+    """``{label: count}`` for the labels with a non-zero count."""
+    return {label: int(count) for label, count in zip(labels, counts) if count > 0}
+
+
+def _pad(values, shape):
+    """Zero-pad a count table to ``shape`` after its vocabularies grew."""
+    values = np.asarray(values)
+    if values.shape == shape:
+        return values
+    return np.pad(values, [(0, target - size) for size, target in zip(values.shape, shape)])
+
+
+class QueryEngine:
+    """Stateless query operations over a ``CatalogIndex``."""
+
+    def __init__(self, index):
+        self.index = index
+
+    @property
+    def nbytes(self):
+        return self.index.nbytes
+
+    @property
+    def df(self):
+        return self.index.df
+
+    # -----------------------------
+    # 过滤 / 搜索
+    # -----------------------------
+    def filter_mask(self, city=None, skill=None, category=None, company=None, role=None, min_salary=None, max_salary=None,
+                    country=None, region=None, within_km=None):
+        """Row mask for the filters; ``None`` / ``""`` / ``"All"`` means no filter.
+
+        Category / company / role / skill are case-insensitive substring
+        filters. City, country and region are exact location matches (see
+        ``location_ids``). ``min_salary`` / ``max_salary`` keep postings that
+        pay at least / at most that much per month (USD).
+        """
+        index = self.index
+        mask = index.alive.copy()
+        allowed = self.location_ids(city, country, region, within_km)
+        if allowed is not None:
+            wanted = np.zeros(len(index.vocab["City"]), dtype=bool)
+            wanted[self.locations().city_codes(allowed)] = True
+            mask &= wanted[index.codes["City"]]
+        for field, value in (("category", category), ("company", company), ("role", role)):
+            if not is_all(value):
+                mask &= index.contains_mask(FILTER_FIELDS[field], value)
+        if not is_all(skill):
+            mask &= index.skill_mask(index.skill_ids(skill))
+        if min_salary is not None or max_salary is not None:
+            mask &= index.salary_mask(min_salary, max_salary)
+        return mask
+
+    def locations(self):
+        """``LocationIndex`` of this catalog version's City vocabulary."""
+        index = self.index
+        return get_cache("aggregates").get_or_compute((index.key, "locations"), lambda: LocationIndex(index.vocab["City"]))
+
+    def location_ids(self, city=None, country=None, region=None, within_km=None):
+        """Location ids allowed by the location filters, ``None`` when none is set.
+
+        ``city`` matches a normalized city name or alias; with ``within_km``
+        every location within that distance of it is allowed too.
+        """
+        locations = self.locations()
+        allowed = None
+        if not is_all(city):
+            found = locations.lookup(city)
+            if found is None:
+                allowed = set()
+            else:
+                allowed = set(locations.within(found, float(within_km)) if within_km else [found])
+        for value, members in ((country, locations.in_country), (region, locations.in_region)):
+            if not is_all(value):
+                ids = set(members(value))
+                allowed = ids if allowed is None else allowed & ids
+        return allowed
+
+    def value_counts(self, rows):
+        """How often every Role / Category / Company value and every skill occurs in ``rows``."""
+        index = self.index
+        counts = {column: np.bincount(index.codes[column][rows], minlength=len(index.vocab[column]))
+                  for column in KEYWORD_COLUMNS}
+        counts["skills"] = index.skill_matrix[rows].sum(axis=0)
+        return counts
+
+    def keyword_matches(self, query, counts):
+        """Vocabulary ids per keyword column (and skill ids) that fuzzy-match the lower-case ``query``."""
+        index = self.index
+        matches = {}
+        for column in KEYWORD_COLUMNS:
+            matched = close_matches(query, index.lower_vocab[column], counts[column])
+            matches[column] = np.array([i for i, v in enumerate(index.lower_vocab[column]) if v in matched], dtype=np.int32)
+        lower_skills = [s.lower() for s in index.skill_vocab]
+        matched = close_matches(query, lower_skills, counts["skills"])
+        matches["skills"] = np.array([i for i, s in enumerate(lower_skills) if s in matched], dtype=np.int32)
+        return matches
+
+    def match_mask(self, matches, rows):
+        """Which of ``rows`` hold one of the ``keyword_matches`` values."""
+        index = self.index
+        # 行多时先整列查表再取一次，比逐列按行号取值更快；行少（前缀收窄后）则只看这些行
+        whole = len(rows) * 4 > index.size
+        hit = np.zeros(index.size if whole else len(rows), dtype=bool)
+        for column in KEYWORD_COLUMNS:
+            wanted = np.zeros(len(index.vocab[column]), dtype=bool)
+            wanted[matches[column]] = True
+            hit |= wanted.take(index.codes[column] if whole else index.codes[column][rows])
+        if whole:
+            for skill in matches["skills"]:
+                hit |= index.skill_matrix[:, skill]
+            return hit.take(rows)
+        return hit | index.skill_mask(matches["skills"], rows)
+
+    def keyword_mask(self, keyword, rows):
+        """Fuzzy match ``keyword`` against Role / Category / Company / skills of ``rows``."""
+        return self.match_mask(self.keyword_matches(keyword.lower(), self.value_counts(rows)), rows)
+
+    @staticmethod
+    def search_filters(city=None, skill=None, category=None, company=None, role=None, min_salary=None, max_salary=None,
+                       country=None, region=None, within_km=None):
+        """Normalized filters, in ``filter_mask`` argument order (the cache key of a search)."""
+        city = None if is_all(city) else normalize(canonical(city))
+        salary = tuple(None if value is None else float(value) for value in (min_salary, max_salary))
+        within_km = float(within_km) if within_km and city else None
+        return (city, *(normalize_query(value) for value in (skill, category, company, role)), *salary,
+                normalize_query(country), normalize_query(region), within_km)
+
+    def candidates(self, filters):
+        """Rows passing ``search_filters`` output ``filters``, shared by every keyword typed under them."""
+        key = (self.index.key, "candidates", filters)
+        return get_cache("search").get_or_compute(key, lambda: np.flatnonzero(self.filter_mask(*filters)))
+
+    def candidate_counts(self, filters):
+        """``value_counts`` of the candidate rows: what the fuzzy matcher weighs values by."""
+        key = (self.index.key, "candidate_counts", filters)
+        return get_cache("search").get_or_compute(key, lambda: self.value_counts(self.candidates(filters)))
+
+    def search(self, city="All", keyword="", skill=None, category=None, company=None, role=None,
+               min_salary=None, max_salary=None, country=None, region=None, within_km=None):
+        """Row positions matching the filters and fuzzy keyword, in catalog order.
+
+        Results are shared across sessions, keyed by catalog version,
+        normalized filters and normalized keyword, so popular searches are a
+        dictionary hit.
+        """
+        filters = self.search_filters(city, skill, category, company, role, min_salary, max_salary,
+                                      country, region, within_km)
+        query = normalize_query(keyword)
+        key = (self.index.key, "search", filters, query)
+        return get_cache("search").get_or_compute(key, lambda: self._search(filters, query))[0]
+
+    def _search(self, filters, query):
+        """``(rows, matches)`` of one search; ``matches`` is ``None`` without a keyword."""
+        with timer("find_jobs.filter"):
+            rows = self.candidates(filters)
+            if query is None:
+                return rows, None
+            matches = self.keyword_matches(query, self.candidate_counts(filters))
+            # 前缀复用：新词匹配到的值是某个已缓存前缀的子集时，结果也是它的子集
+            prefix = self._cached_prefix(filters, query)
+            if prefix is not None and all(np.isin(ids, prefix[1][part]).all() for part, ids in matches.items()):
+                rows = prefix[0]
+            return rows[self.match_mask(matches, rows)], matches
+
+    def _cached_prefix(self, filters, query):
+        """The cached ``(rows, matches)`` of the longest cached prefix of ``query``, if any."""
+        cache = get_cache("search")
+        for end in range(len(query) - 1, 0, -1):
+            found = cache.peek((self.index.key, "search", filters, query[:end]))
+            if found is not None:
+                return found
+        return None
+
+    # -----------------------------
+    # 零结果恢复
+    # -----------------------------
+    def recover(self, city="All", keyword="", skill=None, category=None, company=None, role=None,
+                min_salary=None, max_salary=None, country=None, region=None, within_km=None):
+        """Rows to show when ``search`` finds nothing, and how they were found.
+
+        Tries, in order: the keyword with its spelling corrected against the
+        catalog's words; the search with filters relaxed one at a time (nearby
+        cities, any location, any salary, then the category / company / role /
+        skill filters, then single words of the keyword); and finally
+        ``popular_rows``. Every step is a cached ``search``, so the answer is
+        deterministic and cached like one. Returns ``(rows, note)`` where
+        ``note`` has the ``step`` taken and a ``message`` for the user.
+        """
+        args = {"city": city, "keyword": keyword, "skill": skill, "category": category, "company": company,
+                "role": role, "min_salary": min_salary, "max_salary": max_salary, "country": country,
+                "region": region, "within_km": within_km}
+        key = (self.index.key, "recover", self.search_filters(city, skill, category, company, role, min_salary,
+                                                              max_salary, country, region, within_km),
+               normalize_query(keyword))
+        return get_cache("search").get_or_compute(key, lambda: self._recover(args))
+
+    def _recover(self, args):
+        corrected = self.correct_spelling(args["keyword"])
+        if corrected:
+            rows = self.search(**{**args, "keyword": corrected})
+            if len(rows):
+                return rows, {"step": "spelling", "keyword": corrected, "message": f'Showing results for "{corrected}".'}
+        relaxed, widened = {**args, "keyword": corrected or args["keyword"]}, {}
+        for name, change, phrase in self._relaxations(relaxed):
+            relaxed.update(change)
+            widened[name] = phrase
+            if name == "location":
+                widened.pop("nearby", None)
+            rows = self.search(**relaxed)
+            if len(rows):
+                return rows, {"step": "relaxed", "relaxed": list(widened),
+                              "message": "Widened the search to " + ", ".join(widened.values()) + "."}
+        return self.popular_rows(), {"step": "popular", "message": "Here are popular openings across every category."}
+
+    def _relaxations(self, args):
+        """``(name, change, phrase)`` steps that widen a search, mildest first."""
+        if not is_all(args["city"]) and not args["within_km"]:
+            yield "nearby", {"within_km": RECOVERY_KM}, f"cities within {RECOVERY_KM:,} km of {args['city']}"
+        if not all(is_all(args[name]) for name in ("city", "country", "region")):
+            yield "location", {"city": None, "country": None, "region": None, "within_km": None}, "any location"
+        if args["min_salary"] is not None or args["max_salary"] is not None:
+            yield "salary", {"min_salary": None, "max_salary": None}, "any salary"
+        for name in ("category", "company", "role", "skill"):
+            if not is_all(args[name]):
+                yield name, {name: None}, f"any {name}"
+        words = (normalize_query(args["keyword"]) or "").split(" ")
+        if len(words) > 1:
+            for word in sorted(words, key=len, reverse=True):
+                yield "keyword", {"keyword": word}, f'"{word}"'
+
+    def spelling_vocabulary(self):
+        """Lower-case words of every Role / Company / Category value and skill with live postings."""
+        index = self.index
+        return get_cache("aggregates").get_or_compute(
+            (index.key, "spelling_vocabulary"),
+            lambda: sorted({word for text in self.completions().texts for word in normalize_prefix(text).split(" ")}),
+        )
+
+    def correct_spelling(self, keyword):
+        """``keyword`` with each unknown word replaced by the closest catalog word, ``None`` if nothing changes."""
+        query = normalize_query(keyword)
+        if query is None:
+            return None
+        vocabulary = self.spelling_vocabulary()
+        known = set(vocabulary)
+        words = query.split(" ")
+        fixed = [word if word in known else next(iter(difflib.get_close_matches(word, vocabulary, 1, SPELLING_CUTOFF)), word)
+                 for word in words]
+        return " ".join(fixed) if fixed != words else None
+
+    def popular_rows(self, n=POPULAR_ROWS):
+        """The best-matching live postings taking one category at a time: a fixed, diverse fallback set."""
+        index = self.index
+
+        def compute():
+            live = np.flatnonzero(index.alive)
+            ranked = live[np.lexsort((live, -index.match_score[live]))]
+            cats = index.codes["Category"][ranked]
+            by_cat = np.argsort(cats, kind="stable")
+            starts = np.flatnonzero(np.r_[True, cats[by_cat][1:] != cats[by_cat][:-1]])
+            # 每个类别内的名次，按名次轮流取各类别
+            place = np.empty(len(ranked), dtype=np.int64)
+            place[by_cat] = np.arange(len(ranked)) - np.repeat(starts, np.diff(np.r_[starts, len(ranked)]))
+            return ranked[np.lexsort((np.arange(len(ranked)), place))[:n]]
+
+        return get_cache("aggregates").get_or_compute((index.key, "popular_rows", n), compute)
+
+    # -----------------------------
+    # 排序 / 分页
+    # -----------------------------
+    def sort(self, rows, field=None, descending=True, scores=None):
+        """``rows`` ordered by ``field``; ``scores`` (personal scores) replace MatchScore if given.
+
+        Catalog fields use the presorted permutation of ``CatalogIndex.sort_order``:
+        a large result is the permutation filtered by membership, a small one
+        is ordered by its rows' positions in it. Salary sorts on the monthly
+        minimum, unparsed salaries last; Newest is ingestion order.
+        """
+        if field is None:
+            return rows
+        if field not in SORTABLE_FIELDS:
+            raise ValueError(f"cannot sort by {field!r}; choose one of {', '.join(SORTABLE_FIELDS)}")
+        index = self.index
+        if field == "MatchScore" and scores is not None:
+            # 个人分数随画像变化，没有预排序
+            values = scores[rows]
+            return rows[np.argsort(-values if descending else values, kind="stable")]
+        order, position = index.sort_order(field, descending)
+        if len(rows) * SORT_SCAN_RATIO >= index.size:
+            member = np.zeros(index.size, dtype=bool)
+            member[rows] = True
+            return order[member[order]]
+        return rows[np.argsort(position[rows], kind="stable")]
+
+    def personal_scores(self, profile):
+        """Personalized MatchScore of every row for a ``{skill: level}`` profile, ``None`` without one.
+
+        Cached per (profile, catalog version) in the ``scores`` cache.
+        """
+        key = personalization.profile_key(profile)
+        if key is None:
+            return None
+        return get_cache("scores").get_or_compute(
+            (self.index.key, key), lambda: personalization.score(self.index, dict(key))
+        )
+
+    def collapse_duplicates(self, rows):
+        """``rows`` with one posting per near-duplicate cluster (the first in ``rows`` order)."""
+        return self.index.duplicates().collapse(rows)
+
+    def duplicate_counts(self, rows):
+        """How many of ``rows`` fall into each near-duplicate cluster (indexed by cluster id)."""
+        duplicates = self.index.duplicates()
+        return np.bincount(duplicates.cluster[rows], minlength=len(duplicates))
+
+    @staticmethod
+    def paginate(rows, page=1, per_page=DEFAULT_PER_PAGE):
+        per_page = max(1, min(int(per_page), MAX_PER_PAGE))
+        pages = max(1, math.ceil(len(rows) / per_page))
+        page = max(1, min(int(page), pages))
+        start = (page - 1) * per_page
+        return rows[start:start + per_page], page, pages
+
+    # -----------------------------
+    # 聚合
+    # -----------------------------
+    def _top_counts(self, counts, labels, name, top):
+        series = pd.Series(counts, index=pd.Index(labels, name=name), name="count")
+        return series[series > 0].sort_values(ascending=False, kind="stable").head(top)
+
+    def salary_distribution(self, counts):
+        """Postings per salary band, ordered by pay, from SalaryRange ``counts``."""
+        low = self.index.salary_vocab()[0]
+        order = np.argsort(low, kind="stable")
+        order = order[counts[order] > 0]
+        return pd.Series(counts[order], index=pd.Index(self.index.vocab_array["SalaryRange"][order], name="SalaryRange"),
+                         name="count")
+
+    def salary_counts(self, rows):
+        index = self.index
+        return self.salary_distribution(np.bincount(index.codes["SalaryRange"][rows], minlength=len(index.vocab["SalaryRange"])))
+
+    def salary_thresholds(self):
+        """Distinct lower bounds of the live USD salary bands, for "at least" filters."""
+        low, _, currency = self.index.salary_vocab()
+        low = low[(self.index.totals["SalaryRange"] > 0) & (currency == DEFAULT_CURRENCY)]
+        return sorted({float(v) for v in low if not np.isnan(v)})
+
+    def _summarize(self, counts):
+        """Smart Summary aggregates from ``CatalogIndex._contributions``-style counts."""
+        if not counts["count"]:
+            return None
+        index = self.index
+        previous = index.previous_totals
+        if previous is not None:
+            previous = {name: _pad(value, counts[name].shape) if isinstance(value, np.ndarray) else value
+                        for name, value in previous.items() if name in counts}
+        city_counts, cat_counts, cat_scores = counts["City"], counts["Category"], counts["CategoryScore"]
+        has_cat = cat_counts > 0
+        avg_scores = pd.Series(
+            cat_scores[has_cat] / cat_counts[has_cat],
+            index=pd.Index(np.array(index.vocab["Category"])[has_cat], name="Category"),
+            name="MatchScore",
+        ).sort_values(ascending=False)
+        return {
+            "total_jobs": int(counts["count"]),
+            "avg_score": round(counts["score_sum"] / counts["count"], 1),
+            "active_cities": int((city_counts > 0).sum()),
+            "city_counts": self._top_counts(city_counts, index.vocab["City"], "City", 6),
+            "cat_counts": self._top_counts(cat_counts, index.vocab["Category"], "Category", 6),
+            "skill_counts": self._top_counts(counts["skills"], index.skill_vocab, None, 8),
+            "avg_scores": avg_scores,
+            "salary_counts": self.salary_distribution(counts["SalaryRange"]),
+            "insights": insights.build(counts, index.totals, previous, index.vocab, index.skill_vocab),
+        }
+
+    def aggregate(self, rows):
+        """Smart Summary aggregates for ``rows`` (``None`` when empty)."""
+        with timer("smart_summary.aggregate"):
+            return self._summarize(self.index._contributions(rows))
+
+    def summary(self, city="All", skill="All", category="All"):
+        """Cached Smart Summary aggregates for one filter combination."""
+        key = (self.index.key, "summary", city, skill, category)
+
+        def compute():
+            if is_all(city) and is_all(skill) and is_all(category):
+                # 全目录视图直接用增量维护的总计，不用扫描
+                return self._summarize(self.index.totals)
+            with timer("smart_summary.filter"):
+                rows = np.flatnonzero(self.filter_mask(city=city, skill=skill, category=category))
+            return self.aggregate(rows)
+
+        return get_cache("aggregates").get_or_compute(key, compute)
+
+    def skill_associations(self):
+        """Skill associations over the incrementally maintained skill co-occurrence totals."""
+        index = self.index
+        return get_cache("aggregates").get_or_compute(
+            (index.key, "skill_associations"),
+            lambda: SkillAssociations(index.totals["SkillPairs"], index.totals["count"], index.skill_vocab),
+        )
+
+    def next_skills(self, have, k=3):
+        """The ``k`` skills most worth learning next for someone with skills ``have``."""
+        return self.skill_associations().next_skills(have, k)
+
+    def career_graph(self):
+        """Role progression graph of the live postings' CareerPath values, built once per catalog version."""
+        index = self.index
+
+        def compute():
+            counts = np.bincount(index.codes["CareerPath"][index.alive], minlength=len(index.vocab["CareerPath"]))
+            return CareerGraph(zip(index.vocab["CareerPath"], counts))
+
+        return get_cache("aggregates").get_or_compute((index.key, "career_graph"), compute)
+
+    def completions(self):
+        """Typeahead ``CompletionIndex`` over Role / Company / Category / skills, built once per catalog version."""
+        index = self.index
+
+        def compute():
+            live = np.flatnonzero(index.alive)
+            terms = []
+            for column in KEYWORD_COLUMNS:
+                counts = np.bincount(index.codes[column][live], minlength=len(index.vocab[column]))
+                terms += [(value, column, count) for value, count in zip(index.vocab[column], counts)]
+            terms += [(skill, "Skill", count) for skill, count in zip(index.skill_vocab, index.totals["skills"])]
+            return CompletionIndex(terms)
+
+        return get_cache("aggregates").get_or_compute((index.key, "completions"), compute)
+
+    def complete(self, prefix, k=5):
+        """Top ``k`` keyword completions for ``prefix``: ``[{"text", "kind", "postings"}, ...]``."""
+        return self.completions().complete(prefix, k)
+
+    def filter_options(self):
+        """Sorted City / Skill / Category values with live postings, computed once per catalog version.
+
+        Cities are the normalized location names, so every option is an
+        exact location filter.
+        """
+        index = self.index
+
+        def present(labels, counts):
+            return sorted(label for label, count in zip(labels, counts) if count > 0)
+
+        def compute():
+            totals, locations = index.totals, self.locations()
+            return (present(locations.names, locations.counts(totals["City"])), present(index.skill_vocab, totals["skills"]),
+                    present(index.vocab["Category"], totals["Category"]))
+
+        return get_cache("aggregates").get_or_compute((index.key, "filter_options"), compute)
+
+    def facets(self, city=None, skill=None, category=None, min_salary=None, max_salary=None):
+        """Live posting counts per City / Skill / Category value under the other current filters.
+
+        Each facet leaves out its own filter, so the city counts say how many
+        postings every city would show with the chosen skill and category.
+        A facet is one ``bincount`` (or skill column sum) over the rows of a
+        cached ``search``. Returns ``{"City": {location: count}, "Skill":
+        {...}, "Category": {...}}``; values without postings are left out.
+        """
+        index = self.index
+        args = {"city": city, "skill": skill, "category": category, "min_salary": min_salary, "max_salary": max_salary}
+        key = (index.key, "facets", self.search_filters(city, skill, category, None, None, min_salary, max_salary))
+
+        def compute():
+            with timer("facets"):
+                rows = self.search(**{**args, "skill": None})
+                skills = index.skill_matrix[rows].sum(axis=0)
+                rows = self.search(**{**args, "category": None})
+                categories = np.bincount(index.codes["Category"][rows], minlength=len(index.vocab["Category"]))
+                return {"City": self.location_counts(skill=skill, category=category, min_salary=min_salary,
+                                                     max_salary=max_salary),
+                        "Skill": _present(index.skill_vocab, skills),
+                        "Category": _present(index.vocab["Category"], categories)}
+
+        return get_cache("aggregates").get_or_compute(key, compute)
+
+    def location_counts(self, keyword="", skill=None, category=None, min_salary=None, max_salary=None):
+        """``{location: count}`` of what ``search(city=location, ...)`` returns for every location.
+
+        Without a keyword this is one ``bincount`` of the filtered rows. The
+        fuzzy keyword match weighs values by how often they occur among the
+        candidates, so a city filter changes what matches: with a keyword each
+        location gets its own match from its own value counts (city × value
+        crosstabs built in one pass), applied to its rows by table lookup.
+        """
+        index = self.index
+        filters = self.search_filters(None, skill, category, None, None, min_salary, max_salary)
+        query = normalize_query(keyword)
+
+        def compute():
+            with timer("facets"):
+                locations = self.locations()
+                n = len(locations)
+                rows = self.candidates(filters)
+                place = locations.of_code[index.codes["City"][rows]]
+                if query is None:
+                    return _present(locations.names, np.bincount(place, minlength=n))
+                hit = np.zeros(len(rows), dtype=bool)
+                for column in KEYWORD_COLUMNS:
+                    values = index.lower_vocab[column]
+                    cell = place * len(values) + index.codes[column][rows]
+                    crosstab = np.bincount(cell, minlength=n * len(values)).reshape(n, len(values))
+                    wanted = np.zeros(crosstab.shape, dtype=bool)
+                    for i, counts in enumerate(crosstab):
+                        matched = close_matches(query, values, counts)
+                        wanted[i] = [v in matched for v in values]
+                    hit |= wanted.ravel().take(cell)
+                skills = [index.skill_matrix[rows, s] for s in range(len(index.skill_vocab))]
+                crosstab = np.stack([np.bincount(place[column], minlength=n) for column in skills], axis=1)
+                lower_skills = [s.lower() for s in index.skill_vocab]
+                wanted = np.zeros(crosstab.shape, dtype=bool)
+                for i, counts in enumerate(crosstab):
+                    matched = close_matches(query, lower_skills, counts)
+                    wanted[i] = [s in matched for s in lower_skills]
+                for s, column in enumerate(skills):
+                    if wanted[:, s].any():
+                        hit |= column & wanted[:, s].take(place)
+                return _present(locations.names, np.bincount(place[hit], minlength=n))
+
+        return get_cache("aggregates").get_or_compute((index.key, "location_counts", filters, query), compute)
+
+    # -----------------------------
+    # JSON 查询（HTTP API / 批量）
+    # -----------------------------
+    def select(self, spec):
+        """Validate ``spec`` and return its sorted matching rows, output fields and personal scores."""
+        unknown = set(spec) - QUERY_KEYS
+        if unknown:
+            raise ValueError(f"unknown query keys: {', '.join(sorted(unknown))}")
+        fields = spec.get("fields") or self.index.columns
+        missing = [f for f in fields if f not in self.index.columns]
+        if missing:
+            raise ValueError(f"unknown fields: {', '.join(missing)}")
+
+        min_salary, max_salary, within_km = (None if spec.get(k) in (None, "") else float(spec[k])
+                                             for k in ("min_salary", "max_salary", "within_km"))
+        rows = self.search(
+            city=spec.get("city", "All"), keyword=spec.get("keyword", ""), skill=spec.get("skill"),
+            category=spec.get("category"), company=spec.get("company"), role=spec.get("role"),
+            min_salary=min_salary, max_salary=max_salary, country=spec.get("country"), region=spec.get("region"),
+            within_km=within_km,
+        )
+        profile = spec.get("profile")
+        if profile is not None and not isinstance(profile, dict):
+            raise ValueError("profile must be an object of skill -> proficiency level")
+        scores = self.personal_scores(profile)
+        rows = self.sort(rows, spec.get("sort"), parse_flag("descending", spec.get("descending"), True), scores)
+        if parse_flag("dedupe", spec.get("dedupe")):
+            rows = self.collapse_duplicates(rows)
+        return rows, list(fields), scores
+
+    def run(self, spec):
+        """Execute one JSON query spec and return a JSON-friendly dict.
+
+        Keys: ``city``, ``country``, ``region``, ``within_km`` (around
+        ``city``), ``keyword``, ``skill``, ``category``, ``company``,
+        ``role``, ``min_salary`` / ``max_salary`` (USD per month), ``sort``,
+        ``descending``, ``page``, ``per_page``, ``fields``, ``aggregate``,
+        ``profile`` (``{skill: level}``; MatchScore becomes personal) and
+        ``dedupe`` (one posting per near-duplicate cluster). ``descending``,
+        ``aggregate`` and ``dedupe`` take a bool or ``"true"`` / ``"false"``.
+        Unknown keys and invalid values raise ``ValueError``.
+        """
+        rows, fields, scores = self.select(spec)
+        page_rows, page, pages = self.paginate(rows, spec.get("page", 1), spec.get("per_page", DEFAULT_PER_PAGE))
+        records = self.index.records(page_rows, fields)
+        for posting_id, record in zip(self.index.posting_ids(page_rows), records):
+            record["id"] = posting_id
+        if scores is not None and "MatchScore" in fields:
+            for score, record in zip(scores[page_rows].tolist(), records):
+                record["MatchScore"] = score
+
+        result = {"total": int(len(rows)), "page": page, "pages": pages, "results": records}
+        if parse_flag("aggregate", spec.get("aggregate")):
+            result["aggregates"] = to_jsonable(self.aggregate(rows))
+        return result
+
+    def row_of(self, posting_id):
+        """Row position of a live posting id, or ``ValueError``."""
+        index = self.index
+        if index.ids is None:
+            match = re.fullmatch(r"gen-(\d+)", str(posting_id))
+            rows = [int(match.group(1))] if match and int(match.group(1)) < index.size else []
+        else:
+            rows = np.flatnonzero(index.ids == str(posting_id)).tolist()
+        if not rows or not index.alive[rows[0]]:
+            raise ValueError(f"unknown posting id {posting_id!r}")
+        return rows[0]
+
+    def similar(self, posting_id, k=5, fields=None):
+        """The ``k`` postings most similar to ``posting_id`` (see ``recommender``)."""
+        row = self.row_of(posting_id)
+        k = max(1, min(int(k), MAX_PER_PAGE))
+        embeddings = recommender.get_embeddings(self.index)
+        rows, scores = recommender.similar(embeddings, embeddings.row_vectors([row])[0], self.index.alive, k, exclude=[row])
+        fields = fields or self.index.columns
+        records = self.index.records(rows, fields)
+        for posting, score, record in zip(self.index.posting_ids(rows), scores.tolist(), records):
+            record["id"], record["similarity"] = posting, round(score, 4)
+        return {"id": str(posting_id), "results": records}
+
+    def run_batch(self, specs):
+        """Run many specs; a failing spec yields ``{"error": ...}`` in its slot."""
+        results = []
+        for spec in specs:
+            try:
+                results.append(self.run(spec))
+            except (ValueError, TypeError) as e:
+                results.append({"error": str(e)})
+        return results
+
+
+def to_jsonable(value):
+    if isinstance(value, pd.Series):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, dict):
+        return {k: to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+# -----------------------------
+# 版本化目录（增量导入）
+# -----------------------------
+class CatalogStore:
+    """The live, versioned catalog behind ``get_engine``.
+
+    ``apply`` builds the next ``CatalogIndex`` from copies and publishes it
+    with a single reference swap, so a reader that took ``store.engine``
+    keeps a complete, consistent version for as long as it holds it. Search
+    and aggregate cache keys include the version, so stale entries are never
+    served for a newer catalog.
+    """
+
+    COMPACT_RATIO = 0.25
+
+    def __init__(self, df, key):
+        self.key = key
+        self.version = 0
+        self.engine = QueryEngine(CatalogIndex(df, key + (0,)))
+        self.engine.index.duplicates()   # 构建目录时就把近似重复聚好类、把相似岗位向量算好
+        recommender.get_embeddings(self.engine.index)
+        self._positions = None   # posting id -> row, built on the first batch
+        self._write_lock = threading.Lock()
+        self.batches = self.upserts = self.expirations = self.rejected = 0
+        self.last_apply_ms = 0.0
+
+    def apply(self, events):
+        """Apply one batch of feed events (see ``ingest``) and publish a new version.
+
+        Returns the number of events that changed the catalog.
+        """
+        start = time.perf_counter()
+        with self._write_lock:
+            index = self.engine.index
+            positions = self._positions
+            if positions is None:
+                positions = {pid: row for row, pid in enumerate(index.posting_ids(np.arange(index.size)))}
+
+            latest = {}
+            for event in events:
+                if not isinstance(event, dict) or not event.get("id") or event.get("op", "upsert") not in ("upsert", "expire"):
+                    self.rejected += 1
+                    continue
+                pid = str(event["id"])
+                previous = latest.get(pid)
+                if previous is not None and previous.get("op", "upsert") == "upsert" == event.get("op", "upsert"):
+                    event = {**previous, **event}  # 同一批内的多次更新合并
+                latest[pid] = event
+
+            changed, added, added_ids, expired = {}, [], [], []
+            for pid, event in latest.items():
+                row = positions.get(pid)
+                if event.get("op", "upsert") == "expire":
+                    if row is not None and index.alive[row]:
+                        expired.append(row)
+                    continue
+                fields = self._validate(index, {k: v for k, v in event.items() if k not in ("op", "id")}, row is None)
+                if fields is None:
+                    self.rejected += 1
+                elif row is None:
+                    added.append(fields)
+                    added_ids.append(pid)
+                else:
+                    changed[row] = {**index.records([row], index.columns)[0], **fields}
+
+            applied = len(changed) + len(added) + len(expired)
+            if applied:
+                version = self.version + 1
+                new_index = index.updated(self.key + (version,), changed, added, added_ids, expired)
+                for offset, pid in enumerate(added_ids):
+                    positions[pid] = index.size + offset
+                if new_index.size and 1 - new_index.alive.mean() > self.COMPACT_RATIO:
+                    new_index = new_index.compacted(new_index.key)
+                    positions = {pid: row for row, pid in enumerate(new_index.ids.tolist())}
+                new_index.duplicates()   # 发布前聚类、补齐向量，读者不用在重跑时现算
+                recommender.get_embeddings(new_index)
+                self._positions = positions
+                self.version = version
+                self.engine = QueryEngine(new_index)  # 原子发布：一次引用替换
+                self.upserts += len(changed) + len(added)
+                self.expirations += len(expired)
+            self.batches += 1
+            self.last_apply_ms = round((time.perf_counter() - start) * 1000, 3)
+            return applied
+
+    @staticmethod
+    def _validate(index, fields, is_new):
+        """Coerce posting fields to column types; ``None`` if unusable."""
+        if set(fields) - set(index.columns) or (is_new and set(index.columns) - set(fields)):
+            return None
+        try:
+            for column in index.numeric:
+                if column in fields:
+                    fields[column] = index.numeric[column].dtype.type(fields[column])
+        except (TypeError, ValueError):
+            return None
+        return fields
+
+    def stats(self):
+        index = self.engine.index
+        return {
+            "version": self.version,
+            "rows": index.size,
+            "live_rows": int(index.alive.sum()),
+            "near_duplicates": index.duplicates().stats()["duplicates"],
+            "batches": self.batches,
+            "upserts": self.upserts,
+            "expirations": self.expirations,
+            "rejected": self.rejected,
+            "last_apply_ms": self.last_apply_ms,
+        }
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _store_key():
+    root = shared_catalog.shared_dir()
+    return root, ("shared", root) if root else catalog_key()
+
+
+def get_store():
+    """The live catalog for the current settings.
+
+    Kept outside the budgeted caches: ingested updates exist only here and
+    could not be recomputed after an eviction. The generated DataFrame is only
+    encoded, never cached, so it is freed once the store exists. With
+    ``GREEN_LEAP_SHARED_CATALOG`` set this is a read-only ``MappedCatalog``
+    over the builder's snapshots instead.
+    """
+    root, key = _store_key()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = shared_catalog.MappedCatalog(root) if root else CatalogStore(build_jobs_df(*key), key)
+        return store
+
+
+def peek_store():
+    """The live catalog for the current settings if it has been built, else ``None`` (never builds)."""
+    return _stores.get(_store_key()[1])   # 不拿锁：别的线程正在建目录时也不等
+
+
+def get_engine():
+    """Query engine for the latest catalog version, shared by every session and API thread."""
+    return get_store().engine
+
+
+def store_stats():
+    with _stores_lock:
+        stores = list(_stores.items())
+    return {"-".join(map(str, key)): store.stats() for key, store in stores}
+
+
+register_stats_source("catalog", store_stats)
@@ -0,0 +1,191 @@
+"""
+Headless HTTP/JSON API over the catalog query engine.
+
+Partner integrations query the catalog here instead of through the Streamlit
+UI, so no script rerun is involved; every request is answered from the
+shared ``QueryEngine`` and its caches.
+
+    python query_server.py --port 8600
+
+    GET  /health
+    GET  /query?city=Tokyo&keyword=energy&page=2
+    GET  /query?keyword=energy&dedupe=true      (one posting per near-duplicate cluster)
+    GET  /similar?id=gen-42&k=5
+    GET  /suggest?q=ene&k=5                     (typeahead completions for the keyword box)
+    GET  /export?city=Tokyo&format=csv          (all matches, streamed; format csv or xlsx)
+    POST /query   {"city": "Tokyo", "keyword": "energy", "sort": "MatchScore"}
+    POST /batch   {"queries": [{"city": "Tokyo"}, {"skill": "Python", "aggregate": true}]}
+
+See ``QueryEngine.run`` for the query keys.
+"""
+import argparse
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import exports
+import ingest
+from query_engine import get_engine, parse_flag
+
+MAX_BATCH = 1000
+MAX_BODY_BYTES = 4 * 1024 * 1024
+INT_PARAMS = ("page", "per_page")
+BOOL_PARAMS = ("descending", "aggregate", "dedupe")
+FLOAT_PARAMS = ("min_salary", "max_salary", "within_km")
+EXPORT_FORMATS = {"csv": exports.CSV_MIME, "xlsx": exports.XLSX_MIME}
+
+
+def spec_from_query_string(qs):
+    """Turn ``?city=Tokyo&page=2&fields=Role&fields=City`` into a query spec."""
+    params = parse_qs(qs)
+    spec = {}
+    for key, values in params.items():
+        if key == "fields":
+            spec[key] = [f for v in values for f in v.split(",") if f]
+        elif key in INT_PARAMS:
+            spec[key] = int(values[-1])
+        elif key in BOOL_PARAMS:
+            spec[key] = parse_flag(key, values[-1])
+        elif key in FLOAT_PARAMS:
+            spec[key] = float(values[-1])
+        else:
+            spec[key] = values[-1]
+    return spec
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "GreenLeapQuery/1.0"
+    quiet = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            engine = get_engine()
+            self._send(200, {"status": "ok", "catalog": list(engine.index.key), "rows": int(engine.index.alive.sum())})
+        elif url.path == "/query":
+            try:
+                self._send(200, get_engine().run(spec_from_query_string(url.query)))
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+        elif url.path == "/similar":
+            params = parse_qs(url.query)
+            try:
+                if "id" not in params:
+                    raise ValueError("missing id")
+                self._send(200, get_engine().similar(params["id"][-1], int(params.get("k", ["5"])[-1])))
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+        elif url.path == "/suggest":
+            params = parse_qs(url.query)
+            try:
+                self._send(200, get_engine().complete(params.get("q", [""])[-1], int(params.get("k", ["5"])[-1])))
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+        elif url.path == "/export":
+            try:
+                spec = spec_from_query_string(url.query)
+                export_format = spec.pop("format", "csv")
+                if export_format not in EXPORT_FORMATS:
+                    raise ValueError(f"unknown format {export_format!r}; choose csv or xlsx")
+                engine = get_engine()
+                rows, fields, _ = engine.select(spec)
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+                return
+            header = ["id"] + fields
+            chunks = exports.catalog_chunks(engine.index, rows, fields)
+            if export_format == "csv":
+                body = exports.iter_csv(header, chunks)
+            else:
+                body = exports.iter_xlsx([("Green Jobs", header, chunks)])
+            self._send_stream(EXPORT_FORMATS[export_format], f"green_jobs.{export_format}", body)
+        else:
+            self._send(404, {"error": f"unknown path {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        try:
+            body = self._read_json()
+            if url.path == "/query":
+                self._send(200, get_engine().run(body))
+            elif url.path == "/batch":
+                queries = body.get("queries") if isinstance(body, dict) else None
+                if not isinstance(queries, list):
+                    raise ValueError('batch body must be {"queries": [...]}')
+                if len(queries) > MAX_BATCH:
+                    raise ValueError(f"batch too large ({len(queries)} > {MAX_BATCH})")
+                self._send(200, {"results": get_engine().run_batch(queries)})
+            else:
+                self._send(404, {"error": f"unknown path {url.path}"})
+        except (ValueError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError("request body too large")
+        raw = self.rfile.read(length) if length else b"{}"
+        try:
+            body = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise ValueError("request body must be a JSON object")
+        return body
+
+    def _send(self, status, payload):
+        data = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, mime, filename, chunks):
+        """Send ``chunks`` with chunked transfer encoding, never holding the whole file."""
+        self.send_response(200)
+        self.send_header("Content-Type", mime)
+        self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunks:
+            if chunk:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=8600, quiet=True):
+    QueryHandler.quiet = quiet
+    return ThreadingHTTPServer((host, port), QueryHandler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Green Leap catalog query API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    parser.add_argument("--feed-dir", default=os.environ.get(ingest.FEED_DIR_ENV),
+                        help="ingest *.jsonl job-feed files from this directory in the background")
+    args = parser.parse_args(argv)
+
+    get_engine()  # 启动时先建好索引，第一个请求不用等
+    if args.feed_dir:
+        ingest.start_background(args.feed_dir)
+    server = make_server(args.host, args.port, quiet=not args.verbose)
+    print(f"Green Leap query API on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Similar-jobs recommender over hashed TF-IDF job embeddings.
+
+Each posting is embedded from Role, Category, KeySkills and JobDescription:
+words and whole skill / role / category phrases are hashed (signed) into
+``EMBED_DIM`` buckets, weighted by TF-IDF and L2-normalized into a float32
+matrix. Because those columns are dictionary-encoded, postings sharing the
+same four values share one embedding row, so the matrix has one row per
+distinct combination and ``combo[row]`` points a posting at its row; the
+document frequencies still count every posting.
+
+Neighbours come from one matrix-vector product over the combination rows
+(``similar_batch`` does many queries in one matrix product) followed by an
+``argpartition`` top-k. ``CatalogStore`` builds the embeddings with the
+catalog and every feed batch carries them forward, embedding only the
+combinations it introduces (with the term IDF of the build, so weights drift
+slightly until the next compaction rebuilds them). The shared-catalog builder
+writes them into each snapshot so workers only map them.
+"""
+import copy
+import re
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from instrumentation import timed
+
+EMBED_DIM = 256
+EMBED_FIELDS = ("Role", "Category", "KeySkills", "JobDescription")
+PHRASE_FIELDS = ("Role", "Category")
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {"and", "the", "to", "of", "in", "on", "with", "for", "a", "an", "or", "by", "as", "at", "from"}
+
+
+def _hash(token):
+    h = zlib.crc32(token.encode("utf-8"))
+    return h % EMBED_DIM, 1.0 if h & 0x80000000 else -1.0
+
+
+def tokens(field, text):
+    """Hashed tokens of one field value: its words plus whole phrases for skills / role / category."""
+    text = str(text)
+    found = [w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS]
+    if field == "KeySkills":
+        found += ["skill:" + s.strip().lower() for s in text.split(",") if s.strip()]
+    elif field in PHRASE_FIELDS:
+        found.append(f"{field.lower()}:{text.lower()}")
+    return found
+
+
+class JobEmbeddings:
+    """``vectors`` (combinations × EMBED_DIM, float32) and ``combo`` (row -> combination).
+
+    Built once per catalog with ``build``; ``updated`` derives the next
+    version's embeddings from this one (see ``CatalogIndex.updated``).
+    """
+
+    GROWTH = 1.25   # 向量缓冲区不够时按这个倍数扩容
+
+    def __init__(self, combo, vectors, idf):
+        self.combo = combo
+        self.vectors = vectors
+        self.idf = idf
+        self._inverse = None
+        self._buffer = vectors   # vectors 是它的前缀视图；追加的组合写在后面
+        self.term_idf, self.unseen_idf, self.combo_ids = None, None, None  # 只有 build 出来的才能增量更新
+
+    @property
+    def nbytes(self):
+        return self.combo.nbytes + self._buffer.nbytes + self.idf.nbytes
+
+    @classmethod
+    def build(cls, index):
+        codes = np.stack([index.codes[f] for f in EMBED_FIELDS], axis=1)
+        combos, combo = np.unique(codes, axis=0, return_inverse=True)
+        combo = combo.reshape(-1).astype(np.int32)
+        counts = np.bincount(combo[index.alive], minlength=len(combos))  # 文档频率只数在架岗位
+
+        rows, cols, tf, terms = _term_frequencies(index, combos)
+        doc_freq = np.bincount(cols, weights=counts[rows], minlength=len(terms))
+        idf_terms = np.log((1 + counts.sum()) / (1 + doc_freq)) + 1
+
+        embeddings = cls(combo, np.zeros((0, EMBED_DIM), dtype=np.float32), np.zeros(EMBED_DIM, dtype=np.float32))
+        embeddings.term_idf = dict(zip(terms, idf_terms.tolist()))
+        embeddings.unseen_idf = float(np.log(1 + counts.sum()) + 1)   # 建好之后才出现的词按最稀有算
+        embeddings.combo_ids = {key: i for i, key in enumerate(map(tuple, combos.tolist()))}
+        embeddings._append(embeddings._embed(len(combos), rows, cols, tf, terms, idf_terms))
+        return embeddings
+
+    def updated(self, index, rows):
+        """Embeddings of the successor ``index`` whose ``rows`` were rewritten or appended.
+
+        Rows whose (Role, Category, KeySkills, JobDescription) combination
+        is already known point at its vector; only new combinations are
+        embedded, weighted with the term IDF of the original build. Vectors
+        are appended to a buffer shared with this version, which only reads
+        its own prefix.
+        """
+        new = copy.copy(self)
+        new.combo_ids, new.idf, new._inverse = dict(self.combo_ids), self.idf.copy(), None
+        new.combo = np.concatenate([self.combo, np.zeros(index.size - len(self.combo), dtype=np.int32)])
+        rows = np.asarray(rows, dtype=np.int64)
+        keys = list(zip(*(index.codes[f][rows].tolist() for f in EMBED_FIELDS)))
+        fresh = list(dict.fromkeys(key for key in keys if key not in new.combo_ids))
+        for key in fresh:
+            new.combo_ids[key] = len(new.combo_ids)
+        new.combo[rows] = [new.combo_ids[key] for key in keys]
+        if fresh:
+            term_rows, cols, tf, terms = _term_frequencies(index, fresh)
+            idf_terms = np.array([self.term_idf.get(t, self.unseen_idf) for t in terms], dtype=np.float64)
+            new._append(new._embed(len(fresh), term_rows, cols, tf, terms, idf_terms))
+        return new
+
+    def _embed(self, n, rows, cols, tf, terms, idf_terms):
+        """L2-normalized vectors of ``n`` combinations from their term frequencies; updates ``idf``."""
+        weights = (1 + np.log(tf)) * idf_terms[cols]
+        buckets = np.empty(len(terms), dtype=np.int64)
+        signs = np.empty(len(terms))
+        for j, term in enumerate(terms):
+            buckets[j], signs[j] = _hash(term)
+            self.idf[buckets[j]] = max(self.idf[buckets[j]], idf_terms[j])
+
+        vectors = np.zeros((n, EMBED_DIM), dtype=np.float64)
+        np.add.at(vectors, (rows, buckets[cols]), weights * signs[cols])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return (vectors / np.where(norms == 0, 1, norms)).astype(np.float32)
+
+    def _append(self, vectors):
+        size = len(self.vectors) + len(vectors)
+        if size > len(self._buffer):
+            buffer = np.empty((max(size, int(len(self._buffer) * self.GROWTH)), EMBED_DIM), dtype=np.float32)
+            buffer[:len(self.vectors)] = self.vectors
+            self._buffer = buffer
+        self._buffer[len(self.vectors):size] = vectors
+        self.vectors = self._buffer[:size]
+
+    def text_vector(self, text):
+        """Embed free text (e.g. a search keyword) into the same space."""
+        vector = np.zeros(EMBED_DIM, dtype=np.float32)
+        for token in tokens("JobDescription", text):
+            bucket, sign = _hash(token)
+            vector[bucket] += sign * (self.idf[bucket] or 1.0)
+        return _normalize(vector)
+
+    def row_vectors(self, rows):
+        return self.vectors[self.combo[rows]]
+
+    def rows_by_combo(self):
+        """CSR-style inverse of ``combo``: rows of combination ``c`` are ``order[offsets[c]:offsets[c+1]]``."""
+        if self._inverse is None:
+            order = np.argsort(self.combo, kind="stable")
+            offsets = np.zeros(len(self.vectors) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum(np.bincount(self.combo, minlength=len(self.vectors)))
+            self._inverse = (order, offsets)
+        return self._inverse
+
+
+def _term_frequencies(index, combos):
+    """``(rows, cols, counts, terms)`` of ``combos``: ``terms[cols[i]]`` occurs ``counts[i]`` times in ``combos[rows[i]]``."""
+    field_tokens = {f: {} for f in EMBED_FIELDS}
+    term_rows, term_cols, term_vals = [], [], []
+    for i, codes_row in enumerate(combos):
+        tf = Counter()
+        for field, code in zip(EMBED_FIELDS, codes_row):
+            cached = field_tokens[field].get(code)
+            if cached is None:
+                cached = field_tokens[field][code] = tokens(field, index.vocab[field][code])
+            tf.update(cached)
+        term_rows += [i] * len(tf)
+        term_cols += list(tf)
+        term_vals += list(tf.values())
+
+    vocab = {t: j for j, t in enumerate(dict.fromkeys(term_cols))}
+    cols = np.fromiter((vocab[t] for t in term_cols), dtype=np.int64, count=len(term_cols))
+    return np.asarray(term_rows, dtype=np.int64), cols, np.asarray(term_vals, dtype=np.float64), list(vocab)
+
+
+def _normalize(vector):
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@timed("recommender.similar")
+def similar_batch(embeddings, queries, alive, k=5, exclude=None):
+    """Top-``k`` live rows for each query vector, best first, as ``(rows, scores)`` pairs.
+
+    Combinations are ranked first; only the best ones are expanded to their
+    postings, skipping expired and ``exclude`` rows.
+    """
+    combo_scores = np.asarray(queries, dtype=np.float32) @ embeddings.vectors.T   # (q, combinations)
+    order, offsets = embeddings.rows_by_combo()
+    excluded = set() if exclude is None else set(np.asarray(exclude).tolist())
+    results = []
+    for scores in combo_scores:
+        rows, row_scores, want = [], [], min(len(scores), 4 * k)
+        while True:
+            ranked = np.argpartition(-scores, want - 1)[:want] if want < len(scores) else np.arange(len(scores))
+            ranked = ranked[np.argsort(-scores[ranked], kind="stable")]
+            rows, row_scores = [], []
+            for c in ranked.tolist():
+                for row in order[offsets[c]:offsets[c + 1]].tolist():
+                    if alive[row] and row not in excluded:
+                        rows.append(row)
+                        row_scores.append(scores[c])
+                if len(rows) >= k:
+                    break
+            if len(rows) >= k or want == len(scores):
+                break
+            want = min(len(scores), want * 4)
+        results.append((np.asarray(rows[:k], dtype=np.int64), np.asarray(row_scores[:k], dtype=np.float32)))
+    return results
+
+
+def similar(embeddings, query, alive, k=5, exclude=None):
+    return similar_batch(embeddings, [query], alive, k, exclude)[0]
+
+
+def get_embeddings(index):
+    """Embeddings of ``index``: mapped from the shared snapshot, carried forward by ``CatalogIndex.updated``
+    or, for a fresh catalog, built here once."""
+    if index.embeddings is None:
+        index.embeddings = JobEmbeddings.build(index)
+    return index.embeddings
+
+
+def recommend(index, context_rows, keyword="", k=5, exclude=None):
+    """Rows most similar to ``context_rows`` (e.g. the visible results) and ``keyword``."""
+    embeddings = get_embeddings(index)
+    query = np.zeros(EMBED_DIM, dtype=np.float32)
+    if len(context_rows):
+        query += _normalize(embeddings.row_vectors(context_rows).mean(axis=0))
+    if keyword and keyword.strip():
+        query += embeddings.text_vector(keyword)
+    if not query.any():
+        return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+    # 多取一些再去重（同岗位同公司同城市的只保留一条）
+    rows, scores = similar(embeddings, _normalize(query), index.alive, k * 4, exclude)
+    seen, keep = set(), []
+    for i, key in enumerate(zip(*(index.codes[f][rows].tolist() for f in ("Role", "Company", "City")))):
+        if key not in seen:
+            seen.add(key)
+            keep.append(i)
+        if len(keep) == k:
+            break
+    return rows[keep], scores[keep]
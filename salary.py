@@ -0,0 +1,44 @@
+"""
+Salary parsing for the free-text ``SalaryRange`` column.
+
+Labels such as ``"USD 1000–1500/month"``, ``"$18/hour"`` or
+``"SGD 48k - 60k per year"`` become a numeric monthly min / max and an ISO
+currency code. SalaryRange is dictionary-encoded, so each distinct label is
+parsed once when the catalog index is built (and again only for labels that
+ingestion adds); rows get their numbers through their codes.
+"""
+import math
+import re
+
+DEFAULT_CURRENCY = "USD"
+DEFAULT_PERIOD = "month"
+MONTHLY_FACTOR = {"hour": 160, "day": 21, "week": 52 / 12, "month": 1, "year": 1 / 12}
+
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([kK])?")
+_CODE = re.compile(r"\b([A-Z]{3})\b")
+_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "₩": "KRW", "₱": "PHP", "฿": "THB", "₫": "VND"}
+_PERIODS = {"hour": "hour", "hr": "hour", "day": "day", "week": "week", "wk": "week", "month": "month", "mo": "month",
+            "year": "year", "yr": "year", "annum": "year", "annual": "year", "annually": "year"}
+_PERIOD = re.compile(r"(?:/|\bper\b|\ba\b)\s*(" + "|".join(sorted(_PERIODS, key=len, reverse=True)) + r")\b", re.I)
+
+
+def parse_salary(label):
+    """``(min, max, currency)`` per month for a salary label.
+
+    Bounds are ``nan`` and the currency is ``""`` when nothing can be
+    parsed; a single amount gives ``min == max``.
+    """
+    text = str(label)
+    amounts = [float(number.replace(",", "")) * (1000 if k else 1) for number, k in _AMOUNT.findall(text)]
+    if not amounts:
+        return math.nan, math.nan, ""
+    code = _CODE.search(text)
+    currency = code.group(1) if code else next((c for s, c in _SYMBOLS.items() if s in text), DEFAULT_CURRENCY)
+    period = _PERIOD.search(text)
+    factor = MONTHLY_FACTOR[_PERIODS[period.group(1).lower()] if period else DEFAULT_PERIOD]
+    low, high = amounts[0], amounts[1] if len(amounts) > 1 else amounts[0]
+    return min(low, high) * factor, max(low, high) * factor, currency
+
+
+def format_amount(value, currency=DEFAULT_CURRENCY):
+    return f"{currency} {value:,.0f}/month"
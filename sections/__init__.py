@@ -0,0 +1,31 @@
+"""
+Section registry behind the sidebar menu.
+
+Each section lives in its own module and is imported the first time it is
+opened, so a cold start only pays for the page the user actually sees and
+heavy dependencies (pandas, altair, difflib) load on demand. Later reruns hit
+``sys.modules`` and skip parsing entirely.
+"""
+import importlib
+
+# 菜单显示名 → 模块路径（顺序即侧边栏顺序）
+SECTIONS = {
+    "Find Green Jobs": "sections.find_jobs",
+    "Match My Skills": "sections.match_skills",
+    "30/60/90 Path": "sections.growth_path",
+    "Smart Summary": "sections.smart_summary",
+    "Green Coach Chat": "sections.coach_chat",
+    "Dashboard": "sections.dashboard",
+    "Green Economy Reality": "sections.economy_reality",
+}
+
+SECTION_NAMES = list(SECTIONS)
+
+
+def load_section(name):
+    """Import (once) and return the module behind a menu entry."""
+    return importlib.import_module(SECTIONS[name])
+
+
+def render_section(name):
+    load_section(name).render()
@@ -0,0 +1,177 @@
+"""Section 5: Green Coach Chat."""
+import streamlit as st
+
+
+roles = {
+    "Career Planner": "📘 Helps you align your personal goals with sustainable career pathways.",
+    "Skill Trainer": "🧠 Guides you to identify, learn, and enhance future-ready green skills.",
+    "Motivation Buddy": "🔥 Keeps you inspired, confident, and resilient on your sustainability journey."
+}
+
+questions = {
+    "Career Planner": [
+        "How can I identify sustainable career opportunities that align with my strengths?",
+        "What industries are expected to grow fastest in green employment?",
+        "How can I transition my current role into the sustainability field?",
+        "What certifications or qualifications will enhance my sustainable career prospects?",
+        "How can I showcase my green values in job interviews?",
+        "How do I plan a 5-year growth path in the green economy?",
+        "What are common challenges when pursuing sustainability roles?",
+        "How can I balance income goals with impact-driven work?"
+    ],
+    "Skill Trainer": [
+        "What technical skills are most valuable in sustainability careers?",
+        "How can I learn data analysis for environmental projects?",
+        "Which online platforms are best for green upskilling?",
+        "How do I combine AI and sustainability effectively?",
+        "What soft skills should I develop for sustainable leadership?",
+        "How do I evaluate my current skill gaps?",
+        "What are emerging skill trends in green industries?",
+        "How can I apply what I learn in real-world sustainability projects?"
+    ],
+    "Motivation Buddy": [
+        "How do I stay motivated while job searching in sustainability?",
+        "How can I overcome fear of failure when changing careers?",
+        "What can I do when I feel my sustainability efforts don’t make an impact?",
+        "How do I stay confident when others don’t value green careers?",
+        "How can I find like-minded people who share my mission?",
+        "How do I manage stress from trying to make a difference?",
+        "What is the best way to maintain long-term passion for sustainability?",
+        "How can I celebrate small wins on this journey?"
+    ]
+}
+
+# -----------------------------
+# 🤖 Green Coach Responses
+# -----------------------------
+responses = {
+    "Career Planner": {
+        "How can I identify sustainable career opportunities that align with my strengths?":
+            "Insight: Begin by mapping your core values, preferred work style, and long-term aspirations. Sustainable careers span across disciplines—finance, data, design, policy—so alignment often depends on how your personal motivations intersect with global sustainability goals. Next Step: Use self-assessment tools such as the SDG Compass or UN Career Pathfinder to identify where your skills meet environmental or social impact needs. Resource Tip: Explore real case examples in the World Economic Forum’s 'Future of Jobs' report to visualize skill-to-impact connections.",
+        "What industries are expected to grow fastest in green employment?":
+            "Insight: The renewable energy sector continues to dominate, with solar and wind expansion leading job creation across Asia-Pacific. Other high-growth domains include sustainable urban planning, electric mobility, ESG analytics, and circular economy design. Next Step: Focus your research on industries that combine both technological innovation and public policy incentives. Resource Tip: Review IRENA’s Global Energy Transformation Outlook for regional employment projections and transition readiness.",
+        "How can I transition my current role into the sustainability field?":
+            "Insight: Transitioning into sustainability does not require abandoning your current profession. Instead, integrate sustainability principles into your field—marketing can pivot to ethical branding, finance to impact investing, or engineering to green design. Next Step: Start with sustainability certifications and company CSR involvement to build credibility internally. Resource Tip: Explore the 'One Planet Academy' and LinkedIn’s Sustainable Strategy micro-courses to craft a transition narrative aligned with measurable impact.",
+        "What certifications or qualifications will enhance my sustainable career prospects?":
+            "Insight: Credentials such as LEED, GRI, CFA ESG, or ISO 14001 auditor qualifications are internationally recognized. However, practical experience—project leadership, volunteering, or innovation challenges—often outweighs theoretical certificates. Next Step: Choose a certificate that complements your academic background and career stage rather than chasing popularity. Resource Tip: Visit Coursera’s Sustainability Leadership catalogue or the UN CC:Learn hub for recognized global certifications.",
+        "How can I showcase my green values in job interviews?":
+            "Insight: Employers value authenticity more than slogans. Frame your sustainability experience through evidence—projects, measurable outcomes, and lessons learned. Use the STAR method (Situation, Task, Action, Result) to illustrate your environmental mindset in concrete actions. Next Step: Practice articulating how your personal mission aligns with organizational SDG goals. Resource Tip: Read 'Communicating Impact' by Harvard Business Review to refine your storytelling and professional branding.",
+        "How do I plan a 5-year growth path in the green economy?":
+            "Insight: A successful 5-year plan balances adaptability with intention. The sustainability field evolves quickly; new technologies emerge annually. Plan around capability milestones rather than job titles—learning a new analytical tool, leading a project, or contributing to a publication. Next Step: Map your progression through yearly skill goals. Resource Tip: Use tools like Trello or Notion to visualize long-term competence building linked to global climate objectives.",
+        "What are common challenges when pursuing sustainability roles?":
+            "Insight: Many professionals face frustration over limited entry-level opportunities or unclear career ladders. Others struggle with organizations that engage in greenwashing rather than real transformation. Next Step: Evaluate employers critically using transparency reports and third-party ESG ratings. Resource Tip: Consult the BCorp directory and the Ethical Consumer Index to target authentic sustainability-driven employers.",
+        "How can I balance income goals with impact-driven work?":
+            "Insight: Financial stability and meaningful impact are not mutually exclusive. The key lies in finding hybrid positions—consultancy, data analytics, or project management—where environmental outcomes align with market value. Next Step: Develop negotiation skills and communicate the business value of sustainability initiatives to justify compensation. Resource Tip: Read the 'Sustainability Salary Guide' by Acre for insights on pay ranges and advancement routes."
+    },
+    "Skill Trainer": {
+        "What technical skills are most valuable in sustainability careers?":
+            "Insight: The intersection of technology and sustainability is where future impact will occur. Data analytics, life-cycle assessment, and systems thinking are indispensable. Coding proficiency, especially in Python or R, enhances employability. Next Step: Build proficiency through applied projects rather than theory. Join hackathons focused on energy efficiency or smart city modeling. Resource Tip: Explore the MIT OpenCourseWare series on Climate Informatics and Data Analytics for Climate Science.",
+        "How can I learn data analysis for environmental projects?":
+            "Insight: Start with foundational courses in data analytics, focusing on environmental datasets. Learn visualization tools like Power BI or Tableau to translate data into action. Next Step: Select one environmental topic—waste, air quality, or energy—and analyze open datasets. Document findings through a mini-report or dashboard. Resource Tip: Use the World Bank Data Catalogue and Kaggle’s climate datasets for practice material.",
+        "Which online platforms are best for green upskilling?":
+            "Insight: Coursera, FutureLearn, and edX now offer structured green skills pathways endorsed by top universities. For more technical expertise, consider ESRI’s GIS or Google’s Sustainability Data programs. Next Step: Dedicate one learning sprint per month. Record progress and share reflections on LinkedIn for credibility. Resource Tip: Access UNITAR’s Green Learning Portal for public sector sustainability leadership modules.",
+        "How do I combine AI and sustainability effectively?":
+            "Insight: AI enhances sustainability through predictive modeling and optimization. Use machine learning to simulate carbon emissions or track biodiversity changes. However, ethical constraints—energy consumption and bias—must guide usage. Next Step: Experiment with small-scale ML models using public APIs for environmental forecasting. Resource Tip: Engage with 'AI for Earth' by Microsoft and DeepMind’s Climate Action research papers.",
+        "What soft skills should I develop for sustainable leadership?":
+            "Insight: Communication, empathy, and strategic foresight matter as much as technical knowledge. The capacity to translate science into policy and inspire interdisciplinary collaboration defines sustainable leadership. Next Step: Practice systems thinking workshops and cross-sector dialogues. Resource Tip: Read the Cambridge Institute’s 'Leading for Change' series and engage in reflective journaling.",
+        "How do I evaluate my current skill gaps?":
+            "Insight: Use skill mapping frameworks like LinkedIn Learning’s Sustainability Map or ILO’s Green Competence Framework. Honest self-assessment fosters targeted growth. Next Step: Identify one hard skill and one soft skill to strengthen quarterly. Resource Tip: Review the 'Green Skills Report 2024' for benchmark comparisons.",
+        "What are emerging skill trends in green industries?":
+            "Insight: Green finance, circular design, and renewable integration dominate job trends. Companies seek professionals who bridge technology and sustainability policy. Next Step: Subscribe to newsletters like 'GreenBiz Skills Weekly'. Resource Tip: Read the WEF’s 'Jobs of Tomorrow' report to anticipate demand.",
+        "How can I apply what I learn in real-world sustainability projects?":
+            "Insight: Application solidifies knowledge. Partner with NGOs or student-led innovation labs. Field practice reveals context beyond theory. Next Step: Choose one ongoing community project to contribute to each semester. Resource Tip: Explore UN Volunteers or OpenIDEO project challenges for experiential learning."
+    },
+    "Motivation Buddy": {
+        "How do I stay motivated while job searching in sustainability?":
+            "Insight: Green careers often progress slower because they demand passion over prestige. Motivation strengthens when you redefine success as alignment with purpose. Next Step: Maintain a progress journal and join professional communities like Net Impact for peer support. Resource Tip: Listen to the 'Sustainability Leaders' podcast to hear real-life transition stories.",
+        "How can I overcome fear of failure when changing careers?":
+            "Insight: Failure is feedback, not defeat. Every professional pivot includes uncertainty. Sustainability fields reward adaptability and persistence. Next Step: Reflect on learning milestones from setbacks and share insights publicly. Resource Tip: Read 'Grit' by Angela Duckworth for long-term resilience mindset building.",
+        "What can I do when I feel my sustainability efforts don’t make an impact?":
+            "Insight: Individual contributions are building blocks of systemic change. Shift focus from control to contribution. Next Step: Collaborate with local organizations to visualize collective outcomes. Resource Tip: Join Climate Action Tracker to measure global policy progress and link your work contextually.",
+        "How do I stay confident when others don’t value green careers?":
+            "Insight: Confidence grows from evidence-based conviction. Green jobs now outpace fossil sectors in growth and profitability. Next Step: Equip yourself with data showcasing sustainability ROI to advocate effectively. Resource Tip: Access the ILO Green Jobs Programme for proof-driven narratives.",
+        "How can I find like-minded people who share my mission?":
+            "Insight: Belonging amplifies commitment. Connect through social innovation networks, hackathons, and sustainability hubs. Next Step: Join Slack communities like 'Work on Climate'. Resource Tip: Explore the Impact Hub Global directory to find changemakers.",
+        "How do I manage stress from trying to make a difference?":
+            "Insight: Sustainability work can feel emotionally heavy. Practice balance through structured rest and reflection. Next Step: Schedule non-digital downtime and eco-anxiety workshops. Resource Tip: Follow Mindful Earth’s mental wellbeing toolkit.",
+        "What is the best way to maintain long-term passion for sustainability?":
+            "Insight: Passion matures when tied to learning. Diversify exposure—alternate technical learning with community engagement. Next Step: Set annual reflection goals tied to global events (Earth Day, COP). Resource Tip: Explore the Pachamama Alliance for purpose renewal.",
+        "How can I celebrate small wins on this journey?":
+            "Insight: Gratitude and recognition fuel sustainable motivation. Share milestones publicly to normalize slow progress. Next Step: Keep a monthly reflection tracker. Resource Tip: Try Habitica to gamify your achievements and sustain engagement."
+    }
+}
+
+
+def render():
+    st.markdown("<h2 class='gl-title'>🤖 Green Coach Chat</h2>", unsafe_allow_html=True)
+    st.caption("Your personal AI sustainability mentor — choose your coach, ask questions, and receive tailored, thoughtful insights to guide your green career journey.")
+
+    # -----------------------------
+    # 🌿 Role Selection (Card UI)
+    # -----------------------------
+    st.markdown("### 🧭 Choose Your Coach")
+
+    cols = st.columns(3)
+    selected_role = st.session_state.get("selected_role", None)
+
+    for i, (role, desc) in enumerate(roles.items()):
+        with cols[i]:
+            selected = " gl-coach-selected" if st.session_state.get("selected_role") == role else ""
+            st.markdown(
+                f"""
+                <div class="gl-coach{selected}">
+                    <h4>{role}</h4>
+                    <p>{desc}</p>
+                </div>
+                """, unsafe_allow_html=True
+            )
+            if st.button(role):
+                st.session_state.selected_role = role
+                st.session_state.chat_history = []  # 清空历史
+
+    selected_role = st.session_state.get("selected_role", None)
+
+    # -----------------------------
+    # 💬 Display Questions
+    # -----------------------------
+    if selected_role:
+        chat(selected_role)
+
+
+@st.fragment
+def chat(selected_role):
+    """Question picker and chat history; asking a question reruns only this fragment."""
+    st.markdown(f"#### 🌱 You are chatting with: **{selected_role}**")
+
+    # 用户选择问题
+    user_question = st.selectbox("💭 Choose a question:", questions[selected_role])
+
+    if "chat_history" not in st.session_state:
+        st.session_state.chat_history = []
+
+    # 模拟提问：问题和回答一起记进历史
+    if st.button("Ask Green Coach", use_container_width=True):
+        st.session_state.chat_history.append(("user", user_question))
+        answer = responses[selected_role].get(user_question, "I’m processing this request, please try again.")
+        st.session_state.chat_history.append(("coach", answer))
+
+    # -----------------------------
+    # 💬 Display Chat History (Bubble UI)
+    # -----------------------------
+    if st.session_state.chat_history:
+        st.markdown("---")
+    for sender, msg in st.session_state.chat_history:
+        if sender == "user":
+            st.markdown(
+                f"""
+                <div class="gl-bubble gl-bubble-user">
+                👤 <b>You:</b> {msg}
+                </div>
+                """, unsafe_allow_html=True)
+        else:
+            st.markdown(
+                f"""
+                <div class="gl-bubble gl-bubble-coach">
+                🤖 <b>Green Coach:</b><br>{msg.replace('Insight:', '<b>Insight:</b>').replace('Next Step:', '<br><b>Next Step:</b>').replace('Resource Tip:', '<br><b>Resource Tip:</b>')}
+                </div>
+                """, unsafe_allow_html=True)
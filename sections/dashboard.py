@@ -0,0 +1,139 @@
+"""Section 6: Dashboard (Upgraded Smart Version)."""
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from instrumentation import timer
+
+
+def render():
+    st.markdown("""
+    <div class='gl-banner-soft'>
+        <h2>📊 My Green Career Dashboard</h2>
+        <p>AI-driven insights into your learning journey, growth potential, and sustainability readiness.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # -----------------------------
+    # 🌿 Overview Summary
+    # -----------------------------
+    st.markdown("### 🌿 Overview Summary")
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Skill Alignment", "82%", "↑ 5% vs last month")
+    col2.metric("Career Readiness", "Intermediate", "🚀 Progressing")
+    col3.metric("Sustainability Impact", "High", "+12% community engagement")
+
+    st.progress(0.82)
+    st.caption("Your profile shows strong momentum toward green career alignment, combining data-driven skills and sustainability values.")
+
+    st.markdown("---")
+
+    # -----------------------------
+    # 🧠 Skill Progress vs Market Demand
+    # -----------------------------
+    st.markdown("### 🧠 Skill Progress vs Market Demand")
+
+    skills = ["Data Analysis", "Carbon Accounting", "ESG Reporting", "AI for Sustainability", "Stakeholder Engagement"]
+    user_level = [78, 65, 58, 71, 84]
+    market_avg = [70, 75, 63, 68, 80]
+
+    df_skill = pd.DataFrame({
+        "Skill": skills,
+        "User": user_level,
+        "Market": market_avg
+    })
+
+    with timer("dashboard.charts"):
+        chart = alt.Chart(df_skill.melt('Skill')).mark_bar().encode(
+            x=alt.X('Skill:N', title=None),
+            y=alt.Y('value:Q', title='Proficiency (%)'),
+            color=alt.Color('variable:N', scale=alt.Scale(range=['#52b788', '#95d5b2']), legend=alt.Legend(title="Comparison")),
+            tooltip=['Skill', 'variable', 'value']
+        ).properties(height=300)
+        st.altair_chart(chart, use_container_width=True)
+
+    # -----------------------------
+    # 🧠 1. Dynamic AI Insight Summary
+    # -----------------------------
+    avg_skill = np.mean(user_level)
+    weakest = skills[np.argmin(user_level)]
+    strongest = skills[np.argmax(user_level)]
+    improvement_gap = abs(user_level[np.argmin(user_level)] - market_avg[np.argmin(user_level)])
+
+    ai_summary = f"""
+    **AI Insight:** Your average skill alignment is **{avg_skill:.0f}%**, showing steady progress across domains.
+    Your strongest area is **{strongest}**, exceeding the market average by {user_level[np.argmax(user_level)] - market_avg[np.argmax(user_level)]}%.
+    However, **{weakest}** lags behind market standards by {improvement_gap}%, which presents an immediate upskilling opportunity.
+
+    **Next Step:** Allocate focused learning time toward {weakest}, especially through project-based practice and mentorship.
+
+    **Resource Tip:** Explore the *UN SDG Learning Hub* or *LinkedIn Learning ESG Series* for short, applied modules that build both technical and strategic green expertise.
+    """
+    st.info(ai_summary)
+
+    st.markdown("---")
+
+    # -----------------------------
+    # 🎯 Career Path Progress + Growth Forecast
+    # -----------------------------
+    st.markdown("### 🎯 Career Path Progress & Growth Forecast")
+
+    timeline = pd.DataFrame({
+        'Stage': ['30 Days', '60 Days', '90 Days'],
+        'Completion': [85, 60, 35]
+    })
+
+    with timer("dashboard.charts"):
+        chart_timeline = alt.Chart(timeline).mark_bar(color='#1b4332').encode(
+            x='Stage',
+            y='Completion',
+            tooltip=['Stage', 'Completion']
+        ).properties(height=250)
+        st.altair_chart(chart_timeline, use_container_width=True)
+
+    # Growth forecast simulation
+    growth = np.polyfit([0, 30, 60, 90], [80, 82, 85, 89], 1)
+    predicted = [growth[0]*x + growth[1] for x in [30, 60, 90]]
+
+    forecast_df = pd.DataFrame({
+        "Timeline (Days)": ["30", "60", "90"],
+        "Predicted Match Score": predicted
+    })
+
+    with timer("dashboard.charts"):
+        chart_forecast = alt.Chart(forecast_df).mark_line(point=True, color="#2E8B57").encode(
+            x="Timeline (Days)",
+            y="Predicted Match Score",
+            tooltip=["Timeline (Days)", "Predicted Match Score"]
+        ).properties(height=250)
+
+        st.altair_chart(chart_forecast, use_container_width=True)
+    st.caption("📈 Based on your current learning rate, you’re projected to reach 90% green career readiness within the next three months.")
+
+    st.markdown("---")
+
+    # -----------------------------
+    # 🧭 3. Smart Action Recommendations
+    # -----------------------------
+    st.markdown("### 🧭 Smart AI Recommendations")
+
+    st.success(f"""
+    **Priority Focus:** {weakest}  
+    **Why it matters:** This skill bridges technical capacity with sustainability impact — a growing requirement in future leadership roles.  
+
+    **Suggested Actions:**  
+    - Join a short-term applied workshop on {weakest}  
+    - Apply your learning to a micro-project (e.g., local carbon offset analysis or energy audit simulation)  
+    - Network with professionals through sustainability LinkedIn groups or the Green Jobs Asia Forum  
+
+    **Resource Tip:** Explore *Google Sustainability Learning*, *UN Climate Academy*, or *Coursera’s Green Tech Track* to gain structured learning paths.  
+    """)
+
+    st.info("""
+    💬 *Insight:* Balancing technical depth with social awareness is key to thriving in the next decade of green transformation.  
+    Sustainability leaders are those who integrate systems thinking with innovation and empathy.
+    """)
+
+    st.markdown("---")
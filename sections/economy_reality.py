@@ -0,0 +1,189 @@
+"""Section 7: Green Economy Reality."""
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from instrumentation import timer
+
+
+@st.fragment
+def roi_calculator():
+    """ROI inputs and metric; moving a slider reruns only this fragment."""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        career = st.selectbox(
+            "Choose a Green Career",
+            ["ESG Analyst", "Renewable Engineer", "Climate Policy Advisor", "Sustainability Data Specialist"]
+        )
+    with col2:
+        years = st.slider("Years of Experience", 1, 10, 3)
+    with col3:
+        skill_level = st.select_slider("Skill Level", ["Beginner", "Intermediate", "Advanced"])
+
+    base_income = {
+        "ESG Analyst": 70000,
+        "Renewable Engineer": 72000,
+        "Climate Policy Advisor": 68000,
+        "Sustainability Data Specialist": 74000
+    }
+    impact_factor = {"Beginner": 1.1, "Intermediate": 1.3, "Advanced": 1.6}
+
+    roi = int(base_income[career] * impact_factor[skill_level] * (1 + (years * 0.07)))
+    st.metric("💵 Estimated 5-Year ROI (USD)", f"{roi:,}")
+
+
+def render():
+    st.markdown("<h2 class='gl-title'>🌍 Green Economy Reality</h2>", unsafe_allow_html=True)
+    st.caption("Explore how sustainable careers offer long-term financial, social, and environmental value.")
+    st.markdown("---")
+
+    # 1️⃣ Salary Comparison
+    st.subheader("💰 Green Career Salary Visualizer")
+
+    salary_df = pd.DataFrame({
+        "Industry": [
+            "Renewable Energy", "Sustainability Consulting", "ESG Investment",
+            "Oil & Gas", "Mining", "Manufacturing"
+        ],
+        "Average Annual Salary (USD)": [68000, 72000, 75000, 83000, 91000, 87000],
+        "Category": ["Green", "Green", "Green", "Traditional", "Traditional", "Traditional"]
+    })
+
+    with timer("economy_reality.charts"):
+        chart_salary = alt.Chart(salary_df).mark_bar().encode(
+            x=alt.X("Industry:N", sort=None, title="Industry"),
+            y=alt.Y("Average Annual Salary (USD):Q"),
+            color=alt.Color("Category:N",
+                scale=alt.Scale(domain=["Green", "Traditional"], range=["#52b788", "#adb5bd"])
+            ),
+            tooltip=["Industry", "Average Annual Salary (USD)", "Category"]
+        ).properties(height=350)
+
+        st.altair_chart(chart_salary, use_container_width=True)
+
+    st.info("""
+    💡 *Insight:* While traditional industries may start with slightly higher salaries,
+    green careers often provide faster growth, stronger stability, and global mobility.
+    Professionals in renewable energy or ESG roles report higher job satisfaction and
+    long-term income resilience due to expanding global regulations and innovation demand.
+    """)
+
+    st.markdown("---")
+
+    # 2️⃣ Growth & Stability Index
+    st.subheader("📈 Career Stability and Growth Index")
+
+    roles = [
+        "Renewable Energy Engineer", "ESG Analyst",
+        "Circular Economy Designer", "Mining Project Manager"
+    ]
+    stability = [8.6, 9.1, 8.4, 4.3]
+    growth = [9.3, 8.8, 9.0, 4.7]
+
+    index_df = pd.DataFrame({"Role": roles, "Stability": stability, "Growth": growth})
+    with timer("economy_reality.charts"):
+        chart_index = alt.Chart(index_df.melt("Role")).mark_line(point=True).encode(
+            x="Role:N",
+            y="value:Q",
+            color="variable:N",
+            tooltip=["Role", "value", "variable"]
+        ).properties(height=350)
+
+        st.altair_chart(chart_index, use_container_width=True)
+    st.success("""
+    📊 Green professions consistently demonstrate higher stability and growth scores
+    due to policy incentives, technological integration, and long-term societal demand.
+    """)
+
+    st.markdown("---")
+
+    # 3️⃣ ROI Calculator
+    st.subheader("📊 Green ROI (Return on Impact) Calculator")
+
+    roi_calculator()
+    st.caption("Includes both financial growth and environmental impact value estimation over 5 years.")
+    st.markdown("---")
+
+    # 4️⃣ Real Voices
+    st.subheader("🎤 Real Voices from the Field")
+
+    stories = [
+        {
+            "name": "🌱 Lina — From Finance to ESG Investing",
+            "story": "After 5 years in corporate finance, Lina transitioned into ESG investing. She discovered that sustainable portfolios outperform in market resilience and provide stronger personal fulfillment."
+        },
+        {
+            "name": "🔋 Arjun — Energy Engineer Turned Innovator",
+            "story": "Arjun left a mining project to work on solar microgrids in rural Indonesia. His income stabilized, and his work now powers 4,000 homes sustainably."
+        },
+        {
+            "name": "🌾 Mei — Circular Designer in Manufacturing",
+            "story": "Mei joined a circular design lab focusing on zero-waste production. Her creative freedom and industry recognition grew faster than any past corporate role."
+        }
+    ]
+
+    for s in stories:
+        with st.expander(s["name"], expanded=False):
+            st.write(s["story"])
+            st.caption("💬 Each story demonstrates how passion for sustainability aligns with both career growth and social value.")
+
+    st.markdown("---")
+
+
+    # 5️⃣ Future Green Career Trends (2035 Outlook)
+    st.subheader("🔮 Future Green Career Trends 2035")
+
+    st.caption("A forward look into how sustainable careers will transform over the next decade.")
+
+    # Simulated data for visualization
+    trend_data = pd.DataFrame({
+        "Year": list(range(2025, 2036)),
+        "Renewable Energy": [45, 48, 52, 57, 63, 70, 78, 86, 92, 97, 100],
+        "Circular Economy": [30, 35, 42, 50, 59, 69, 80, 89, 94, 98, 100],
+        "Climate Tech": [20, 25, 33, 45, 55, 68, 78, 90, 97, 99, 100],
+        "ESG Analytics": [25, 30, 38, 47, 56, 64, 74, 83, 91, 96, 100]
+    })
+
+    # Melt for Altair
+    trend_df = trend_data.melt("Year", var_name="Sector", value_name="Growth Index")
+
+    # Create growth line chart
+    with timer("economy_reality.charts"):
+        chart_trend = alt.Chart(trend_df).mark_line(point=True).encode(
+            x=alt.X("Year:O"),
+            y=alt.Y("Growth Index:Q", title="Relative Growth Index (2025=Base)"),
+            color=alt.Color("Sector:N", scale=alt.Scale(scheme="greens")),
+            tooltip=["Sector", "Year", "Growth Index"]
+        ).properties(height=350)
+
+        st.altair_chart(chart_trend, use_container_width=True)
+
+    st.info("""
+    🌱 *Insight:*  
+    Between 2025 and 2035, the **fastest-growing green sectors** will include Climate Tech,
+    ESG Analytics, and Renewable Energy.  
+    The demand for data-driven sustainability professionals, circular design thinkers,
+    and climate innovators will expand dramatically as governments and industries align with
+    net-zero targets and global green financing standards.
+    """)
+
+    # Regional focus text (no chart, for smoother performance)
+    st.success("""
+    🌏 *Regional Outlook:*  
+    By 2035, **Southeast Asia** is projected to become a global hub for sustainable innovation.
+    Cities like **Singapore**, **Jakarta**, and **Ho Chi Minh City** will lead in renewable manufacturing,
+    while emerging economies such as **Vietnam** and **Philippines** will specialize in green digital services
+    and eco-infrastructure startups.  
+    The youth generation will play a critical role in driving these transitions.
+    """)
+
+    # Closing message
+    st.caption("📈 Use these insights to align your learning and career path toward future-proof green opportunities.")
+    st.markdown("---")
+
+    # 5️⃣ Closing Insight
+    st.info("""
+    🌍 The future economy rewards resilience, creativity, and systems thinking.
+    Green industries are not just about environmental protection—they represent
+    the next frontier of innovation, profitability, and purpose-driven work.
+    """)
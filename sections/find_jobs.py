@@ -0,0 +1,321 @@
+"""Section 1: Find Green Jobs (Dropdown City + Smart Search)."""
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import streamlit as st
+
+import exports
+from caching import get_cache
+from instrumentation import timer
+from query_engine import get_engine, split_skills
+from recommender import recommend
+from salary import format_amount
+
+
+NEARBY_KM = 1500
+JOBS_PER_PAGE = 10
+CARD_FIELDS = ["Role", "Company", "City", "Category", "KeySkills", "MatchScore"]
+DETAIL_FIELDS = ["JobDescription", "SalaryRange", "CareerPath", "Apprenticeship", "SupportPrograms"]
+# 排序方式 -> (QueryEngine.sort 字段, 是否降序)
+SORT_MODES = {
+    "Best match": ("MatchScore", True),
+    "Highest salary": ("Salary", True),
+    "Newest": ("Newest", True),
+    "City (A–Z)": ("City", False),
+    "Company (A–Z)": ("Company", False),
+}
+
+
+# --- Helper: Random Career Stage ---
+def random_stage():
+    return random.choice(["Entry Level", "Mid Career", "Advanced"])
+
+
+# --- Style Helper for Tag (classes in theme.py) ---
+def stage_class(stage):
+    return {"Entry Level": "gl-stage-entry", "Mid Career": "gl-stage-mid", "Advanced": "gl-stage-advanced"}[stage]
+
+
+def facet_label(value, counts):
+    return value if value == "All" else f"{value} ({counts.get(value, 0):,})"
+
+
+def use_suggestion():
+    """Pill callback: the picked completion becomes the keyword."""
+    picked = st.session_state.get("find_jobs_suggestion")
+    if picked:
+        st.session_state.find_jobs_keyword = picked
+    st.session_state.find_jobs_suggestion = None
+
+
+def role_icon(role):
+    icon = "🌱"
+    if "Engineer" in role: icon = "⚙️"
+    elif "Analyst" in role: icon = "📊"
+    elif "Manager" in role: icon = "🧭"
+    elif "Research" in role: icon = "🔬"
+    elif "Consultant" in role: icon = "🤝"
+    return icon
+
+
+# -----------------------------
+# 卡片 HTML（跨 session 缓存）
+# -----------------------------
+def card_html(row, catalog):
+    """Job card markup for one ``itertuples`` row, cached per job and catalog version."""
+    def compute():
+        stage = random_stage()
+        icon = role_icon(row.Role)
+        return f"""
+            <div class='gl-job-card'>
+                <div class='gl-job-body'>
+                    <h3>{icon} {row.Role}</h3>
+                    <p><b>🏢 Company:</b> {row.Company}</p>
+                    <p><b>📍 City:</b> {row.City} <b>💼 Category:</b> {row.Category}</p>
+                    <p class='gl-job-skills'><b>🎯 Key Skills:</b> {row.KeySkills}</p>
+                    <progress value='{row.MatchScore}' max='100'></progress>
+                </div>
+                <span class='gl-stage {stage_class(stage)}'>{stage}</span>
+            </div>
+            """
+
+    return get_cache("cards").get_or_compute((catalog, "card", row.Index), compute)
+
+
+def progression_text(roles):
+    return " · ".join(f"{r['role']} ({r['steps']} step{'s' if r['steps'] > 1 else ''})" for r in roles)
+
+
+def detail_html(engine, row):
+    """Detail panel markup for catalog row ``row``; the detail columns are only read when a card is opened."""
+    index = engine.index
+
+    def compute():
+        job = index.records([row], ["Role"] + DETAIL_FIELDS)[0]
+        # 职业路径图的查表结果：这个岗位往后能走到哪、从哪些岗位能走到这里
+        graph = engine.career_graph()
+        leads_to, leads_from = graph.leads_to(job["Role"]), graph.leads_from(job["Role"])
+        progression = "".join([
+            f"<p><b>🧭 Where this role can lead:</b> {progression_text(leads_to)}</p>" if leads_to else "",
+            f"<p><b>🪜 How to get here:</b> from {progression_text(leads_from)}</p>" if leads_from else "",
+        ])
+        return f"""
+                <div class='gl-job-detail'>
+                    <p><b>💡 Job Description:</b><br>{job['JobDescription']}</p>
+                    <p><b>💰 Salary Range:</b> {job['SalaryRange']}</p>
+                    <p><b>📈 Career Path:</b><br>{job['CareerPath']}</p>
+                    {progression}
+                    <p><b>🧭 Apprenticeship Program:</b> {job['Apprenticeship']}</p>
+                    <p><b>🤝 Support Programs:</b> {job['SupportPrograms']}</p>
+                </div>
+                """
+
+    return get_cache("cards").get_or_compute((index.key, "detail", row), compute)
+
+
+# -----------------------------
+# 排序 + 分页 + 卡片列表（fragment：换排序、翻页只重跑这一块）
+# -----------------------------
+@st.fragment
+def job_cards(engine, filtered_rows, scores, copies=None):
+    """Sort control, pager and the visible page of job cards for already filtered and ranked ``filtered_rows``.
+
+    ``copies`` (per near-duplicate cluster) are the matching postings each card stands for.
+    """
+    index = engine.index
+    col_sort, col_page = st.columns([1, 1])
+    mode = col_sort.selectbox("↕️ Sort by", list(SORT_MODES), key="find_jobs_sort")
+    field, descending = SORT_MODES[mode]
+    # 有画像时传进来的行已按个人分数排好
+    if scores is None or field != "MatchScore":
+        with timer("find_jobs.sort"):
+            filtered_rows = engine.sort(filtered_rows, field, descending)
+
+    total_pages = math.ceil(len(filtered_rows) / JOBS_PER_PAGE)
+    page = col_page.number_input("Page", min_value=1, max_value=max(total_pages, 1), value=1, step=1)
+
+    start_idx = (page - 1) * JOBS_PER_PAGE
+    page_rows = filtered_rows[start_idx:start_idx + JOBS_PER_PAGE]
+    page_jobs = index.frame(page_rows, CARD_FIELDS)
+
+    # --- Job Cards Display ---
+    # 详情面板按需加载：展开时才运行里面的代码（也只重跑这个 fragment）
+    with timer("find_jobs.render_cards"):
+        for row, job_id in zip(page_jobs.itertuples(), index.posting_ids(page_rows)):
+            st.markdown(card_html(row, index.key), unsafe_allow_html=True)
+            if scores is not None:
+                st.progress(int(scores[row.Index]) / 100, text=f"🎯 Your match: {int(scores[row.Index])}%")
+            if copies is not None:
+                more = int(copies[index.duplicates().cluster[row.Index]]) - 1
+                if more > 0:
+                    st.caption(f"🗂️ Also listed {more:,} more time{'s' if more > 1 else ''} (near-duplicates hidden)")
+
+            with st.expander("📘 View Full Job Details", key=f"job_detail_{job_id}", on_change="rerun") as details:
+                if details.open:
+                    st.markdown(detail_html(engine, row.Index), unsafe_allow_html=True)
+
+
+def render():
+    with timer("find_jobs.load"):
+        engine = get_engine()
+        index = engine.index
+
+    # --- Header ---
+    st.markdown("""
+    <div class='gl-banner'>
+        <h2>🌿 Find Your Green Career Path</h2>
+        <p>Empowering Southeast Asian youth to explore accessible, meaningful, and growth-oriented sustainable jobs.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.write("")
+
+    # --- City Dropdown ---
+    # 城市列表来自目录里实际出现的地点，带上当前关键词 / 最低薪资下的岗位数；
+    # 没有岗位的城市不列出（当前选中的除外）
+    state = st.session_state
+    city_counts = engine.location_counts(state.get("find_jobs_keyword", ""), min_salary=state.get("find_jobs_min_salary"))
+    cities = ["All"] + [c for c in engine.filter_options()[0] if c in city_counts or c == state.get("find_jobs_city")]
+    col1, col2, col3 = st.columns([1.2, 2.0, 1.2])
+    with col1:
+        city = st.selectbox("🏙️ Select City", cities, key="find_jobs_city", format_func=lambda c: facet_label(c, city_counts))
+        nearby = st.checkbox(f"🧭 Include cities within {NEARBY_KM:,} km", disabled=city == "All")
+        dedupe = st.checkbox("🗂️ Hide near-duplicate postings", value=True, key="find_jobs_dedupe")
+    with col2:
+        keyword = st.text_input("🔎 Search by Role, Skill, or Company", placeholder="e.g., Energy, Data, ESG...",
+                                key="find_jobs_keyword")
+        # 输入提示：按岗位数排序的补全（角色 / 公司 / 类别 / 技能）
+        suggestions = [c["text"] for c in engine.complete(keyword, k=5) if c["text"].lower() != keyword.strip().lower()]
+        if suggestions:
+            st.pills("✨ Suggestions", suggestions, key="find_jobs_suggestion", on_change=use_suggestion,
+                     label_visibility="collapsed")
+    with col3:
+        min_salary = st.selectbox("💰 Minimum Salary", [None] + engine.salary_thresholds(),
+                                  format_func=lambda v: "Any" if v is None else "≥ " + format_amount(v), key="find_jobs_min_salary")
+
+    # --- Filter Logic ---
+    # 只用行号和索引数组计算，页面上只取当前页的数据
+    filtered_rows = engine.search(city, keyword, min_salary=min_salary, within_km=NEARBY_KM if nearby else None)
+
+    # --- No Results → Recovery (spelling, relaxed filters, popular openings) ---
+    if len(filtered_rows) == 0:
+        filtered_rows, note = engine.recover(city, keyword, min_salary=min_salary, within_km=NEARBY_KM if nearby else None)
+        st.warning(f"⚠️ No exact matches found. {note['message']}")
+
+    total_jobs = len(filtered_rows)
+
+    # --- Personalized Match Score (profile from Match My Skills) ---
+    with timer("find_jobs.personalize"):
+        scores = engine.personal_scores(st.session_state.get("profile"))
+        if scores is not None:
+            filtered_rows = engine.sort(filtered_rows, "MatchScore", scores=scores)
+    match_scores = index.match_score if scores is None else scores
+
+    # --- Near-duplicates (clustered at catalog build / ingestion): one card per cluster ---
+    copies = None
+    if dedupe and total_jobs > 0:
+        with timer("find_jobs.dedupe"):
+            copies = engine.duplicate_counts(filtered_rows)
+            filtered_rows = engine.collapse_duplicates(filtered_rows)
+        hidden, total_jobs = total_jobs - len(filtered_rows), len(filtered_rows)
+        if hidden:
+            st.caption(f"🗂️ {hidden:,} near-duplicate postings hidden — each card stands for its cluster.")
+
+    # --- Summary metrics ---
+    st.markdown("### 🌱 Market Snapshot")
+    if scores is not None:
+        st.caption("🎯 Ranked by your Match My Skills profile — Match Scores are personal.")
+    with timer("find_jobs.aggregate"):
+        avg_match = round(float(match_scores[filtered_rows].mean()), 2) if total_jobs > 0 else "—"
+        active_cities = len(np.unique(index.codes["City"][filtered_rows])) if total_jobs > 0 else "—"
+    col_a, col_b, col_c = st.columns(3)
+    col_a.metric("Total Opportunities", total_jobs)
+    col_b.metric("Your Average Match" if scores is not None else "Average Match Score", avg_match)
+    col_c.metric("Active Cities", active_cities)
+
+    with st.expander("💰 Salary Distribution"):
+        with timer("find_jobs.aggregate"):
+            salary_counts = engine.salary_counts(filtered_rows)
+        st.bar_chart(salary_counts, sort=False)
+
+    # --- Export (built in chunks only when clicked) ---
+    fields = index.columns
+    header = ["id"] + fields
+    col_csv, col_xlsx, _ = st.columns([1, 1, 4])
+    col_csv.download_button(
+        "⬇️ Export CSV",
+        exports.download_data(lambda: exports.iter_csv(header, exports.catalog_chunks(index, filtered_rows, fields))),
+        file_name="green_jobs.csv", mime=exports.CSV_MIME, on_click="ignore", key="find_jobs_export_csv",
+    )
+    col_xlsx.download_button(
+        "⬇️ Export Excel",
+        exports.download_data(lambda: exports.iter_xlsx([("Green Jobs", header, exports.catalog_chunks(index, filtered_rows, fields))])),
+        file_name="green_jobs.xlsx", mime=exports.XLSX_MIME, on_click="ignore", key="find_jobs_export_xlsx",
+    )
+
+    st.markdown("<hr class='gl-divider'>", unsafe_allow_html=True)
+
+    # --- View Mode Switch ---
+    if "view_all" not in st.session_state:
+        st.session_state.view_all = False
+
+    # --- Pagination + Job Cards (works for both modes) ---
+    job_cards(engine, filtered_rows, scores, copies)
+
+
+    # --- Context Section ---
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("""
+    <div class='gl-callout'>
+    <h4>🌍 Why This Matters</h4>
+    <p>
+    By making green jobs visible, guided, and aspirational, this platform helps Southeast Asian youth access real sustainable pathways.  
+    Even if they start small — through apprenticeships or short-term training — each step makes sustainability an achievable career reality. 🌱
+    </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # -----------------------------
+    # 🧠 AI Recommendation Section
+    # -----------------------------
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("### 🤖 AI Recommendation")
+
+    # Build the context
+    city_context = f"in {city}" if city != "All" else "across Asia-Pacific"
+    keyword_context = keyword if keyword.strip() else "sustainability careers"
+
+    # 相似岗位：排在最前的一页结果 + 搜索词的 TF-IDF 向量，在整个目录里找最近邻
+    # （不跟随翻页，这样翻页只需要重跑卡片 fragment）
+    with timer("find_jobs.recommend"):
+        top_rows = filtered_rows[:JOBS_PER_PAGE]
+        similar_rows, similar_scores = recommend(index, top_rows, keyword, k=5, exclude=top_rows)
+        similar_jobs = index.records(similar_rows, ["Role", "Company", "City", "Category", "KeySkills"])
+
+    if not similar_jobs:
+        st.info("No similar roles to suggest yet — try a broader search.")
+        return
+
+    focus_categories = ", ".join(c for c, _ in Counter(job["Category"] for job in similar_jobs).most_common(2))
+    focus_skills = ", ".join(s for s, _ in Counter(s for job in similar_jobs for s in split_skills(job["KeySkills"])).most_common(3))
+    similar_items = "".join(
+        f"<li>{role_icon(job['Role'])} <b>{job['Role']}</b> — {job['Company']}, {job['City']} "
+        f"<span class='gl-similar'>({score:.0%} similar)</span></li>"
+        for job, score in zip(similar_jobs, similar_scores)
+    )
+
+    # Generate contextual recommendation
+    ai_reco = f"""
+    <div class='gl-callout gl-callout-raised'>
+    <h4>💬 Recommended Focus Area</h4>
+    <p>
+    Based on your interest in <b>{keyword_context}</b> {city_context}, 
+    the closest roles in the catalog cluster around <b>{focus_categories}</b> 
+    and ask for <b>{focus_skills}</b>.
+    </p>
+    <p>🔗 Similar roles you might also consider:</p>
+    <ul>{similar_items}</ul>
+    </div>
+    """
+    st.markdown(ai_reco, unsafe_allow_html=True)
@@ -0,0 +1,448 @@
+"""Section 3: 30/60/90 Career Path (Full Multi-Skill Version)."""
+import streamlit as st
+
+import exports
+from query_engine import get_engine
+
+
+# 各技能完整内容
+plans = {
+    "Data Analysis": {
+        "30": """
+        <b>First 30 Days — Build Data Awareness</b><br><br>
+        Begin with foundational tools like Excel and Python to clean and organize sustainability datasets.  
+        Focus on real environmental metrics such as carbon emissions, waste data, or water consumption trends.  
+        Use online open resources like UNEP and “Our World in Data” to develop confidence reading complex datasets.  
+        Your goal is not to master code yet, but to start thinking in terms of data-driven questions.
+        """,
+        "60": """
+        <b>Next 60 Days — Apply Analytical Thinking</b><br><br>
+        Learn how to visualize patterns and extract insights.  
+        Build interactive dashboards using Power BI or Tableau to track renewable adoption or plastic waste flows.  
+        Join a Kaggle competition or a community hackathon to test your skills.  
+        This period transforms you from a learner into a practical data storyteller.
+        """,
+        "90": """
+        <b>Final 90 Days — Translate Data into Action</b><br><br>
+        Combine technical and communication skills.  
+        Write a short sustainability report using your visualizations, focusing on a country or company’s progress.  
+        Present your findings on social media or in a small group.  
+        You now possess a concrete data portfolio demonstrating analytical and impact-driven capabilities.
+        """
+    },
+
+    "Carbon Accounting": {
+        "30": """
+        <b>First 30 Days — Understand the Carbon System</b><br><br>
+        Study the GHG Protocol, ISO 14064, and ESG concepts.  
+        Focus on how organizations quantify emissions in Scope 1, 2, and 3.  
+        Build small exercises: estimate your own footprint using online calculators.  
+        Begin to appreciate the link between measurement and corporate responsibility.
+        """,
+        "60": """
+        <b>Next 60 Days — Learn Reporting Practices</b><br><br>
+        Use mock company data to create carbon emission tables.  
+        Practice using Excel to calculate reduction baselines.  
+        Study how reports align with frameworks like CDP or TCFD.  
+        Reflect on ethical implications — how transparency builds trust in sustainable business.
+        """,
+        "90": """
+        <b>Final 90 Days — Build a Showcase Portfolio</b><br><br>
+        Create a simplified carbon audit for a company or school.  
+        Include visualization of results and proposed mitigation strategies.  
+        You’ll finish with a portfolio that signals readiness for ESG and carbon management roles.
+        """
+    },
+
+    "Renewable Energy": {
+        "30": """
+        <b>First 30 Days — Explore the Energy Transition</b><br><br>
+        Learn the science behind solar PV, wind turbines, and hydro systems.  
+        Use interactive online tools like PVWatts to simulate energy production.  
+        Read regional renewable adoption reports from ASEAN and IRENA.  
+        Understand energy efficiency as a bridge between climate goals and real solutions.
+        """,
+        "60": """
+        <b>Next 60 Days — Build Applied Knowledge</b><br><br>
+        Work on a simple renewable project — calculate payback period for solar installation or efficiency gains in lighting.  
+        Understand how policy incentives (feed-in tariffs, subsidies) drive market demand.  
+        Network with sustainability forums to connect theory and application.
+        """,
+        "90": """
+        <b>Final 90 Days — Create Your Renewable Case</b><br><br>
+        Write a case study analyzing a successful clean energy transition.  
+        Include both economic and social perspectives.  
+        Present your project in class or online — demonstrating both technical and storytelling skills.
+        """
+    },
+
+    "AI for Sustainability": {
+        "30": """
+        <b>First 30 Days — Learn AI Fundamentals</b><br><br>
+        Study how AI models support environmental monitoring, such as deforestation detection and emission tracking.  
+        Learn Python basics and machine learning concepts.  
+        Focus on environmental data applications, not complex coding yet.  
+        You’re setting a foundation to connect AI logic with sustainability challenges.
+        """,
+        "60": """
+        <b>Next 60 Days — Start Building</b><br><br>
+        Use small datasets to predict patterns — for example, energy demand or pollution spread.  
+        Experiment with open libraries like TensorFlow or PyTorch.  
+        Collaborate in online hackathons for green AI innovation.  
+        You are now learning how data and ethics intersect.
+        """,
+        "90": """
+        <b>Final 90 Days — Showcase AI for Impact</b><br><br>
+        Document your work in a clear case study.  
+        Publish a short article or visual demo highlighting environmental outcomes your model supports.  
+        Focus on accessibility — explain complex ideas simply.  
+        You now embody the role of a sustainability innovator.
+        """
+    },
+
+    "Circular Design": {
+        "30": """
+        <b>First 30 Days — Rethink Waste</b><br><br>
+        Learn lifecycle thinking — how products move from creation to disposal.  
+        Identify pain points in current design processes and where waste can become value.  
+        Study global examples like Loop or Terracycle to understand circular innovation.
+        """,
+        "60": """
+        <b>Next 60 Days — Create Low-Waste Solutions</b><br><br>
+        Sketch redesigns for common items — a refillable bottle, biodegradable packaging, or reuse systems.  
+        Prototype small ideas using recycled materials or design software.  
+        Engage peers for quick feedback.
+        """,
+        "90": """
+        <b>Final 90 Days — Share Your Circular Vision</b><br><br>
+        Prepare a visual presentation of your project.  
+        Communicate the social and environmental impact clearly.  
+        Apply to student competitions or local circular hackathons.  
+        You now act as a designer for regeneration, not consumption.
+        """
+    },
+
+    "Smart Mobility": {
+        "30": """
+        <b>First 30 Days — Learn Mobility Ecosystems</b><br><br>
+        Research how cities integrate public transport, cycling, and electric mobility.  
+        Understand how sustainable transport reduces emissions and improves equality.  
+        Watch case videos from Singapore and Copenhagen.
+        """,
+        "60": """
+        <b>Next 60 Days — Map and Model Change</b><br><br>
+        Use GIS or simulation tools to visualize mobility data.  
+        Conduct small surveys about commuting behavior.  
+        Start thinking about incentives — how to shift user habits from cars to green modes.
+        """,
+        "90": """
+        <b>Final 90 Days — Design Mobility Solutions</b><br><br>
+        Develop a mini proposal — such as bike-sharing networks or smart transit.  
+        Present the idea to classmates or local NGOs.  
+        You are now shaping sustainable urban mobility narratives.
+        """
+    },
+
+    "Project Management": {
+        "30": """
+        <b>First 30 Days — Learn Green Project Basics</b><br><br>
+        Study Agile and design thinking principles.  
+        Begin managing small environmental awareness activities or campus projects.  
+        Reflect on how leadership works in sustainability teams.
+        """,
+        "60": """
+        <b>Next 60 Days — Coordinate Impact Work</b><br><br>
+        Plan and execute a sustainability event.  
+        Track resources, communicate timelines, and evaluate risks.  
+        Build communication rhythm with your team — this is real leadership practice.
+        """,
+        "90": """
+        <b>Final 90 Days — Lead and Reflect</b><br><br>
+        Compile your project outcomes and lessons learned.  
+        Create a one-page summary highlighting measurable impacts.  
+        Apply your learning to apply for sustainability program coordinator roles.
+        """
+    },
+
+    "Behavioral Change Design": {
+        "30": """
+        <b>First 30 Days — Study Human Habits</b><br><br>
+        Learn behavioral frameworks like Nudge Theory and Choice Architecture.  
+        Understand why people resist or adopt sustainable actions.  
+        Begin tracking your own behaviors as an experiment.
+        """,
+        "60": """
+        <b>Next 60 Days — Test Real Interventions</b><br><br>
+        Design small behavior-change challenges, e.g., “Plastic-Free Week.”  
+        Measure participation and collect feedback.  
+        You’re now testing social influence in sustainability.
+        """,
+        "90": """
+        <b>Final 90 Days — Evaluate and Communicate</b><br><br>
+        Document your process and results.  
+        Reflect on emotional, social, and cognitive barriers.  
+        Share findings in a short article or infographic.  
+        You are now able to link behavioral science with environmental design.
+        """
+    },
+
+    "Sustainable Finance": {
+        "30": """
+        <b>First 30 Days — Learn ESG Investment Basics</b><br><br>
+        Understand how finance can enable green transitions.  
+        Study ESG standards, SDG investment frameworks, and key KPIs.  
+        Follow green bond news to see capital flow into impact sectors.
+        """,
+        "60": """
+        <b>Next 60 Days — Analyze Real Financial Impact</b><br><br>
+        Review sustainability reports and identify investment priorities.  
+        Learn tools like SASB or IRIS+ to assess social and environmental returns.  
+        Practice interpreting case studies on renewable or circular startups.
+        """,
+        "90": """
+        <b>Final 90 Days — Build a Green Investment Proposal</b><br><br>
+        Simulate an investment case with projected ROI and SDG impact.  
+        Present it as a “pitch deck” to mentors or classmates.  
+        You now bridge the gap between finance and sustainability action.
+        """
+    },
+
+    "Environmental Policy": {
+        "30": """
+        <b>First 30 Days — Understand Global Frameworks</b><br><br>
+        Study the Paris Agreement, SDGs, and ASEAN sustainability commitments.  
+        Identify how policies influence green industry transitions.  
+        Learn how local regulation translates into corporate change.
+        """,
+        "60": """
+        <b>Next 60 Days — Evaluate Local Implementation</b><br><br>
+        Pick one policy (like renewable incentives) and analyze how it works in practice.  
+        Interview community members or businesses.  
+        This develops critical thinking on system change.
+        """,
+        "90": """
+        <b>Final 90 Days — Design a Policy Proposal</b><br><br>
+        Write a short recommendation paper on improving existing policies.  
+        Highlight trade-offs and fairness.  
+        Share with university networks or NGOs — you are now a policy innovator.
+        """
+    }
+}
+
+# 单技能建议
+next_step_single = {
+    "Data Analysis": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    Developing a career in <b>Data Analysis for Sustainability</b> requires both technical literacy and ethical interpretation.  
+    Over the coming months, you should apply your quantitative skills to social and environmental datasets, moving beyond descriptive analytics into predictive modeling.  
+    Focus on understanding causal relationships, uncertainty, and data ethics — these competencies differentiate analytical technicians from evidence-based decision-makers.  
+    Participating in open-data sustainability projects and publishing applied research will help you translate numbers into real-world influence.  
+    </div>
+    """,
+
+    "Carbon Accounting": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    Advancing in <b>Carbon Accounting</b> involves moving from numerical reporting toward strategic sustainability insight.  
+    You should focus on understanding the interdependence between corporate behavior, regulation, and transparency mechanisms such as ESG reporting.  
+    In-depth study of carbon offset frameworks and lifecycle emissions can position you as a credible professional capable of integrating environmental metrics into business logic.  
+    This skill maturity supports future leadership in sustainable finance and climate disclosure strategy.  
+    </div>
+    """,
+
+    "Renewable Energy": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    With growing renewable knowledge, your next step is to integrate <b>technical design</b> and <b>systemic policy</b> perspectives.  
+    Deepen understanding of energy economics and community participation models.  
+    Engage in interdisciplinary research exploring the feasibility of localized solar or wind microgrids.  
+    This synthesis between engineering and governance equips you to contribute to equitable and scalable clean energy transitions across Southeast Asia.  
+    </div>
+    """,
+
+    "AI for Sustainability": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    Your focus should now shift toward designing explainable and ethically responsible AI systems for sustainability applications.  
+    Consider integrating environmental data into supervised learning pipelines, emphasizing interpretability and bias mitigation.  
+    Publishing results in open-source repositories can amplify your professional credibility.  
+    At this level, your goal is to demonstrate how intelligent systems can improve environmental monitoring and support policy innovation responsibly.  
+    </div>
+    """,
+
+    "Circular Design": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    As a <b>Circular Designer</b>, your next goal is to operationalize theory through systemic experimentation.  
+    Explore collaborations with manufacturers, focusing on materials innovation, reverse logistics, and life-cycle optimization.  
+    Research on behavioral economics and design psychology will further enhance your ability to influence sustainable consumption patterns.  
+    Combining creativity with measurable sustainability impact defines leadership in this emerging discipline.  
+    </div>
+    """,
+
+    "Smart Mobility": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    To advance in <b>Smart Mobility</b>, move beyond infrastructure to behavioral and data perspectives.  
+    Use mobility analytics to evaluate commuter patterns and policy effectiveness.  
+    Focus on integrating clean transport technology with social inclusion.  
+    Your long-term professional maturity lies in designing urban mobility ecosystems that merge equity, safety, and carbon efficiency.  
+    </div>
+    """,
+
+    "Project Management": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    As a sustainability-oriented project manager, your emphasis should now be on systems leadership and evidence-based evaluation.  
+    Study agile methodologies adapted for climate innovation and impact assessment.  
+    Learning to balance stakeholder communication, financial accountability, and ecological value will enable you to manage high-complexity sustainability programs.  
+    Documenting results transparently strengthens institutional learning and policy advocacy.  
+    </div>
+    """,
+
+    "Behavioral Change Design": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    The next academic leap involves mastering evaluation design for behavioral interventions.  
+    Learn advanced social psychology, data collection, and ethics of influence.  
+    Combining qualitative research with digital communication strategies can expand your reach.  
+    At this stage, your focus should be on measurable impact — shaping long-term habits rather than short-term change.  
+    </div>
+    """,
+
+    "Sustainable Finance": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    Strengthen your analytical and ethical foundation by connecting finance with climate science.  
+    Engage in carbon pricing simulation, impact valuation, and ESG materiality assessment.  
+    Understanding the interplay between risk management and social return on investment will prepare you for leadership in sustainable financial innovation.  
+    Join academic communities focused on impact measurement to expand your research lens.  
+    </div>
+    """,
+
+    "Environmental Policy": """
+    <div class="gl-next-step">
+    <b>AI Academic Recommendation:</b><br><br>
+    Your progression in <b>Environmental Policy</b> should now target analytical depth and diplomatic communication.  
+    Focus on policy impact evaluation and negotiation mechanisms within global governance.  
+    Develop cross-sector understanding of law, economics, and behavioral sciences.  
+    Publish policy briefs or opinion essays to strengthen your voice as a researcher-practitioner influencing equitable transitions.  
+    </div>
+    """
+}
+
+
+def plan_blocks(selected_skills, proficiency):
+    """The generated plan as ``exports.iter_pdf`` blocks."""
+    blocks = [("h1", "30/60/90 Career Growth Plan"), ("p", f"Current proficiency: {proficiency}")]
+    for skill in selected_skills:
+        blocks.append(("h2", f"{skill} Growth Path"))
+        blocks += [("p", exports.html_to_text(plans[skill][phase])) for phase in ["30", "60", "90"]]
+    return blocks
+
+
+def render():
+    st.markdown("<h2 class='gl-title'>🎯 AI-Powered 30/60/90 Career Growth Pathway</h2>", unsafe_allow_html=True)
+    st.caption("Each selected skill generates a structured 3-phase development plan designed for Southeast Asian youth entering green careers.")
+    st.divider()
+
+    # Step 1: 选择技能
+    st.markdown("### 🧩 Step 1. Select up to Two Skills to Build On")
+    selected_skills = st.multiselect(
+        "Choose your key sustainability skills (max 2):",
+        [
+            "Data Analysis", "Carbon Accounting", "Renewable Energy", "AI for Sustainability",
+            "Circular Design", "Smart Mobility", "Project Management",
+            "Behavioral Change Design", "Sustainable Finance", "Environmental Policy"
+        ],
+        max_selections=2
+    )
+
+    proficiency = st.select_slider(
+        "Select your current proficiency level:",
+        options=["Beginner", "Intermediate", "Advanced", "Expert"]
+    )
+
+    st.markdown("<p class='gl-note'><i>💡 Mastery grows from focus — select one or two skills to specialize in, and commit to consistency.</i></p>", unsafe_allow_html=True)
+
+    # Step 2: 生成成长路径
+    if st.button("✨ Generate My 30/60/90 Growth Plan", use_container_width=True):
+        if not selected_skills:
+            st.warning("Please select at least one skill to continue.")
+        else:
+            st.markdown("---")
+            st.markdown("### 🌱 Your Personalized AI-Generated Learning Roadmap")
+
+            # -----------------------------
+            # 展示生成结果
+            # -----------------------------
+            for skill in selected_skills:
+                st.markdown(f"<h3 class='gl-title gl-spaced'>💡 {skill} Growth Path</h3>", unsafe_allow_html=True)
+                for phase in ["30", "60", "90"]:
+                    st.markdown(f"""
+                    <div class="gl-phase">
+                        {plans[skill][phase]}
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            st.success("🌱 Each pathway offers a structured route from awareness to action — choose consistency over intensity for sustainable growth.")
+
+            st.download_button(
+                "⬇️ Download Plan (PDF)", exports.download_data(lambda: exports.iter_pdf("30/60/90 Growth Plan", plan_blocks(selected_skills, proficiency))),
+                file_name="green_growth_plan.pdf", mime=exports.PDF_MIME, on_click="ignore", key="growth_path_export_pdf",
+            )
+
+    # -----------------------------
+    # 📘 AI Suggested Next Step 模块（独立版，缩进已统一）
+    # -----------------------------
+    st.markdown("---")
+    st.markdown("<h3 class='gl-heading'>📘 AI Suggested Next Step</h3>", unsafe_allow_html=True)
+
+    # 如果只选择一个技能
+    if len(selected_skills) == 1:
+        st.markdown(next_step_single[selected_skills[0]], unsafe_allow_html=True)
+
+    # 如果选择两个技能，生成融合总结
+    elif len(selected_skills) == 2:
+        s1, s2 = selected_skills
+        combined_text = f"""
+        <div class="gl-next-step-combined">
+        <b>AI Integrated Academic Recommendation:</b><br><br>
+        By integrating <b>{s1}</b> and <b>{s2}</b>, you are building a hybrid expertise that reflects the interdisciplinary nature of future sustainability professions.  
+        You should now design a project that merges the quantitative and qualitative dimensions of green transformation — for instance, using {s1.lower()} to inform or enhance {s2.lower()} outcomes.  
+        Such integration nurtures strategic foresight, systems reasoning, and creative leadership.  
+        Your 90-day goal should be to prototype a real-world application linking both domains and document how this synthesis can reduce systemic barriers to sustainable innovation.  
+        This meta-level capacity for connecting tools, people, and impact is precisely what defines next-generation sustainability leadership.  
+        </div>
+        """
+        st.markdown(combined_text, unsafe_allow_html=True)
+
+    if selected_skills:
+        suggestions = get_engine().next_skills(selected_skills, k=1)
+        if suggestions:
+            item = suggestions[0]
+            reason = (f"{item['confidence']:.0%} of postings asking for your skills also want it" if item["associated"]
+                      else f"it is requested in {item['share']:.0%} of current postings")
+            st.info(f"📈 Next skill to add to your plan: **{item['skill']}** — {reason}.")
+
+    # -----------------------------
+    # 🧭 角色进阶路线（职业路径图，直接查预先算好的表）
+    # -----------------------------
+    graph = get_engine().career_graph()
+    if len(graph):
+        st.markdown("---")
+        st.markdown("<h3 class='gl-heading gl-spaced'>🧭 Plan Your Role Progression</h3>", unsafe_allow_html=True)
+        col_from, col_to = st.columns(2)
+        start = col_from.selectbox("Where are you now?", sorted(graph.names), key="growth_path_role_from")
+        reachable = graph.leads_to(start)
+        if not reachable:
+            st.info(f"**{start}** is the last step of its career paths in the current catalog.")
+        else:
+            target = col_to.selectbox("Where do you want to go?", [r["role"] for r in reachable], key="growth_path_role_to")
+            route = graph.route(start, target)
+            steps = len(route) - 1
+            st.markdown(" → ".join(f"**{role}**" for role in route) + f" ({steps} step{'s' if steps > 1 else ''})")
+            st.caption("Reachable from here: " + ", ".join(f"{r['role']} ({r['steps']})" for r in reachable))
+
+    st.success("🌿 Your AI-guided academic recommendation translates learning into professional strategy.")
@@ -0,0 +1,238 @@
+"""Section 2: Match My Skills (Optimized Stable Version)."""
+import streamlit as st
+
+from instrumentation import timer
+from query_engine import get_engine
+
+
+# --- 1️⃣ 预设技能池 ---
+skill_pool = [
+    "Data Analysis", "Public Speaking", "Renewable Energy", "Climate Literacy", "Project Management",
+    "Communication", "Creativity", "Social Media", "Leadership", "Research", "ESG Reporting", "Carbon Accounting",
+    "Graphic Design", "Engineering", "Problem Solving", "Community Engagement", "AI & Technology",
+    "Sustainable Finance", "Circular Economy", "Environmental Awareness"
+]
+
+levels = ["Beginner", "Intermediate", "Advanced", "Expert"]
+
+# --- 4️⃣ 匹配职业数据库 ---
+job_database = [
+    {"Role": "ESG Analyst", "Skills": ["Data Analysis", "ESG Reporting", "Carbon Accounting"], "Stage": "Mid Career"},
+    {"Role": "Sustainability Consultant", "Skills": ["Project Management", "Climate Literacy", "Leadership"], "Stage": "Advanced Stage"},
+    {"Role": "Community Engagement Officer", "Skills": ["Communication", "Public Speaking", "Community Engagement"], "Stage": "Entry Level"},
+    {"Role": "Green Data Analyst", "Skills": ["Data Analysis", "AI & Technology", "Sustainable Finance"], "Stage": "Mid Career"},
+    {"Role": "Renewable Engineer", "Skills": ["Engineering", "Renewable Energy", "Problem Solving"], "Stage": "Advanced Stage"},
+    {"Role": "Climate Policy Assistant", "Skills": ["Research", "Environmental Awareness", "Climate Literacy"], "Stage": "Entry Level"},
+    {"Role": "Eco Marketing Specialist", "Skills": ["Creativity", "Social Media", "Communication"], "Stage": "Mid Career"},
+    {"Role": "Circular Economy Coordinator", "Skills": ["Circular Economy", "Project Management", "Problem Solving"], "Stage": "Mid Career"},
+    {"Role": "Sustainable Finance Advisor", "Skills": ["Sustainable Finance", "Leadership", "Data Analysis"], "Stage": "Advanced Stage"}
+]
+
+# 固定技能热度榜
+skill_popularity = {
+    "Data Analysis": 95,
+    "Project Management": 88,
+    "Sustainable Finance": 83,
+    "AI & Technology": 80,
+    "Climate Literacy": 78,
+    "Communication": 75,
+    "Leadership": 72,
+    "Renewable Energy": 70,
+    "Circular Economy": 68,
+    "Community Engagement": 65
+}
+
+
+@st.fragment
+def proficiency(selected_skills):
+    """Proficiency sliders, readiness score and the stored skill profile.
+
+    Only this block depends on the levels, so moving a slider reruns just
+    this fragment.
+    """
+    st.markdown("### ⚙️ Rate Your Skill Proficiency")
+    user_levels = {}
+    for skill in selected_skills:
+        user_levels[skill] = st.select_slider(f"{skill} proficiency level:", options=levels)
+    # 技能画像给 Find Green Jobs 的个性化匹配分用
+    st.session_state["profile"] = user_levels
+    st.caption("🎯 Find Green Jobs now ranks postings and computes Match Scores against this skill profile.")
+
+    # --- 3️⃣ 自动计算 Green Readiness Score ---
+    avg_level_index = sum(levels.index(v) for v in user_levels.values()) / len(user_levels)
+    readiness_score = int((avg_level_index + 1) * 25)
+    if readiness_score < 40:
+        career_stage = "Entry Level"
+    elif readiness_score < 70:
+        career_stage = "Mid Career"
+    else:
+        career_stage = "Advanced Stage"
+
+    st.markdown(f"<h4 class='gl-title'>🌿 Green Readiness Score: {readiness_score}/100</h4>", unsafe_allow_html=True)
+    st.progress(readiness_score / 100)
+    st.caption(f"Current Stage: **{career_stage}** — Keep growing your sustainable skillset!")
+
+
+def render():
+    st.markdown("""
+    <div class='gl-banner'>
+        <h2>🧠 Match My Skills</h2>
+        <p>Discover how your unique abilities align with sustainable career opportunities.</p>
+    </div>
+    """, unsafe_allow_html=True)        
+
+    selected_skills = st.multiselect("🎯 Choose your skills:", skill_pool)
+
+    if not selected_skills:
+        st.info("💡 Please select at least one skill to continue.")
+        st.session_state.pop("profile", None)   # 技能清空后 Find Green Jobs 不再按旧画像打分
+        st.stop()
+
+    # --- 2️⃣ 熟练度等级 + 3️⃣ Green Readiness Score ---
+    proficiency(selected_skills)
+
+    def match_score(job):
+        overlap = len(set(selected_skills) & set(job["Skills"]))
+        return overlap
+
+    with timer("match_skills.rank"):
+        ranked_jobs = sorted(job_database, key=match_score, reverse=True)[:5]
+
+    st.markdown("### 💼 Recommended Green Career Matches")
+    for job in ranked_jobs:
+        overlap = set(selected_skills) & set(job["Skills"])
+        missing = set(job["Skills"]) - set(selected_skills)
+        st.markdown(f"""
+        <div class='gl-role-card'>
+            <div class='gl-role-head'>
+                <h4>🌱 {job['Role']}</h4>
+                <span class='gl-role-stage'>{job['Stage']}</span>
+            </div>
+            <p>
+            Matched Skills: <b>{', '.join(overlap) if overlap else 'N/A'}</b><br>
+            Missing Skills: <b>{', '.join(missing) if missing else 'None'}</b>
+            </p>
+            <p class='gl-role-sdg'>💡 This role contributes to SDG13 & SDG8.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # --- 5️⃣ 缺失技能总结 + 建议 ---
+    missing_all = set()
+    for job in ranked_jobs:
+        missing_all.update(set(job["Skills"]) - set(selected_skills))
+
+    st.markdown("### 🧩 Skill Gaps & Next Steps")
+    if missing_all:
+        st.warning(f"To progress further, consider developing: {', '.join(missing_all)}")
+        st.info("🎓 Try exploring short courses, mentorship programs, or Green Apprenticeships to close these gaps.")
+    else:
+        st.success("🌟 Excellent! You have strong alignment with multiple green career paths.")
+
+    # 用目录里的技能共现（lift / PMI）推荐下一个最值得学的技能
+    with timer("match_skills.next_skills"):
+        next_skills = get_engine().next_skills(selected_skills)
+    if next_skills:
+        st.markdown("#### 📈 Next Most Valuable Skills to Learn")
+        based_on = next_skills[0]["based_on"]
+        if not based_on:
+            st.caption("None of your skills appear in current postings yet, so these are simply the most requested skills.")
+        else:
+            if set(based_on) - set(selected_skills):
+                st.caption(f"Based on the catalog skills closest to yours: {', '.join(based_on)}.")
+            if not any(item["associated"] for item in next_skills):
+                st.caption("No skill is asked for alongside yours more often than average, "
+                           "so these are simply the most requested skills.")
+        for item in next_skills:
+            if item["associated"]:
+                reason = (f"{item['confidence']:.0%} of postings that ask for your skills also want it "
+                          f"(lift {item['lift']:.2f}, PMI {item['pmi']:+.2f})")
+            else:
+                reason = f"requested in {item['share']:.0%} of current postings"
+            st.markdown(f"- **{item['skill']}** — {reason}")
+
+    # -----------------------------
+    # 📊 Compare with Market Demand (Smart Filtered + Expandable)
+    # -----------------------------
+    st.markdown("---")
+    st.markdown("### 📊 Compare with Market Demand")
+    st.caption("Discover how your selected skills compare with the most in-demand green job skills across Asia-Pacific.")
+
+    # -----------------------------
+    # 智能展示逻辑
+    # -----------------------------
+    matched_skills = [s for s in selected_skills if s in skill_popularity]
+    if matched_skills:
+        display_list = [(s, skill_popularity[s]) for s in matched_skills]
+        st.markdown("#### 🌱 Skills You Already Have (Ranked by Market Demand)")
+    else:
+        display_list = list(skill_popularity.items())[:3]
+        st.markdown("#### 🌱 Top 3 Most In-Demand Sustainability Skills")
+
+    for skill, score in display_list:
+        heat_level = (
+            "🔥 High Demand" if score >= 85 else
+            "🌿 Medium Demand" if score >= 75 else
+            "🌾 Emerging Skill"
+        )
+        match = "✅ You already have this skill" if skill in selected_skills else "✨ Highly Recommended to Learn"
+        have = " gl-skill-have" if skill in selected_skills else ""
+
+        st.markdown(
+            f"""
+            <div class='gl-skill{have}'>
+                <h5>{skill}</h5>
+                <p>{heat_level} • Popularity Index: {score}</p>
+                <div class='gl-skill-bar' style='width:{score}%'></div>
+                <p class='gl-skill-match'>{match}</p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # 折叠完整榜单
+    with st.expander("📈 View Full Market Ranking"):
+        for skill, score in skill_popularity.items():
+            heat_level = (
+                "🔥 High Demand" if score >= 85 else
+                "🌿 Medium Demand" if score >= 75 else
+                "🌾 Emerging Skill"
+            )
+            match = "✅ You already have this skill" if skill in selected_skills else "✨ Not in your skillset"
+            have = " gl-skill-have" if skill in selected_skills else ""
+            st.markdown(
+                f"""
+                <div class='gl-skill gl-skill-compact{have}'>
+                    <h6>{skill}</h6>
+                    <p>{heat_level} • Popularity Index: {score}</p>
+                    <div class='gl-skill-bar' style='width:{score}%'></div>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+
+    # -----------------------------
+    # 💡 Insight Summary
+    # -----------------------------
+    st.markdown("### 💡 Insight Summary")
+
+    top_user_skills = [s for s in selected_skills if s in skill_popularity.keys()]
+    if top_user_skills:
+        top_text = ", ".join(top_user_skills[:3])
+        score = round(len(top_user_skills) / len(skill_popularity) * 100)
+        st.success(
+            f"Your selected skills ({top_text}) align with {score}% of the most in-demand sustainability skills. "
+            "You're already positioned for strong career potential in green innovation and ESG transformation."
+        )
+    else:
+        st.info(
+            "Your current skillset doesn’t overlap with top sustainability capabilities yet. "
+            "Start by developing Data Analysis, Project Management, or Climate Literacy to enter this fast-growing field."
+        )
+
+    # -----------------------------
+    # 🌍 Overall Skill Fit
+    # -----------------------------
+    st.markdown("### 🌍 Overall Skill Alignment")
+    alignment = round(len(top_user_skills) / len(skill_popularity) * 100) if top_user_skills else 20
+    st.progress(alignment / 100)
+    st.caption(f"Overall Market Fit: {alignment}%")
@@ -0,0 +1,196 @@
+"""Section 4: Smart Summary (Final Clean Version)."""
+import html
+
+import streamlit as st
+
+import exports
+from instrumentation import timer
+from query_engine import get_engine
+
+
+def facet_options(values, counts, selected):
+    """``All`` plus the values that still have postings (and the current choice)."""
+    return ["All"] + [v for v in values if v in counts or v == selected]
+
+
+def facet_label(value, counts):
+    return value if value == "All" else f"{value} ({counts.get(value, 0):,})"
+
+
+def render():
+    with timer("smart_summary.load"):
+        engine = get_engine()
+
+    st.markdown("<h2 class='gl-title'>🌍 Smart Sustainability Career Insight Hub</h2>", unsafe_allow_html=True)
+    st.caption("A reliable, elegant, and fully functional analytics dashboard for green careers.")
+
+    # ========= Filters =========
+    st.markdown("### 🎯 Customize Your View")
+    # 每个选项后面是在另外两个筛选条件下的岗位数；会得到空结果的选项不列出（当前选中的除外）
+    state = st.session_state
+    facets = engine.facets(state.get("smart_summary_city"), state.get("smart_summary_skill"),
+                           state.get("smart_summary_category"))
+    city_options, skill_options, category_options = engine.filter_options()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        selected_city = st.selectbox("🏙️ City", facet_options(city_options, facets["City"], state.get("smart_summary_city")),
+                                     key="smart_summary_city", format_func=lambda v: facet_label(v, facets["City"]))
+    with col2:
+        selected_skill = st.selectbox("🧠 Skill", facet_options(skill_options, facets["Skill"], state.get("smart_summary_skill")),
+                                      key="smart_summary_skill", format_func=lambda v: facet_label(v, facets["Skill"]))
+    with col3:
+        selected_category = st.selectbox("🌱 Category",
+                                         facet_options(category_options, facets["Category"], state.get("smart_summary_category")),
+                                         key="smart_summary_category", format_func=lambda v: facet_label(v, facets["Category"]))
+
+    summary = engine.summary(selected_city, selected_skill, selected_category)
+    if summary is None:
+        st.warning("⚠️ No data found for this filter. Try another combination.")
+        st.stop()
+
+    # ========= Overview Cards =========
+    total_jobs = summary["total_jobs"]
+    avg_score = summary["avg_score"]
+    active_cities = summary["active_cities"]
+
+    st.markdown(f"""
+    <div class='gl-stats'>
+        <div class='gl-stat gl-stat-jobs'>
+            <h3>📈 {total_jobs}</h3>
+            <p>Total Opportunities</p>
+        </div>
+        <div class='gl-stat gl-stat-score'>
+            <h3>{avg_score}</h3>
+            <p>Average Match Score</p>
+        </div>
+        <div class='gl-stat gl-stat-cities'>
+            <h3>{active_cities}</h3>
+            <p>Active Cities</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # ========= Charts =========
+    try:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### 🌆 Top Cities by Job Count")
+            city_counts = summary["city_counts"]
+            with timer("smart_summary.charts"):
+                st.bar_chart(city_counts)
+
+        with col2:
+            st.markdown("#### 💼 Leading Job Categories")
+            cat_counts = summary["cat_counts"]
+            with timer("smart_summary.charts"):
+                st.bar_chart(cat_counts)
+    except Exception as e:
+        st.error(f"Chart error: {e}")
+
+    st.markdown("---")
+
+    try:
+        col3, col4 = st.columns(2)
+        with col3:
+            st.markdown("#### 🔑 Most In-Demand Skills")
+            skill_counts = summary["skill_counts"]
+            with timer("smart_summary.charts"):
+                st.bar_chart(skill_counts)
+
+        with col4:
+            st.markdown("#### 📊 Average Match Score by Category")
+            avg_scores = summary["avg_scores"]
+            with timer("smart_summary.charts"):
+                st.line_chart(avg_scores)
+    except Exception as e:
+        st.error(f"Data error: {e}")
+
+    st.markdown("#### 💰 Salary Distribution")
+    with timer("smart_summary.charts"):
+        st.bar_chart(summary["salary_counts"], sort=False)
+
+    # ========= Export =========
+    col_csv, col_xlsx, _ = st.columns([1, 1, 4])
+    col_csv.download_button(
+        "⬇️ Export CSV", exports.download_data(lambda: exports.summary_csv(summary)),
+        file_name="green_summary.csv", mime=exports.CSV_MIME, on_click="ignore", key="smart_summary_export_csv",
+    )
+    col_xlsx.download_button(
+        "⬇️ Export Excel", exports.download_data(lambda: exports.iter_xlsx(exports.summary_sheets(summary))),
+        file_name="green_summary.xlsx", mime=exports.XLSX_MIME, on_click="ignore", key="smart_summary_export_xlsx",
+    )
+
+    # ========= AI Summary =========
+    st.markdown("---")
+    st.markdown("### 🤖 AI Insight Summary")
+
+    # 洞察随 summary 一起缓存，这里只负责渲染
+    result = summary["insights"]
+    if not result["insights"]:
+        st.info("Not enough postings in this view for market insights yet.")
+    for item in result["insights"]:
+        st.markdown(
+            f"<div class='gl-insight'><b>{html.escape(item['title'])}</b><br>{html.escape(item['text'])}</div>",
+            unsafe_allow_html=True,
+        )
+
+    # ========= SMART ACTION SUGGESTIONS (Final Refined UI with Split Titles) =========
+    st.markdown("---")
+    st.markdown("<h3 class='gl-heading'>🧭 Smart Action Suggestions</h3>", unsafe_allow_html=True)
+    st.markdown("<p class='gl-note'>Recommendations drawn from the insights above to help you act and advance your sustainability career.</p>", unsafe_allow_html=True)
+
+    # Dynamic subtitle
+    st.markdown(
+        f"<div class='gl-filter-note'>"
+        f"Based on your filters: <b>{selected_city}</b> | <b>{selected_skill}</b> | <b>{selected_category}</b></div>",
+        unsafe_allow_html=True
+    )
+
+    # --- Text content ---
+    learning_title = "🎓 Learning Path"
+    learning_body = html.escape(result["actions"]["learning"])
+
+    networking_title = "🤝 Networking"
+    networking_body = html.escape(result["actions"]["networking"])
+
+    career_title = "🚀 Career Move"
+    career_body = html.escape(result["actions"]["career"])
+
+    # --- Card layout ---
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(
+            f"<div class='gl-action-card'>"
+            f"<div class='gl-action-title'>{learning_title}</div>"
+            f"<div class='gl-action-body'>{learning_body}</div>"
+            f"</div>",
+            unsafe_allow_html=True
+        )
+
+    with col2:
+        st.markdown(
+            f"<div class='gl-action-card'>"
+            f"<div class='gl-action-title'>{networking_title}</div>"
+            f"<div class='gl-action-body'>{networking_body}</div>"
+            f"</div>",
+            unsafe_allow_html=True
+        )
+
+    with col3:
+        st.markdown(
+            f"<div class='gl-action-card'>"
+            f"<div class='gl-action-title'>{career_title}</div>"
+            f"<div class='gl-action-body'>{career_body}</div>"
+            f"</div>",
+            unsafe_allow_html=True
+        )
+
+    # --- Footer Tip ---
+    st.markdown(
+        "<p class='gl-tip'>💡 Tip: "
+        "You can integrate these actions into your <b>30/60/90 Career Plan</b> section for measurable learning, networking, and career impact goals.</p>",
+        unsafe_allow_html=True
+    )
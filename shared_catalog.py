@@ -0,0 +1,215 @@
+"""
+Shared, memory-mapped catalog for multi-process deployments.
+
+One builder process owns the catalog (generation plus feed ingestion) and
+writes every published version as a snapshot directory of ``.npy`` arrays
+(column codes, numeric columns, skill matrix, alive mask, posting ids,
+similar-jobs embeddings and near-duplicate clusters) and a small
+``meta.json`` (vocabularies, totals).
+``CURRENT`` names the latest snapshot and is replaced atomically after the
+snapshot is complete.
+
+App and API workers started with ``GREEN_LEAP_SHARED_CATALOG=<dir>`` map the
+arrays read-only with ``np.load(mmap_mode="r")``: the pages live once in the
+OS page cache no matter how many workers map them, so memory per node stays
+flat as workers are added. Workers check ``CURRENT`` every few seconds and
+remap when the builder publishes; old snapshots stay readable for workers
+still holding them (unlinked files remain mapped on POSIX).
+
+    python shared_catalog.py /srv/green-leap/catalog --feed-dir /srv/green-leap/feed
+    GREEN_LEAP_SHARED_CATALOG=/srv/green-leap/catalog streamlit run green_leap_app.py
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+
+import recommender
+from dedup import Duplicates
+
+SHARED_DIR_ENV = "GREEN_LEAP_SHARED_CATALOG"
+CURRENT_FILE = "CURRENT"
+RELOAD_INTERVAL = 2.0
+KEEP_SNAPSHOTS = 3
+
+
+def shared_dir():
+    return os.environ.get(SHARED_DIR_ENV) or None
+
+
+# -----------------------------
+# 写快照（builder 进程）
+# -----------------------------
+def write_snapshot(index, root, keep=KEEP_SNAPSHOTS):
+    """Write ``index`` as a new snapshot under ``root``, point ``CURRENT`` at it, return its name."""
+    os.makedirs(root, exist_ok=True)
+    name = f"snapshot-{time.strftime('%Y%m%d-%H%M%S')}-{time.monotonic_ns() % 10**9:09d}"
+    tmp = os.path.join(root, "." + name)
+    os.makedirs(tmp)
+
+    arrays = {"alive": index.alive, "match_score": index.match_score, "skill_matrix": index.skill_matrix}
+    arrays.update({f"codes.{column}": codes for column, codes in index.codes.items()})
+    arrays.update({f"numeric.{column}": values for column, values in index.numeric.items()})
+    if index.ids is not None:
+        arrays["ids"] = index.ids.astype(str)  # 定长 unicode，才能 mmap
+    embeddings = recommender.get_embeddings(index)  # 相似岗位向量离线算好，worker 直接映射
+    arrays.update({"embed.combo": embeddings.combo, "embed.vectors": embeddings.vectors, "embed.idf": embeddings.idf})
+    duplicates = index.duplicates()   # 近似重复的簇也一样
+    arrays.update({"dedup.cluster": duplicates.cluster, "dedup.representatives": duplicates.representatives,
+                   "dedup.sizes": duplicates.sizes})
+    for array_name, array in arrays.items():
+        np.save(os.path.join(tmp, array_name + ".npy"), np.ascontiguousarray(array))
+
+    meta = {
+        "key": [str(part) for part in index.key],
+        "columns": index.columns,
+        "vocab": index.vocab,
+        "skill_vocab": index.skill_vocab,
+        "has_ids": index.ids is not None,
+        "totals": _jsonable_totals(index.totals),
+        "previous_totals": _jsonable_totals(index.previous_totals),
+        "dedup_live_groups": duplicates.live_groups,
+    }
+    with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    os.rename(tmp, os.path.join(root, name))
+    pointer = os.path.join(root, CURRENT_FILE + ".tmp")
+    with open(pointer, "w", encoding="utf-8") as f:
+        f.write(name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer, os.path.join(root, CURRENT_FILE))
+    _prune(root, keep)
+    return name
+
+
+def _jsonable_totals(totals):
+    if totals is None:
+        return None
+    return {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in totals.items()}
+
+
+def _array_totals(totals):
+    if totals is None:
+        return None
+    return {k: np.asarray(v) if isinstance(v, list) else v for k, v in totals.items()}
+
+
+def _prune(root, keep):
+    snapshots = sorted(n for n in os.listdir(root) if n.startswith("snapshot-"))
+    for old in snapshots[:-keep]:
+        shutil.rmtree(os.path.join(root, old), ignore_errors=True)
+
+
+# -----------------------------
+# 只读映射（worker 进程）
+# -----------------------------
+def current_snapshot(root):
+    with open(os.path.join(root, CURRENT_FILE), encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def load_snapshot(root, name):
+    """``CatalogIndex`` over the memory-mapped arrays of snapshot ``name``."""
+    from query_engine import CatalogIndex
+
+    path = os.path.join(root, name)
+    with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+
+    def mapped(array_name):
+        return np.load(os.path.join(path, array_name + ".npy"), mmap_mode="r")
+
+    columns = meta["columns"]
+    codes = {c: mapped(f"codes.{c}") for c in columns if c in meta["vocab"]}
+    numeric = {c: mapped(f"numeric.{c}") for c in columns if c not in meta["vocab"]}
+    index = CatalogIndex.from_parts(
+        key=tuple(meta["key"]) + (name,), columns=columns, codes=codes, vocab=meta["vocab"], numeric=numeric,
+        match_score=mapped("match_score"), skill_vocab=meta["skill_vocab"], skill_matrix=mapped("skill_matrix"),
+        alive=mapped("alive"), ids=mapped("ids") if meta["has_ids"] else None,
+        totals=_array_totals(meta["totals"]), previous_totals=_array_totals(meta.get("previous_totals")),
+        duplicates=Duplicates.from_arrays(mapped("dedup.cluster"), mapped("dedup.representatives"),
+                                          mapped("dedup.sizes"), meta["dedup_live_groups"]),
+    )
+    index.embeddings = recommender.JobEmbeddings(mapped("embed.combo"), mapped("embed.vectors"), mapped("embed.idf"))
+    return index
+
+
+class MappedCatalog:
+    """Read-only stand-in for ``CatalogStore`` that follows the builder's snapshots."""
+
+    def __init__(self, root, reload_interval=RELOAD_INTERVAL):
+        from query_engine import QueryEngine
+
+        self._query_engine = QueryEngine
+        self.root = root
+        self.reload_interval = reload_interval
+        self.snapshot = current_snapshot(root)
+        self._engine = QueryEngine(load_snapshot(root, self.snapshot))
+        self._checked = time.monotonic()
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    @property
+    def engine(self):
+        if time.monotonic() - self._checked >= self.reload_interval and self._lock.acquire(blocking=False):
+            try:
+                self._checked = time.monotonic()
+                latest = current_snapshot(self.root)
+                if latest != self.snapshot:
+                    self._engine = self._query_engine(load_snapshot(self.root, latest))
+                    self.snapshot = latest
+                    self.reloads += 1
+            finally:
+                self._lock.release()
+        return self._engine
+
+    def apply(self, events):
+        raise RuntimeError("the shared catalog is read-only here; run ingestion in the builder process")
+
+    def stats(self):
+        index = self._engine.index
+        return {"rows": index.size, "live_rows": int(index.alive.sum()), "reloads": self.reloads}
+
+
+# -----------------------------
+# builder 命令行
+# -----------------------------
+class _PublishingStore:
+    """Wrap a ``CatalogStore`` so every applied batch is published as a snapshot."""
+
+    def __init__(self, store, root):
+        self.store = store
+        self.root = root
+
+    def apply(self, events):
+        applied = self.store.apply(events)
+        if applied:
+            write_snapshot(self.store.engine.index, self.root)
+        return applied
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and publish the shared Green Leap catalog")
+    parser.add_argument("root", help="snapshot directory that workers map (GREEN_LEAP_SHARED_CATALOG)")
+    parser.add_argument("--feed-dir", help="keep ingesting *.jsonl job-feed files and publish each batch")
+    args = parser.parse_args(argv)
+
+    os.environ.pop(SHARED_DIR_ENV, None)  # builder 自己始终用可写的目录
+    import ingest
+    from query_engine import get_store
+
+    store = get_store()
+    print(f"published {write_snapshot(store.engine.index, args.root)} ({store.engine.index.size} rows)")
+    if args.feed_dir:
+        asyncio.run(ingest.ingest_directory(args.feed_dir, _PublishingStore(store, args.root)))
+
+
+if __name__ == "__main__":
+    main()
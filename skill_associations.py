@@ -0,0 +1,91 @@
+"""
+Skill association mining over KeySkills.
+
+``CatalogIndex.totals["SkillPairs"]`` is the skill × skill co-occurrence
+matrix ``S.T @ S`` of the live postings (``S`` is the job × skill incidence
+matrix); its diagonal is how many postings ask for each skill. Ingestion keeps
+it current by subtracting the old and adding the new rows of every batch, so
+nothing here rescans the catalog.
+
+For a skill set ``A`` and a candidate skill ``b`` this module derives
+
+* support, the co-occurrences of ``b`` with the skills in ``A``,
+* confidence ``P(b | A)`` = support / postings asking for the skills in ``A``,
+* lift ``P(b | A) / P(b)`` and
+* PMI ``log2(lift)``,
+
+and ranks the skills worth learning next: positively associated skills
+(lift above 1 with at least ``MIN_PAIR_SUPPORT`` co-occurrences) by PMI, then,
+if that leaves room, the most requested skills, which are not marked as
+associated.
+"""
+import numpy as np
+
+from personalization import RELATED_SKILLS
+
+MIN_PAIR_SUPPORT = 2  # 共现次数低于这个不算关联
+
+
+class SkillAssociations:
+    """Co-occurrence counts of one catalog version."""
+
+    def __init__(self, pairs, count, skill_vocab):
+        self.skill_vocab = list(skill_vocab)
+        self.position = {s.lower(): i for i, s in enumerate(self.skill_vocab)}
+        self.count = int(count)
+        self.pairs = np.asarray(pairs, dtype=np.float64)
+        self.single = np.diag(self.pairs).copy()
+
+    def ids(self, skills):
+        """Vocabulary ids of ``skills`` known to the catalog (case-insensitive)."""
+        return [self.position[s.lower()] for s in skills if s.lower() in self.position]
+
+    def basis(self, skills):
+        """Vocabulary ids standing for ``skills``: their own, or for names the catalog does not use
+        (e.g. "Communication"), those of their ``personalization.RELATED_SKILLS``."""
+        found = set()
+        for skill in skills:
+            found.update(self.ids([skill] if skill.lower() in self.position else RELATED_SKILLS.get(skill, ())))
+        return sorted(found)
+
+    def next_skills(self, have, k=3):
+        """Skills to learn next, most valuable first.
+
+        Candidates positively associated with the skills in ``have`` (see
+        ``basis``) come first, highest PMI first, ties broken by support.
+        Remaining places go to the most requested skills with
+        ``"associated": False``; with no skill the catalog knows, that is the
+        whole list. ``based_on`` names the catalog skills the associations
+        were computed from.
+        """
+        known = self.basis(have)
+        candidates = np.setdiff1d(np.flatnonzero(self.single), known)
+        if not len(candidates):
+            return []
+        share = self.single[candidates] / self.count
+        if known:
+            support = self.pairs[known][:, candidates].sum(axis=0)
+            confidence = support / self.single[known].sum()
+            lift = confidence / share
+        else:
+            support, confidence, lift = np.zeros(len(candidates)), np.zeros(len(candidates)), np.ones(len(candidates))
+        pmi = np.log2(np.maximum(lift, 1e-9))
+        associated = (support >= MIN_PAIR_SUPPORT) & (lift > 1)
+        # 正相关的按 PMI 排在前面；不够 k 个时用最常被要求的技能补上
+        ranked = np.lexsort((-support, -pmi))
+        popular = np.lexsort((candidates, -share))
+        order = np.concatenate([ranked[associated[ranked]], popular[~associated[popular]]])[:k]
+        based_on = [self.skill_vocab[i] for i in known]
+        return [
+            {
+                "skill": self.skill_vocab[candidates[i]],
+                "postings": int(self.single[candidates[i]]),
+                "share": round(float(share[i]), 4),
+                "confidence": round(float(confidence[i]), 4),
+                "lift": round(float(lift[i]), 3),
+                "pmi": round(float(pmi[i]), 3),
+                "associated": bool(associated[i]),
+                "based_on": based_on,
+            }
+            for i in order
+        ]
@@ -0,0 +1,129 @@
+"""
+Shared stylesheet for the HTML blocks the sections render.
+
+Cards, bubbles, banners and bars used to carry their CSS inline, so every
+job card or chat bubble resent the same few hundred bytes of ``style='...'``
+on each rerun. The rules live here once instead and the markup only names
+classes (``gl-*``); values that really differ per element (a bar's width)
+stay inline.
+
+``inject()`` is called once at the top of every script run. ``st.html`` puts
+a style-only block in the event container, so it takes no room on the page,
+and fragment reruns (pager, chat, sliders) keep the block already on the
+page instead of sending it again.
+"""
+import re
+
+import streamlit as st
+
+RULES = """
+.gl-title { color:#2E8B57; }
+.gl-heading { color:#1b4332; }
+.gl-spaced { margin-top:25px; }   /* 跟在上一块内容后面的小节标题 */
+.gl-note { color:gray; font-size:14px; }
+.gl-divider { margin-top:10px; margin-bottom:10px; }
+
+/* 页首横幅 */
+.gl-hero { text-align:center; padding:80px 0; background:linear-gradient(to bottom, #edf8ef, white); border-radius:20px; }
+.gl-hero h1 { color:#2E8B57; font-size:48px; }
+.gl-hero h3 { color:#3c8c60; }
+.gl-hero p { color:gray; }
+.gl-banner { text-align:center; padding:25px; background:linear-gradient(to right, #e8f5e9, #ffffff); border-radius:15px; }
+.gl-banner h2 { color:#2E8B57; font-size:34px; }
+.gl-banner p { color:#4f6d54; font-size:15px; }
+.gl-banner-soft { padding:20px; background:linear-gradient(to bottom, #edf8ef, #ffffff); border-radius:15px; text-align:center; }
+.gl-banner-soft h2 { color:#2E8B57; }
+.gl-banner-soft p { color:#4b6043; }
+
+/* Find Green Jobs 岗位卡片 */
+.gl-job-card { background:#f9fff9; border:1px solid #cdeccd; border-radius:15px; padding:22px; margin-bottom:18px;
+               box-shadow:0 4px 10px rgba(0,0,0,0.06); display:flex; justify-content:space-between; align-items:center; }
+.gl-job-card .gl-job-body { flex:1; }
+.gl-job-card h3 { color:#1b4332; margin-bottom:6px; }
+.gl-job-card p { margin:0; font-size:15px; color:#2f4f4f; }
+.gl-job-card p.gl-job-skills { font-size:14px; color:#406040; }
+.gl-job-card progress { width:100%; height:12px; }
+.gl-stage { margin-left:15px; color:white; padding:4px 10px; border-radius:10px; font-size:12px; font-weight:bold; white-space:nowrap; }
+.gl-stage-entry { background:#66bb6a; }
+.gl-stage-mid { background:#43a047; }
+.gl-stage-advanced { background:#1b5e20; }
+.gl-job-detail { font-size:14px; color:#1c1c1c; }
+
+/* 说明 / 推荐框 */
+.gl-callout { background:#e8f5e9; padding:18px 20px; border-radius:12px; border-left:5px solid #2E8B57; }
+.gl-callout h4 { color:#2E8B57; }
+.gl-callout p { color:#3e5e4e; }
+.gl-callout ul { color:#2f4f4f; font-size:14px; }
+.gl-callout li { margin-bottom:6px; }
+.gl-callout-raised { background:#f0f9f4; border-radius:15px; box-shadow:0 3px 8px rgba(0,0,0,0.05); }
+.gl-similar { color:#66bb6a; font-size:12px; }
+
+/* Smart Summary */
+.gl-stats { display:flex; justify-content:space-around; margin:15px 0; }
+.gl-stat { padding:18px 25px; border-radius:10px; width:30%; text-align:center; }
+.gl-stat-jobs { background:#e8f5e9; }
+.gl-stat-jobs h3 { color:#2E8B57; }
+.gl-stat-score { background:#e0f2f1; }
+.gl-stat-score h3 { color:#00796b; }
+.gl-stat-cities { background:#f1f8e9; }
+.gl-stat-cities h3 { color:#33691e; }
+.gl-insight { background:#f9fff9; border-left:5px solid #2E8B57; padding:14px 18px; border-radius:10px; margin-bottom:10px; }
+.gl-filter-note { background:#f0fdf4; border-radius:8px; padding:8px 15px; margin-bottom:15px; color:#1b4332; font-size:14px; }
+.gl-action-card { background:#f7fff7; border-left:5px solid #2E8B57; border-radius:10px; padding:18px 15px;
+                  box-shadow:0 1px 5px rgba(0,0,0,0.05); min-height:180px; }
+.gl-action-title { font-size:17px; font-weight:600; color:#1b4332; margin-bottom:6px; }
+.gl-action-body { font-size:15px; color:#2d6a4f; line-height:1.5; }
+.gl-tip { color:#495057; font-size:13px; margin-top:10px; }
+
+/* Match My Skills */
+.gl-role-card { background:#ffffff; border:1px solid #d8f3dc; border-radius:12px; padding:14px; margin:10px 0;
+                box-shadow:1px 2px 5px rgba(0,0,0,0.05); }
+.gl-role-card .gl-role-head { display:flex; justify-content:space-between; }
+.gl-role-card h4 { color:#2E8B57; }
+.gl-role-card .gl-role-stage { color:#4f6d54; font-size:13px; }
+.gl-role-card p { font-size:14px; color:#333333; margin-top:5px; }
+.gl-role-card p.gl-role-sdg { color:#2E8B57; font-size:13px; margin-top:6px; }
+.gl-skill { --gl-skill-color:#b7e4c7; background:#f8fff9; border-left:6px solid var(--gl-skill-color);
+            border-radius:10px; padding:10px 15px; margin-bottom:10px; }
+.gl-skill-have { --gl-skill-color:#2E8B57; }
+.gl-skill h5, .gl-skill h6 { color:var(--gl-skill-color); margin-bottom:4px; }
+.gl-skill p { margin:0; color:gray; }
+.gl-skill p.gl-skill-match { color:#444; }
+.gl-skill-bar { height:8px; background:var(--gl-skill-color); border-radius:4px; margin:6px 0; }
+.gl-skill-compact { margin-bottom:8px; }
+.gl-skill-compact .gl-skill-bar { height:6px; margin:4px 0; }
+
+/* Green Coach Chat */
+.gl-coach { background:#f8f9fa; border:2px solid #d8f3dc; border-radius:15px; padding:15px;
+            box-shadow:0 3px 8px rgba(0,0,0,0.08); text-align:center; transition:0.3s; }
+.gl-coach-selected { background:#d8f3dc; border-color:#2d6a4f; }
+.gl-coach h4 { margin-bottom:6px; }
+.gl-coach p { font-size:13px; color:#444; }
+.gl-bubble { padding:10px; border-radius:15px; }
+.gl-bubble-user { text-align:right; background:#d8f3dc; margin:8px 0 8px 40px; }
+.gl-bubble-coach { text-align:left; background:#f1f1f1; padding:12px; margin:8px 40px 8px 0; }
+
+/* 30/60/90 Path */
+.gl-phase { background:#f8fcf9; border-radius:15px; padding:20px; margin-top:15px;
+            box-shadow:0 3px 8px rgba(46,139,87,0.15); border-left:5px solid #2E8B57; }
+.gl-next-step { background:linear-gradient(120deg,#e8f7ef,#dff9e3); padding:25px; border-radius:18px;
+                box-shadow:0 5px 15px rgba(46,139,87,0.25); }
+.gl-next-step-combined { background:linear-gradient(135deg,#d8f3dc,#e6f4ea); padding:30px; border-radius:20px;
+                         box-shadow:0 6px 14px rgba(46,139,87,0.25); }
+"""
+
+
+def minify(css):
+    """Drop comments and the whitespace around CSS punctuation."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return re.sub(r"\s+", " ", css).strip()
+
+
+# 导入时压缩一次，每次运行发送的就是这份
+STYLESHEET = f"<style>{minify(RULES)}</style>"
+
+
+def inject():
+    """Send the stylesheet for this run (style-only, so it takes no space on the page)."""
+    st.html(STYLESHEET)